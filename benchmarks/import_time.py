@@ -0,0 +1,155 @@
+# benchmarks/import_time.py
+#
+# Cold-import benchmark: every module is imported in a fresh interpreter
+# (empty temp cwd), so nothing is cached and side effects are visible.
+#
+#   python -m benchmarks.import_time            # check against budgets
+#   python -m benchmarks.import_time --update   # rewrite the baseline
+
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "import_baseline.json")
+
+# module → (budget seconds, heavy modules it must NOT pull in)
+TARGETS = {
+    "src.decision_engine": (0.15, ["numpy", "pandas"]),
+    "src.risk_management": (0.15, ["numpy", "pandas"]),
+    "src.logger": (0.15, ["numpy", "pandas"]),
+    "src.data_adapter": (0.40, ["pandas"]),
+    "src.services.decision_service": (0.40, ["pandas", "matplotlib", "yfinance"]),
+    "src.smartswing": (0.60, ["pandas", "matplotlib", "yfinance"]),
+    "src.fetch_prices": (1.00, ["yfinance"]),
+}
+
+# a regression = slower than baseline by this factor AND this many seconds
+SLOWDOWN_FACTOR = 1.5
+SLOWDOWN_MIN_S = 0.05
+
+_PROBE = """
+import sys, time, json
+t = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+# -------------------------------------------------
+# MEASURE
+# -------------------------------------------------
+def measure(module, repeat=5):
+    """
+    Best-of-N cold import in a fresh interpreter.
+    Returns {"seconds", "heavy", "stdout", "created"}.
+    """
+    best = None
+    env = dict(os.environ, PYTHONPATH=ROOT)
+
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as cwd:
+            proc = subprocess.run(
+                [sys.executable, "-c", _PROBE.format(module=module)],
+                cwd=cwd, env=env, capture_output=True, text=True,
+            )
+            created = sorted(os.listdir(cwd))
+
+        if proc.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{proc.stderr}")
+
+        *printed, last = proc.stdout.strip().splitlines()
+        probe = json.loads(last)
+
+        run = {
+            "seconds": probe["seconds"],
+            "modules": probe["modules"],
+            "stdout": "\n".join(printed),
+            "created": created,
+        }
+        if best is None or run["seconds"] < best["seconds"]:
+            best = run
+
+    return best
+
+
+def run_benchmark(repeat=5):
+    results = {}
+    for module, (budget, forbidden) in TARGETS.items():
+        run = measure(module, repeat)
+        loaded = set(run["modules"])
+        results[module] = {
+            "seconds": round(run["seconds"], 4),
+            "budget": budget,
+            "heavy": [m for m in forbidden if m in loaded],
+            "stdout": run["stdout"],
+            "created": run["created"],
+        }
+    return results
+
+
+# -------------------------------------------------
+# CHECK
+# -------------------------------------------------
+def check(results, baseline):
+    """
+    List of human-readable failures (empty = pass).
+    """
+    failures = []
+    for module, r in results.items():
+        if r["seconds"] > r["budget"]:
+            failures.append(f"{module}: {r['seconds']:.3f}s > budget {r['budget']:.2f}s")
+        if r["heavy"]:
+            failures.append(f"{module}: imports {', '.join(r['heavy'])} eagerly")
+        if r["stdout"]:
+            failures.append(f"{module}: prints on import: {r['stdout'][:60]!r}")
+        if r["created"]:
+            failures.append(f"{module}: creates {r['created']} on import")
+
+        base = baseline.get(module)
+        if base is not None:
+            slower = r["seconds"] - base
+            if r["seconds"] > base * SLOWDOWN_FACTOR and slower > SLOWDOWN_MIN_S:
+                failures.append(f"{module}: {r['seconds']:.3f}s vs baseline {base:.3f}s")
+    return failures
+
+
+def load_baseline():
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH, "r") as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold import-time benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--update", action="store_true",
+                        help="store the current timings as the new baseline")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.repeat)
+
+    print(f"{'MODULE':34} {'SECONDS':>8} {'BUDGET':>7}")
+    for module, r in results.items():
+        print(f"{module:34} {r['seconds']:8.3f} {r['budget']:7.2f}")
+
+    if args.update:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump({m: r["seconds"] for m, r in results.items()}, f, indent=2)
+            f.write("\n")
+        print(f"\n✅ Baseline written: {BASELINE_PATH}")
+        sys.exit(0)
+
+    failures = check(results, load_baseline())
+    if failures:
+        print("\n❌ IMPORT-TIME REGRESSIONS")
+        for line in failures:
+            print("-", line)
+        sys.exit(1)
+
+    print("\n✅ Import times within budget")
@@ -0,0 +1,344 @@
+# benchmarks/suite.py
+#
+# Throughput benchmarks on synthetic yfinance-format universes.
+#
+#   python -m benchmarks.suite --symbols 1000 --years 5
+#   python -m benchmarks.suite --preset large --cases adapter,ranker
+#   python -m benchmarks.suite --preset small --symbols 20   # preset, but 20 symbols
+#   python -m benchmarks.suite --save-baseline       # remember this run
+#   python -m benchmarks.suite --fail-over 20        # exit 1 if >20% slower
+#
+# Every case runs in a fresh interpreter, so caches start cold and the
+# reported peak RSS belongs to that case alone.
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import resource
+import subprocess
+import contextlib
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+WORK_DIR = os.path.join(os.path.dirname(__file__), ".data")
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+BASELINE_PATH = os.path.join(RESULTS_DIR, "baseline.json")
+
+PRESETS = {
+    "small": (100, 2),
+    "medium": (1000, 5),
+    "large": (10000, 20),
+}
+
+BARS_PER_YEAR = 252
+SEED = 7
+
+
+# -------------------------------------------------
+# SYNTHETIC UNIVERSE
+# -------------------------------------------------
+def universe_dir(symbols, years):
+    return os.path.join(WORK_DIR, f"u{symbols}x{years}y_s{SEED}")
+
+
+def generate_universe(symbols, years, end_date="2026-01-30"):
+    """
+    <dir>/data/SYN<i>_NS.csv + <dir>/stocks_list.csv, yfinance layout.
+    Reused when it already exists (generation dominates otherwise).
+    """
+    import numpy as np
+    import pandas as pd
+    from src.fetchers.runner import write_price_csv
+
+    root = universe_dir(symbols, years)
+    data_dir = os.path.join(root, "data")
+    done = os.path.join(root, ".complete")
+    if os.path.exists(done):
+        return root
+
+    os.makedirs(data_dir, exist_ok=True)
+    n = years * BARS_PER_YEAR
+    dates = pd.bdate_range(end=end_date, periods=n, name="Date")
+    names = [f"SYN{i:05d}" for i in range(symbols)]
+
+    for i, name in enumerate(names):
+        rng = np.random.default_rng([SEED, i])
+        drift = rng.normal(0.0003, 0.0004)
+        close = 50 + 450 * rng.random()
+        close = close * np.exp(np.cumsum(rng.normal(drift, 0.017, n)))
+        spread = rng.uniform(0.002, 0.025, n)
+        frame = pd.DataFrame({
+            "Close": close,
+            "High": close * (1 + spread),
+            "Low": close * (1 - spread),
+            "Open": close * (1 + rng.uniform(-0.01, 0.01, n)),
+            "Volume": rng.integers(50_000, 8_000_000, n),
+        }, index=dates)
+        write_price_csv(frame, f"{name}.NS", os.path.join(data_dir, f"{name}_NS.csv"))
+
+    pd.DataFrame({"symbol": [f"{s}.NS" for s in names]}).to_csv(
+        os.path.join(root, "stocks_list.csv"), index=False
+    )
+    open(done, "w").close()
+    return root
+
+
+# -------------------------------------------------
+# CASES (run inside the universe directory)
+# -------------------------------------------------
+def _symbols():
+    return sorted(f[:-len("_NS.csv")] for f in os.listdir("data") if f.endswith("_NS.csv"))
+
+
+def case_adapter(ctx):
+    from src.config import CONFIG
+    from src.data_adapter import load_stock_from_csv
+
+    CONFIG["INDICATOR_DISK_CACHE"] = False      # measure parse + indicators
+    symbols = _symbols()
+
+    t0 = time.perf_counter()
+    for s in symbols:
+        load_stock_from_csv(f"data/{s}_NS.csv")
+    return time.perf_counter() - t0, len(symbols), len(symbols) * ctx["bars"]
+
+
+def _snapshots(symbols):
+    from src.data_adapter import load_stock_from_csv
+    return [load_stock_from_csv(f"data/{s}_NS.csv") for s in symbols]
+
+
+def case_decision(ctx):
+    from src.services.decision_service import get_trade_decision
+
+    snapshots = _snapshots(_symbols())
+    rounds = max(1, 50_000 // len(snapshots))
+
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for snap in snapshots:
+            get_trade_decision(snap)
+    return time.perf_counter() - t0, rounds * len(snapshots), None
+
+
+def case_risk(ctx):
+    from src.risk_management import calculate_trade
+
+    closes = [s["close"] for s in _snapshots(_symbols())]
+    rounds = max(1, 200_000 // len(closes))
+
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for c in closes:
+            calculate_trade(entry=c)
+    return time.perf_counter() - t0, rounds * len(closes), None
+
+
+def case_backtest(ctx):
+    from src.config import CONFIG
+    from src.backtest import run_backtest
+
+    CONFIG["INDICATOR_DISK_CACHE"] = False
+    symbols = _symbols()
+
+    t0 = time.perf_counter()
+    for s in symbols:
+        run_backtest(f"{s}_NS.csv")
+    return time.perf_counter() - t0, len(symbols), len(symbols) * ctx["bars"]
+
+
+def case_ranker(ctx):
+    from src.config import CONFIG
+    from src.stock_ranker import rank_stocks
+
+    CONFIG["INDICATOR_DISK_CACHE"] = False
+    symbols = _symbols()
+
+    t0 = time.perf_counter()
+    rank_stocks("data")
+    return time.perf_counter() - t0, len(symbols), len(symbols) * ctx["bars"]
+
+
+def case_smartswing(ctx):
+    from src.config import CONFIG
+    from src import smartswing
+
+    CONFIG["INDICATOR_DISK_CACHE"] = False
+    symbols = _symbols()
+
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        t0 = time.perf_counter()
+        smartswing.run_smartswing(workers=ctx["workers"])
+        elapsed = time.perf_counter() - t0
+    return elapsed, len(symbols), len(symbols) * ctx["bars"]
+
+
+CASES = {
+    "adapter": case_adapter,
+    "decision": case_decision,
+    "risk": case_risk,
+    "backtest": case_backtest,
+    "ranker": case_ranker,
+    "smartswing": case_smartswing,
+}
+
+
+# -------------------------------------------------
+# RUNNER
+# -------------------------------------------------
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_case_here(name, ctx):
+    os.chdir(ctx["root"])
+    seconds, items, bars = CASES[name](ctx)
+    return {
+        "seconds": round(seconds, 4),
+        "items": items,
+        "items_per_s": round(items / seconds, 1) if seconds else None,
+        "bars_per_s": round(bars / seconds, 1) if bars and seconds else None,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def run_case(name, ctx):
+    """
+    One case in a fresh interpreter (cold caches, isolated peak RSS).
+    """
+    proc = subprocess.run(
+        [sys.executable, "-m", "benchmarks.suite", "--_case", name,
+         "--_ctx", json.dumps(ctx)],
+        cwd=ROOT, env=dict(os.environ, PYTHONPATH=ROOT),
+        capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"case {name} failed:\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def run_suite(symbols, years, cases, workers=1):
+    t0 = time.perf_counter()
+    root = generate_universe(symbols, years)
+    generated = time.perf_counter() - t0
+
+    ctx = {"root": root, "bars": years * BARS_PER_YEAR, "workers": workers}
+    results = {name: run_case(name, ctx) for name in cases}
+
+    return {
+        "config": {"symbols": symbols, "years": years, "bars": ctx["bars"],
+                   "workers": workers},
+        "machine": {"python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "cpus": os.cpu_count()},
+        "generate_s": round(generated, 2),
+        "results": results,
+    }
+
+
+# -------------------------------------------------
+# BASELINE
+# -------------------------------------------------
+def _key(config):
+    return f"{config['symbols']}x{config['years']}y_w{config['workers']}"
+
+
+def load_baseline():
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH, "r") as f:
+        return json.load(f)
+
+
+def save_baseline(report):
+    baseline = load_baseline()
+    baseline[_key(report["config"])] = report
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    with open(BASELINE_PATH, "w") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+
+
+def compare(report, baseline):
+    """
+    {case: % change in seconds vs baseline} for cases present in both.
+    """
+    base = baseline.get(_key(report["config"]))
+    if not base:
+        return {}
+    out = {}
+    for name, r in report["results"].items():
+        old = base["results"].get(name)
+        if old and old["seconds"]:
+            out[name] = round((r["seconds"] - old["seconds"]) / old["seconds"] * 100, 1)
+    return out
+
+
+def print_report(report, deltas):
+    cfg = report["config"]
+    print(f"\n📊 BENCHMARK — {cfg['symbols']} symbols × {cfg['years']}y "
+          f"({cfg['bars']} bars each), workers={cfg['workers']}")
+    print(f"   universe ready in {report['generate_s']}s\n")
+    print(f"{'CASE':12} {'SECONDS':>9} {'ITEMS/S':>12} {'BARS/S':>14} {'PEAK RSS':>10} {'VS BASE':>8}")
+    for name, r in report["results"].items():
+        bars = f"{r['bars_per_s']:,.0f}" if r["bars_per_s"] else "-"
+        delta = f"{deltas[name]:+.1f}%" if name in deltas else "-"
+        print(f"{name:12} {r['seconds']:9.3f} {r['items_per_s']:12,.0f} {bars:>14} "
+              f"{r['peak_rss_mb']:8.1f}MB {delta:>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SmartSwing benchmark suite")
+    parser.add_argument("--preset", choices=sorted(PRESETS))
+    parser.add_argument("--symbols", type=int, default=None,
+                        help="universe size (default 200, or the preset's; overrides --preset)")
+    parser.add_argument("--years", type=int, default=None,
+                        help="history length (default 2, or the preset's; overrides --preset)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="workers for the smartswing case")
+    parser.add_argument("--cases", default=",".join(CASES),
+                        help=f"comma-separated subset of {','.join(CASES)}")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--fail-over", type=float, default=None,
+                        help="exit 1 if any case is this many %% slower than baseline")
+    parser.add_argument("--json", help="also write the report to this path")
+    parser.add_argument("--_case", help=argparse.SUPPRESS)
+    parser.add_argument("--_ctx", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args._case:
+        print(json.dumps(_run_case_here(args._case, json.loads(args._ctx))))
+        sys.exit(0)
+
+    # explicit --symbols / --years win over the preset
+    symbols, years = PRESETS[args.preset] if args.preset else (200, 2)
+    symbols = args.symbols if args.symbols is not None else symbols
+    years = args.years if args.years is not None else years
+    cases = [c.strip() for c in args.cases.split(",") if c.strip()]
+    unknown = [c for c in cases if c not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+
+    report = run_suite(symbols, years, cases, workers=args.workers)
+    deltas = compare(report, load_baseline())
+    print_report(report, deltas)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        save_baseline(report)
+        print(f"\n✅ Baseline saved: {BASELINE_PATH}")
+
+    if args.fail_over is not None:
+        slower = {k: v for k, v in deltas.items() if v > args.fail_over}
+        if slower:
+            print("\n❌ REGRESSIONS")
+            for name, pct in slower.items():
+                print(f"- {name}: {pct:+.1f}%")
+            sys.exit(1)
@@ -0,0 +1,16 @@
+# src/backtest/__init__.py
+
+from src.backtest.engine import backtest_file
+from src.backtest.runner import BacktestRunner, load_universe
+
+
+def run_backtest(file_name):
+    """
+    Backtests ONE stock with the active CONFIG style.
+    Signals are precomputed as NumPy masks and exits resolved by a
+    first-hit search (src.backtest.engine) instead of a per-bar loop.
+    """
+    return backtest_file(file_name)
+
+
+__all__ = ["BacktestRunner", "backtest_file", "load_universe", "run_backtest"]
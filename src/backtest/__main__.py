@@ -0,0 +1,60 @@
+# src/backtest/__main__.py
+# python -m src.backtest [--symbols INFY,TCS] [--start 2025-06-01] [--style NORMAL] [--workers 4]
+
+import argparse
+import os
+
+import pandas as pd
+
+from src.backtest.runner import BacktestRunner, load_universe, STOCK_LIST_PATH
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="SmartSwing multi-stock backtest")
+    parser.add_argument("--universe", default=STOCK_LIST_PATH,
+                        help="stock list CSV (column: symbol)")
+    parser.add_argument("--symbols", default=None,
+                        help="comma list, overrides --universe")
+    parser.add_argument("--start", default=None, help="YYYY-MM-DD (inclusive)")
+    parser.add_argument("--end", default=None, help="YYYY-MM-DD (inclusive)")
+    parser.add_argument("--style", default=None,
+                        help="CONSERVATIVE / NORMAL / AGGRESSIVE (default: config)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+
+    if args.symbols:
+        symbols = [s.strip().replace(".NS", "") for s in args.symbols.split(",")]
+    else:
+        symbols = load_universe(args.universe)
+
+    runner = BacktestRunner(
+        style=args.style, start=args.start, end=args.end, workers=args.workers
+    )
+    results = runner.run(symbols)
+
+    for symbol, error in runner.errors.items():
+        print(f"⚠️ Error in {symbol}: {error}")
+
+    print("\n📊 MULTI-STOCK BACKTEST SUMMARY")
+    print("-" * 50)
+
+    if results:
+        df = pd.DataFrame(results)
+        print(df[["stock", "trades", "win_rate", "net_pnl"]].to_string())
+
+    total = runner.summary(results)
+
+    print("\n📈 OVERALL PERFORMANCE")
+    print("-" * 50)
+    print(f"Total Trades : {total['trades']}")
+    print(f"Net P&L ₹    : {total['net_pnl']:.2f}")
+    print(f"Avg Win Rate : {total['avg_win_rate']:.2f}%")
+    print(f"Style        : {total['style']}")
+
+
+if __name__ == "__main__":
+    main()
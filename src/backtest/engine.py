@@ -0,0 +1,229 @@
+# src/backtest/engine.py
+
+import os
+import numpy as np
+
+from src.config import CONFIG
+from src.indicators import get_indicator_frame
+
+# first-hit search scans forward in growing blocks instead of
+# slicing to the end of history for every open trade
+_FIRST_BLOCK = 32
+
+
+# -------------------------------------------------
+# DATA + INDICATORS (shared src.indicators frame)
+# -------------------------------------------------
+def prepare_arrays(file_path):
+    """
+    Loads one CSV and returns NumPy arrays of the bars the backtest walks:
+    date, high, low, close, dma_20, dma_50, rsi.
+    """
+    df = get_indicator_frame(file_path, ("DMA_20", "DMA_50", "RSI"))
+    df = df.dropna().reset_index(drop=True)
+
+    return {
+        "date": df["Date"].to_numpy(dtype="datetime64[D]"),
+        "high": df["High"].to_numpy(dtype="float64"),
+        "low": df["Low"].to_numpy(dtype="float64"),
+        "close": df["Close"].to_numpy(dtype="float64"),
+        "dma_20": df["DMA_20"].to_numpy(dtype="float64"),
+        "dma_50": df["DMA_50"].to_numpy(dtype="float64"),
+        "rsi": df["RSI"].to_numpy(dtype="float64"),
+    }
+
+
+def slice_arrays(arrays, start=None, end=None):
+    """
+    Restricts the walked bars to [start, end] (ISO dates, inclusive).
+    Indicators keep their warm-up from the bars before `start`.
+    """
+    dates = arrays["date"]
+    lo = 0 if start is None else int(np.searchsorted(dates, np.datetime64(start, "D")))
+    hi = len(dates) if end is None else int(
+        np.searchsorted(dates, np.datetime64(end, "D"), side="right")
+    )
+    return {k: v[lo:hi] for k, v in arrays.items()}
+
+
+# -------------------------------------------------
+# SIGNALS
+# -------------------------------------------------
+def stop_levels(arrays, stop_rule="DMA_50"):
+    """
+    Per-bar stop price for a given rule:
+    - "DMA_50" / "DMA_20" → that moving average (legacy = DMA_50)
+    - float (e.g. 0.02)   → fixed % below the entry close
+    """
+    if stop_rule == "DMA_50":
+        return arrays["dma_50"]
+    if stop_rule == "DMA_20":
+        return arrays["dma_20"]
+    if isinstance(stop_rule, (int, float)) and 0 < stop_rule < 1:
+        return arrays["close"] * (1 - stop_rule)
+    raise ValueError(f"Unknown stop rule: {stop_rule}")
+
+
+def entry_signals(arrays, rsi_band, capital, risk_percent, stop=None):
+    """
+    Boolean mask of bars where a flat book would open a trade,
+    plus the per-bar qty. Default stop = DMA_50, so risk = close - DMA_50.
+    """
+    rsi_low, rsi_high = rsi_band
+    close = arrays["close"]
+    dma_20 = arrays["dma_20"]
+    dma_50 = arrays["dma_50"]
+    rsi = arrays["rsi"]
+
+    if stop is None:
+        stop = dma_50
+
+    bullish = (close > dma_20) & (dma_20 > dma_50)
+    rsi_ok = (rsi_low <= rsi) & (rsi <= rsi_high)
+
+    risk = close - stop
+    with np.errstate(divide="ignore", invalid="ignore"):
+        qty = np.where(risk > 0, np.floor((capital * risk_percent) / risk), 0)
+
+    mask = bullish & rsi_ok & (risk > 0) & (qty > 0)
+    mask[:1] = False            # legacy loop starts at bar 1
+
+    return mask, qty.astype("int64")
+
+
+def _first_hit(low, high, start, stop, target):
+    """
+    First bar >= start where low <= stop or high >= target.
+    Returns (index, hit_stop) or (None, None) if the trade never closes.
+    Stop wins when both are hit on the same bar (legacy ordering).
+    """
+    n = len(low)
+    block = _FIRST_BLOCK
+
+    while start < n:
+        end = min(n, start + block)
+        hit_stop = low[start:end] <= stop
+        hit_any = hit_stop | (high[start:end] >= target)
+
+        if hit_any.any():
+            k = int(hit_any.argmax())
+            return start + k, bool(hit_stop[k])
+
+        start = end
+        block *= 2
+
+    return None, None
+
+
+# -------------------------------------------------
+# SIMULATION
+# -------------------------------------------------
+def simulate(arrays, rsi_band, rr, capital, risk_percent, stop_rule="DMA_50"):
+    """
+    Event-driven walk: jump to the next entry signal, resolve its exit
+    with a first-hit search, repeat from the bar after the exit.
+    Returns the closed-trade list (open trade at the end is dropped).
+    """
+    stop_arr = stop_levels(arrays, stop_rule)
+    mask, qty_arr = entry_signals(
+        arrays, rsi_band, capital, risk_percent, stop=stop_arr
+    )
+    entries = np.flatnonzero(mask)
+
+    close = arrays["close"]
+    low = arrays["low"]
+    high = arrays["high"]
+    dates = arrays["date"]
+
+    trades = []
+    pos = 0
+
+    while pos < len(entries):
+        i = int(entries[pos])
+
+        entry = close[i]
+        stop = stop_arr[i]
+        risk_per_share = entry - stop
+        qty = int(qty_arr[i])
+        target = entry + (risk_per_share * rr)
+
+        j, hit_stop = _first_hit(low, high, i + 1, stop, target)
+        if j is None:
+            break
+
+        exit_price = stop if hit_stop else target
+
+        trades.append({
+            "entry_date": str(dates[i]),
+            "exit_date": str(dates[j]),
+            "entry": float(entry),
+            "stop": float(stop),
+            "target": float(target),
+            "qty": qty,
+            "exit": float(exit_price),
+            "outcome": "STOP" if hit_stop else "TARGET",
+            "pnl": float((exit_price - entry) * qty),
+        })
+
+        # exit bar is consumed → next entry strictly after it
+        pos = int(np.searchsorted(entries, j + 1))
+
+    return trades
+
+
+def summarize(stock, trades):
+    """
+    Same summary fields as backtest.run_backtest.
+    """
+    pnls = [t["pnl"] for t in trades]
+
+    total_trades = len(pnls)
+    wins = len([p for p in pnls if p > 0])
+    losses = len([p for p in pnls if p <= 0])
+    win_rate = (wins / total_trades * 100) if total_trades else 0
+    net_pnl = sum(pnls)
+    avg_win = sum(p for p in pnls if p > 0) / wins if wins else 0
+    avg_loss = sum(p for p in pnls if p <= 0) / losses if losses else 0
+
+    return {
+        "stock": stock,
+        "trades": total_trades,
+        "wins": wins,
+        "losses": losses,
+        "win_rate": win_rate,
+        "net_pnl": net_pnl,
+        "avg_win": avg_win,
+        "avg_loss": avg_loss
+    }
+
+
+def backtest_arrays(stock, arrays, style=None, with_trades=False):
+    """
+    Runs the active (or given) style over prepared arrays.
+    """
+    style = style or CONFIG["STYLE"]
+
+    trades = simulate(
+        arrays,
+        rsi_band=CONFIG["RSI_BANDS"][style],
+        rr=CONFIG["RR"][style],
+        capital=CONFIG["CAPITAL"],
+        risk_percent=CONFIG["RISK_PERCENT"],
+    )
+
+    result = summarize(stock, trades)
+    if with_trades:
+        result["trade_list"] = trades
+    return result
+
+
+def backtest_file(file_name, data_dir="data", style=None, with_trades=False):
+    """
+    Vectorized drop-in for the old per-bar run_backtest(file_name).
+    with_trades=True adds the full "trade_list".
+    """
+    arrays = prepare_arrays(os.path.join(data_dir, file_name))
+    return backtest_arrays(
+        file_name.replace("_NS.csv", ""), arrays,
+        style=style, with_trades=with_trades,
+    )
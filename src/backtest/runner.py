@@ -0,0 +1,116 @@
+# src/backtest/runner.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from src.config import CONFIG
+from src.backtest.engine import prepare_arrays, slice_arrays, backtest_arrays
+
+DATA_DIR = "data"
+STOCK_LIST_PATH = "stocks_list.csv"
+
+
+# -------------------------------------------------
+# UNIVERSE
+# -------------------------------------------------
+def load_universe(stock_list_path=STOCK_LIST_PATH):
+    """
+    stocks_list.csv (`RELIANCE.NS`) → symbols (`RELIANCE`).
+    """
+    if not os.path.exists(stock_list_path):
+        raise FileNotFoundError(f"{stock_list_path} not found")
+
+    df = pd.read_csv(stock_list_path)
+    return (
+        df["symbol"]
+        .astype(str)
+        .str.replace(".NS", "", regex=False)
+        .tolist()
+    )
+
+
+# -------------------------------------------------
+# WORKER
+# -------------------------------------------------
+def _backtest_symbol(args):
+    symbol, data_dir, style, start, end, with_trades = args
+    try:
+        arrays = prepare_arrays(os.path.join(data_dir, f"{symbol}_NS.csv"))
+        arrays = slice_arrays(arrays, start, end)
+        return backtest_arrays(symbol, arrays, style=style, with_trades=with_trades), None
+    except Exception as e:
+        return None, (symbol, str(e))
+
+
+# -------------------------------------------------
+# PROGRAMMATIC API
+# -------------------------------------------------
+class BacktestRunner:
+    """
+    In-process backtest entry point (scheduler / dashboard / CLI).
+    Importing this module has no side effects; nothing is read until run().
+
+        runner = BacktestRunner(style="NORMAL", start="2025-06-01", workers=4)
+        results = runner.run(["INFY", "TCS"])
+        print(runner.summary(results))
+    """
+
+    def __init__(self, style=None, start=None, end=None, workers=1,
+                 data_dir=DATA_DIR, with_trades=False):
+        self.style = (style or CONFIG["STYLE"]).upper()
+        self.start = start
+        self.end = end
+        self.workers = workers
+        self.data_dir = data_dir
+        self.with_trades = with_trades
+        self.errors = {}
+
+        if self.style not in CONFIG["RSI_BANDS"]:
+            raise ValueError(f"STYLE must be one of {list(CONFIG['RSI_BANDS'])}")
+
+    def run(self, symbols=None):
+        """
+        Backtests `symbols` (default: stocks_list.csv universe).
+        Returns per-stock summary dicts in universe order;
+        failures are collected in self.errors.
+        """
+        if symbols is None:
+            symbols = load_universe()
+
+        tasks = [
+            (s, self.data_dir, self.style, self.start, self.end, self.with_trades)
+            for s in symbols
+        ]
+
+        if self.workers <= 1:
+            outputs = list(map(_backtest_symbol, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                outputs = list(pool.map(_backtest_symbol, tasks))
+
+        results = []
+        self.errors = {}
+        for result, error in outputs:
+            if error:
+                self.errors[error[0]] = error[1]
+            else:
+                results.append(result)
+        return results
+
+    def summary(self, results):
+        """
+        Universe-level totals (same figures the old script printed).
+        """
+        trades = sum(r["trades"] for r in results)
+        return {
+            "stocks": len(results),
+            "trades": trades,
+            "net_pnl": sum(r["net_pnl"] for r in results),
+            "avg_win_rate": (
+                sum(r["win_rate"] for r in results) / len(results)
+                if results else 0
+            ),
+            "style": self.style,
+        }
@@ -0,0 +1,196 @@
+# src/backtest/sweep.py
+
+import os
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from src.config import CONFIG
+from src.backtest.engine import prepare_arrays, simulate
+
+DATA_DIR = "data"
+
+
+# -------------------------------------------------
+# PARAMETER GRID
+# -------------------------------------------------
+def param_grid(rsi_lows, rsi_highs, rrs, stop_rules=("DMA_50",), risk_percents=None):
+    """
+    Cartesian product of sweep ranges → list of param dicts.
+    Bands with low >= high are skipped (validator would reject them).
+    """
+    if risk_percents is None:
+        risk_percents = (CONFIG["RISK_PERCENT"],)
+
+    grid = []
+    for low, high, rr, stop_rule, risk in itertools.product(
+        rsi_lows, rsi_highs, rrs, stop_rules, risk_percents
+    ):
+        if low >= high:
+            continue
+        grid.append({
+            "rsi_low": low,
+            "rsi_high": high,
+            "rr": rr,
+            "stop_rule": stop_rule,
+            "risk_percent": risk,
+        })
+    return grid
+
+
+# -------------------------------------------------
+# WORKER: ONE SYMBOL × EVERY COMBINATION
+# -------------------------------------------------
+def _sweep_symbol(args):
+    """
+    Indicators are computed ONCE for the symbol, then every
+    combination is evaluated against the same arrays.
+    """
+    file_name, data_dir, grid, capital = args
+
+    try:
+        arrays = prepare_arrays(os.path.join(data_dir, file_name))
+    except Exception as e:
+        return file_name, None, str(e)
+
+    rows = []
+    for combo_id, p in enumerate(grid):
+        trades = simulate(
+            arrays,
+            rsi_band=(p["rsi_low"], p["rsi_high"]),
+            rr=p["rr"],
+            capital=capital,
+            risk_percent=p["risk_percent"],
+            stop_rule=p["stop_rule"],
+        )
+        pnls = [t["pnl"] for t in trades]
+        rows.append((
+            combo_id,
+            len(pnls),
+            len([x for x in pnls if x > 0]),
+            sum(pnls),
+        ))
+
+    return file_name, rows, None
+
+
+# -------------------------------------------------
+# SWEEP
+# -------------------------------------------------
+def run_sweep(file_names, grid, data_dir=DATA_DIR, workers=1, capital=None):
+    """
+    Evaluates every grid combination on every file.
+    Returns (results DataFrame — one row per combination, ranked by
+    net P&L then win rate; errors {file: message}).
+    """
+    if capital is None:
+        capital = CONFIG["CAPITAL"]
+
+    tasks = [(f, data_dir, grid, capital) for f in file_names]
+
+    if workers <= 1:
+        outputs = map(_sweep_symbol, tasks)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        outputs = pool.map(_sweep_symbol, tasks)
+
+    totals = [[0, 0, 0.0] for _ in grid]      # trades, wins, net_pnl
+    errors = {}
+
+    try:
+        for file_name, rows, error in outputs:
+            if error:
+                errors[file_name] = error
+                continue
+            for combo_id, n_trades, n_wins, pnl in rows:
+                acc = totals[combo_id]
+                acc[0] += n_trades
+                acc[1] += n_wins
+                acc[2] += pnl
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    table = pd.DataFrame(grid)
+    table["trades"] = [t[0] for t in totals]
+    table["wins"] = [t[1] for t in totals]
+    table["win_rate"] = [
+        (t[1] / t[0] * 100) if t[0] else 0.0 for t in totals
+    ]
+    table["net_pnl"] = [t[2] for t in totals]
+
+    table = table.sort_values(
+        ["net_pnl", "win_rate"], ascending=False
+    ).reset_index(drop=True)
+
+    return table, errors
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+def _float_range(spec):
+    """
+    "30:45:5" → [30, 35, 40, 45]   |   "2.0,2.5" → [2.0, 2.5]
+    """
+    if ":" in spec:
+        start, stop, step = (float(x) for x in spec.split(":"))
+        values = []
+        v = start
+        while v <= stop + 1e-9:
+            values.append(round(v, 6))
+            v += step
+        return values
+    return [float(x) for x in spec.split(",")]
+
+
+def _stop_rules(spec):
+    rules = []
+    for item in spec.split(","):
+        item = item.strip().upper()
+        rules.append(item if item.startswith("DMA_") else float(item))
+    return rules
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="Backtest parameter sweep")
+    parser.add_argument("--rsi-low", default="30:45:5")
+    parser.add_argument("--rsi-high", default="55:70:5")
+    parser.add_argument("--rr", default="1.5:3.0:0.5")
+    parser.add_argument("--stop", default="DMA_50",
+                        help="comma list: DMA_50, DMA_20 or a %% like 0.02")
+    parser.add_argument("--risk", default=str(CONFIG["RISK_PERCENT"]))
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--out", default=None, help="write full table to CSV")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+
+    grid = param_grid(
+        _float_range(args.rsi_low),
+        _float_range(args.rsi_high),
+        _float_range(args.rr),
+        _stop_rules(args.stop),
+        _float_range(args.risk),
+    )
+    files = sorted(f for f in os.listdir(DATA_DIR) if f.endswith("_NS.csv"))
+
+    print(f"\n🧪 SWEEP: {len(grid)} combinations × {len(files)} stocks")
+    table, errors = run_sweep(files, grid, workers=args.workers)
+
+    for f, e in errors.items():
+        print(f"⚠️ Error in {f}: {e}")
+
+    print("\n🏆 TOP COMBINATIONS")
+    print("-" * 50)
+    print(table.head(args.top).to_string(index=False))
+
+    if args.out:
+        table.to_csv(args.out, index=False)
+        print(f"\n✅ Saved → {args.out}")
@@ -0,0 +1,188 @@
+# src/chart_cache.py
+
+import os
+import glob
+import hashlib
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+
+from src.indicators import get_indicator_frame, symbol_path, CORE
+
+# -------------------------------------------------
+# CONTENT-ADDRESSED PNG CACHE
+# -------------------------------------------------
+# reports/charts/<SYMBOL>.<sha1>.png
+# sha1 covers the CSV bytes + CHART_VERSION, so a chart is rendered once
+# per price-file version and the dashboard only ever reads bytes.
+CHART_DIR = os.path.join("reports", "charts")
+CHART_VERSION = 1
+
+FIGSIZE = (6.5, 3.5)
+DPI = 100
+
+
+def available():
+    """
+    True when matplotlib is installed (charts are optional).
+    """
+    return importlib.util.find_spec("matplotlib") is not None
+
+
+def chart_key(csv_path):
+    h = hashlib.sha1()
+    h.update(f"v{CHART_VERSION}|{FIGSIZE}|{DPI}|".encode())
+    with open(csv_path, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+
+def chart_path(symbol, data_dir="data", chart_dir=CHART_DIR):
+    """
+    Where the chart for the CURRENT version of a symbol's CSV lives
+    (None when the CSV is missing).
+    """
+    csv_path = symbol_path(symbol, data_dir)
+    try:
+        key = chart_key(csv_path)
+    except OSError:
+        return None
+    return os.path.join(chart_dir, f"{symbol}.{key}.png")
+
+
+def cached_chart(symbol, data_dir="data", chart_dir=CHART_DIR):
+    """
+    PNG bytes if this CSV version was already rendered, else None.
+    """
+    path = chart_path(symbol, data_dir, chart_dir)
+    if path is None or not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return f.read()
+
+
+# -------------------------------------------------
+# RENDER (worker process)
+# -------------------------------------------------
+def render_chart(symbol, data_dir="data", chart_dir=CHART_DIR):
+    """
+    Close / DMA_20 / DMA_50 → PNG. Returns the path.
+    Uses a bare Figure (no pyplot registry), so nothing outlives the call.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    path = chart_path(symbol, data_dir, chart_dir)
+    if path is None:
+        raise FileNotFoundError(symbol_path(symbol, data_dir))
+    if os.path.exists(path):
+        return path
+
+    df = get_indicator_frame(symbol_path(symbol, data_dir), CORE)
+    df = df[["Date", "Close", "DMA_20", "DMA_50"]].dropna()
+    if df.empty:
+        raise ValueError(f"{symbol}: not enough bars to chart")
+
+    fig = Figure(figsize=FIGSIZE, dpi=DPI)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.plot(df["Date"], df["Close"], label="Close", linewidth=2)
+    ax.plot(df["Date"], df["DMA_20"], label="20 DMA", linestyle="--")
+    ax.plot(df["Date"], df["DMA_50"], label="50 DMA", linestyle=":")
+    ax.set_title(
+        f"{symbol} — {df['Date'].iloc[0]:%Y-%m-%d} → {df['Date'].iloc[-1]:%Y-%m-%d} "
+        f"| Close ₹{float(df['Close'].iloc[-1]):.2f}",
+        fontsize=9,
+    )
+    ax.legend(fontsize=8)
+    ax.grid(alpha=0.3)
+    fig.autofmt_xdate()
+    fig.tight_layout()
+
+    os.makedirs(chart_dir, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    fig.savefig(tmp, format="png")
+    os.replace(tmp, path)
+
+    # older versions of this symbol's chart are dead weight
+    for old in glob.glob(os.path.join(glob.escape(chart_dir), f"{glob.escape(symbol)}.*.png")):
+        if old != path:
+            try:
+                os.remove(old)
+            except OSError:
+                pass        # another renderer got there first
+
+    return path
+
+
+def _render_safe(symbol, data_dir, chart_dir):
+    try:
+        return symbol, render_chart(symbol, data_dir, chart_dir), None
+    except Exception as e:
+        return symbol, None, str(e)
+
+
+# -------------------------------------------------
+# BACKGROUND POOL (scan time)
+# -------------------------------------------------
+class ChartRenderer:
+    """
+    Renders charts in a process pool while the scan keeps going.
+        renderer = ChartRenderer(workers=2)
+        renderer.submit("INFY")        # as each symbol is scanned
+        done = renderer.close()        # {"rendered", "cached", "failed"}
+    """
+
+    def __init__(self, workers=2, data_dir="data", chart_dir=CHART_DIR):
+        self.data_dir = data_dir
+        self.chart_dir = chart_dir
+        self.pool = ProcessPoolExecutor(max_workers=max(1, workers))
+        self.futures = []
+        self.cached = 0
+
+    def submit(self, symbol):
+        path = chart_path(symbol, self.data_dir, self.chart_dir)
+        if path is None:
+            return
+        if os.path.exists(path):
+            self.cached += 1
+            return
+        self.futures.append(
+            self.pool.submit(_render_safe, symbol, self.data_dir, self.chart_dir)
+        )
+
+    def close(self):
+        rendered, failed = [], {}
+        for future in self.futures:
+            symbol, path, error = future.result()
+            if error:
+                failed[symbol] = error
+            else:
+                rendered.append(path)
+        self.pool.shutdown()
+        return {"rendered": rendered, "cached": self.cached, "failed": failed}
+
+
+# -------------------------------------------------
+# CLI (backfill charts for the current data/)
+# -------------------------------------------------
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Pre-render price charts")
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    if not available():
+        print("❌ matplotlib is not installed")
+        raise SystemExit(1)
+
+    renderer = ChartRenderer(workers=args.workers, data_dir=args.data_dir)
+    for name in sorted(os.listdir(args.data_dir)):
+        if name.endswith("_NS.csv"):
+            renderer.submit(name[:-len("_NS.csv")])
+    done = renderer.close()
+
+    for symbol, error in done["failed"].items():
+        print(f"⚠️ {symbol}: {error}")
+    print(f"🖼️  Rendered: {len(done['rendered'])} | Cached: {done['cached']} | Failed: {len(done['failed'])}")
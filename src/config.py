@@ -6,7 +6,8 @@
 # Allowed values (case-insensitive input):
 # "CONSERVATIVE", "NORMAL", "AGGRESSIVE"
 
-DEBUG_ENGINE = True
+DEBUG_ENGINE = True              # per-symbol engine tracing (src.engine_log)
+DEBUG_SAMPLE_RATE = 1.0         # fraction of DEBUG lines kept (0.01 → 1 in 100)
 
 # 👇 user / env input (can be any case)
 RAW_STYLE = "NORMAL"
@@ -58,6 +59,52 @@ RISK_PERCENT = 0.01       # 1% risk per trade
 TOP_N = None
 
 
+# ==============================
+# 🗄️ INDICATOR CACHE (per process)
+# ==============================
+INDICATOR_CACHE_MB = 256
+INDICATOR_DISK_CACHE = True     # data/.cache/indicators (content-hashed)
+
+
+# ==============================
+# 📝 SCAN LOG FORMAT
+# ==============================
+# "jsonl"    → logs/scan_<id>.jsonl (one JSON line per decision)
+# "columnar" → logs/scan_<id>.npz   (typed columns, see src.scan_columnar)
+SCAN_LOG_FORMAT = "jsonl"
+
+# old scans → logs/archive/scans_<day|week>.jsonl.gz (src.log_retention)
+LOG_RETENTION = {
+    "KEEP_DAYS": 7,                 # raw scans newer than this stay as-is
+    "ARCHIVE_PERIOD": "daily",      # "daily" | "weekly"
+    "RETAIN_DAYS": 365,             # archives older than this are deleted
+    "MAX_MB": 500,                  # size cap for logs/ (oldest archives go first)
+}
+
+
+# ==============================
+# 🖼️ CHART THUMBNAILS (scan time)
+# ==============================
+# reports/charts/<SYMBOL>.<sha1>.png for these decisions (src.chart_cache);
+# () turns pre-rendering off. Needs matplotlib.
+CHART_DECISIONS = ("TRADE", "WAIT")
+CHART_WORKERS = 2
+
+
+# ==============================
+# ⏰ SCHEDULER (fetch → scan → report, src.scheduler)
+# ==============================
+SCHEDULER = {
+    "RUN_AT": "16:00",              # daily, local time (after NSE close)
+    "WEEKDAYS_ONLY": True,
+    "FETCH_CONCURRENCY": 4,         # in-flight provider calls
+    "FETCH_RATE": 2.0,              # provider calls per second
+    "SCAN_WORKERS": 2,              # scan processes
+    "QUEUE_SIZE": 64,               # max symbols waiting between two stages
+    "CHECKPOINT_EVERY": 25,         # reported symbols between checkpoint writes
+}
+
+
 # ==============================
 # 🧠 MASTER CONFIG OBJECT
 # ==============================
@@ -70,4 +117,12 @@ CONFIG = {
     "RISK_PERCENT": RISK_PERCENT,
     "TOP_N": TOP_N,
     "DEBUG_ENGINE": DEBUG_ENGINE,
+    "DEBUG_SAMPLE_RATE": DEBUG_SAMPLE_RATE,
+    "INDICATOR_CACHE_MB": INDICATOR_CACHE_MB,
+    "INDICATOR_DISK_CACHE": INDICATOR_DISK_CACHE,
+    "SCAN_LOG_FORMAT": SCAN_LOG_FORMAT,
+    "LOG_RETENTION": LOG_RETENTION,
+    "CHART_DECISIONS": CHART_DECISIONS,
+    "CHART_WORKERS": CHART_WORKERS,
+    "SCHEDULER": SCHEDULER,
 }
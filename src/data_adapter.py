@@ -1,15 +1,16 @@
-import pandas as pd
+import numpy as np
 import os
 import re
 
 MIN_ROWS_REQUIRED = 60
 
 
-def load_stock_from_csv(file_path):
+def load_price_frame(file_path):
     """
-    Stable adapter.
+    Reads + cleans ONE price CSV into Date/Open/High/Low/Close/Volume.
     Supports legacy CSVs where date is stored in `Price`.
     """
+    import pandas as pd  # CSV path only; store-backed scans never need it
 
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"CSV not found: {file_path}")
@@ -48,7 +49,20 @@ def load_stock_from_csv(file_path):
             raise ValueError(f"Missing required column: {col}")
         df[col] = pd.to_numeric(df[col], errors="coerce")
 
-    df = df.dropna(subset=numeric_cols).reset_index(drop=True)
+    return df.dropna(subset=numeric_cols).reset_index(drop=True)
+
+
+def load_stock_from_csv(file_path):
+    """
+    Stable adapter.
+    Supports legacy CSVs where date is stored in `Price`.
+    Frames come from the shared src.indicators cache.
+    """
+    from src.indicators import get_indicator_frame, CORE
+    from src.scan_metrics import stage
+
+    with stage("indicators"):
+        df = get_indicator_frame(file_path, CORE)
 
     if len(df) < MIN_ROWS_REQUIRED:
         raise ValueError(
@@ -58,22 +72,9 @@ def load_stock_from_csv(file_path):
     # -------------------------------------------------
     # INDICATORS
     # -------------------------------------------------
-    df["DMA_20"] = df["Close"].rolling(20).mean()
-    df["DMA_50"] = df["Close"].rolling(50).mean()
-
-    delta = df["Close"].diff()
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
-
-    avg_gain = gain.rolling(14).mean()
-    avg_loss = loss.rolling(14).mean().replace(0, pd.NA)
-
-    rs = avg_gain / avg_loss
-    df["RSI"] = 100 - (100 / (1 + rs))
-
-    df["AVG_VOL_20"] = df["Volume"].rolling(20).mean()
-
-    df = df.dropna().reset_index(drop=True)
+    # engine treats RSI as undefined when the average loss is zero
+    # (shared frame reports 100 there) → drop those bars like any NaN
+    df = df[df["RSI"] < 100].dropna().reset_index(drop=True)
 
     if df.empty:
         raise ValueError("Indicators could not be computed")
@@ -90,3 +91,66 @@ def load_stock_from_csv(file_path):
         "avg_volume": int(latest["AVG_VOL_20"]),
         "latest_date": str(latest["Date"].date()),
     }
+
+
+# -------------------------------------------------
+# COLUMNAR FAST PATH (src.price_store)
+# -------------------------------------------------
+def snapshot_from_arrays(symbol, dates, close, volume):
+    """
+    Same snapshot as load_stock_from_csv, computed from clean arrays.
+    Only the trailing windows are touched → O(1) in history length.
+    """
+    n = len(close)
+
+    if n < MIN_ROWS_REQUIRED:
+        raise ValueError(
+            f"Not enough data rows ({n}). Minimum required: {MIN_ROWS_REQUIRED}"
+        )
+
+    # walk back past bars where RSI is undefined (zero avg loss),
+    # mirroring the dropna() in the pandas path
+    end = n
+    while end >= 50:
+        deltas = np.diff(close[end - 15:end])
+        avg_loss = -deltas[deltas < 0].sum() / 14
+        if avg_loss != 0:
+            break
+        end -= 1
+    else:
+        raise ValueError("Indicators could not be computed")
+
+    avg_gain = deltas[deltas > 0].sum() / 14
+    rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+
+    return {
+        "symbol": symbol,
+        "close": float(close[end - 1]),
+        "dma_20": float(close[end - 20:end].mean()),
+        "dma_50": float(close[end - 50:end].mean()),
+        "rsi": float(rsi),
+        "volume": int(volume[end - 1]),
+        "avg_volume": int(volume[end - 20:end].mean()),
+        "latest_date": str(dates[end - 1]),
+    }
+
+
+def load_stock(symbol, data_dir="data"):
+    """
+    Preferred entry point for scans.
+    Reads the columnar price store when it is fresh, else falls back to CSV.
+    With the store, indicators come from the incremental IndicatorState.
+    """
+    from src import price_store
+    from src.indicator_state import sync_state
+    from src.scan_metrics import stage
+
+    store_dir = os.path.join(data_dir, ".store")
+
+    if price_store.is_fresh(symbol, data_dir=data_dir, store_dir=store_dir):
+        cols = price_store.load_prices(symbol, store_dir=store_dir)
+        # persisted rolling state → only new bars cost anything
+        with stage("indicators"):
+            return sync_state(symbol, cols, store_dir).snapshot()
+
+    return load_stock_from_csv(os.path.join(data_dir, f"{symbol}_NS.csv"))
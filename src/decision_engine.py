@@ -1,10 +1,9 @@
 # src/decision_engine.py
-import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from src.config import CONFIG
+from src.engine_log import get_logger
 
-print("ENGINE FILE:", os.path.abspath(__file__))
-print("🔥🔥🔥 DECISION ENGINE LOADED 🔥🔥🔥")
+_log = get_logger("engine")
 
 
 def _final(decision: str, reasons: List[str], trace: List[Dict[str, Any]], latest: Dict[str, Any]):
@@ -30,11 +29,9 @@ def make_decision(stock_data: Dict[str, Any]) -> Dict[str, Any]:
     avg_volume = latest["avg_volume"]
     trend = latest["trend"]
 
-    print(
-        f"[DEBUG] {stock_data['symbol']} | "
-        f"trend={trend}, rsi={rsi:.2f}, "
-        f"vol={volume}, avg_vol={avg_volume}, "
-        f"style={style}"
+    _log.debug(
+        "%s | trend=%s, rsi=%.2f, vol=%s, avg_vol=%s, style=%s",
+        stock_data["symbol"], trend, rsi, volume, avg_volume, style
     )
 
     reasons = []
@@ -95,3 +92,160 @@ def make_decision(stock_data: Dict[str, Any]) -> Dict[str, Any]:
 
     reasons.append("Waiting for better RSI alignment")
     return _final("WAIT", reasons, trace, latest)
+
+
+# ═════════════════════════════════════════════
+# BATCH PATH (COLUMNAR, VECTORIZED)
+# ═════════════════════════════════════════════
+# Decision codes
+NO_TRADE, WAIT, TRADE = 0, 1, 2
+DECISION_LABELS = ("NO TRADE", "WAIT", "TRADE")
+
+# Per-rule bits, in evaluation order
+RULE_BITS = {
+    "TREND_DIRECTION": 1 << 0,
+    "RSI_EXTREMES": 1 << 1,
+    "DISTRIBUTION_VOLUME": 1 << 2,
+    "STYLE_RSI_BAND": 1 << 3,
+}
+
+
+def make_decisions_batch(
+    rsi,
+    volume,
+    avg_volume,
+    trend,
+    style: Optional[str] = None,
+    rsi_band: Optional[Tuple[float, float]] = None,
+    with_trace: bool = False,
+) -> Dict[str, Any]:
+    """
+    Vectorized make_decision over N snapshots.
+    trend: "UP"/"DOWN" strings or booleans (True = UP).
+    rsi_band overrides CONFIG["RSI_BANDS"][style] (parameter sweeps).
+
+    Returns:
+    - "decision":  int8 codes (index into DECISION_LABELS)
+    - "evaluated": uint8 bitmask of rules the scalar path would reach
+    - "passed":    uint8 bitmask of rules that passed
+    - "trace" / "reasons": per-row lists, only when with_trace=True
+    """
+    import numpy as np  # batch path only → scalar engine imports stay light
+
+    rsi = np.asarray(rsi, dtype="float64")
+    volume = np.asarray(volume)
+    avg_volume = np.asarray(avg_volume)
+    trend = np.asarray(trend)
+
+    if style is None:
+        style = CONFIG["STYLE"]
+    if rsi_band is None:
+        rsi_band = CONFIG["RSI_BANDS"][style]
+    rsi_low, rsi_high = rsi_band
+
+    # ───────── RULE MASKS ─────────
+    trend_ok = trend == "UP" if trend.dtype.kind in "UO" else trend.astype(bool)
+    extremes_ok = ~((rsi < 20) | (rsi > 80))
+    volume_ok = volume >= avg_volume
+    band_ok = (rsi_low <= rsi) & (rsi <= rsi_high)
+
+    # ───────── SHORT-CIRCUIT REACH (same order as make_decision) ─────────
+    reach_extremes = trend_ok
+    reach_volume = reach_extremes & extremes_ok
+    reach_band = reach_volume & volume_ok
+
+    n = rsi.shape[0]
+    decision = np.full(n, NO_TRADE, dtype="int8")
+    decision[reach_band] = WAIT
+    decision[reach_band & band_ok] = TRADE
+
+    evaluated = (
+        RULE_BITS["TREND_DIRECTION"]
+        | np.where(reach_extremes, RULE_BITS["RSI_EXTREMES"], 0)
+        | np.where(reach_volume, RULE_BITS["DISTRIBUTION_VOLUME"], 0)
+        | np.where(reach_band, RULE_BITS["STYLE_RSI_BAND"], 0)
+    ).astype("uint8")
+
+    passed = (
+        np.where(trend_ok, RULE_BITS["TREND_DIRECTION"], 0)
+        | np.where(extremes_ok, RULE_BITS["RSI_EXTREMES"], 0)
+        | np.where(volume_ok, RULE_BITS["DISTRIBUTION_VOLUME"], 0)
+        | np.where(band_ok, RULE_BITS["STYLE_RSI_BAND"], 0)
+    ).astype("uint8") & evaluated
+
+    result = {
+        "decision": decision,
+        "evaluated": evaluated,
+        "passed": passed,
+    }
+
+    if with_trace:
+        traces, reasons = [], []
+        for i in range(n):
+            t, r = _batch_trace_row(
+                int(evaluated[i]), int(passed[i]),
+                trend[i].item(), rsi[i].item(),
+                volume[i].item(), avg_volume[i].item(),
+                style, (rsi_low, rsi_high),
+            )
+            traces.append(t)
+            reasons.append(r)
+        result["trace"] = traces
+        result["reasons"] = reasons
+
+    return result
+
+
+def _batch_trace_row(evaluated, passed, trend, rsi, volume, avg_volume, style, band):
+    """
+    Rebuilds the exact trace / reasons make_decision() would produce.
+    """
+    if not isinstance(trend, str):
+        trend = "UP" if trend else "DOWN"
+
+    def _res(rule):
+        return "PASS" if passed & RULE_BITS[rule] else "FAIL"
+
+    trace = [{
+        "rule": "TREND_DIRECTION",
+        "type": "HARD",
+        "value": trend,
+        "result": _res("TREND_DIRECTION")
+    }]
+
+    if not passed & RULE_BITS["TREND_DIRECTION"]:
+        return trace, ["Stock is not in an uptrend"]
+
+    # scalar path only records RSI_EXTREMES when it fails
+    if not passed & RULE_BITS["RSI_EXTREMES"]:
+        trace.append({
+            "rule": "RSI_EXTREMES",
+            "type": "HARD",
+            "value": rsi,
+            "result": "FAIL"
+        })
+        return trace, ["RSI is in extreme zone"]
+
+    trace.append({
+        "rule": "DISTRIBUTION_VOLUME",
+        "type": "HARD",
+        "value": {"volume": volume, "avg_volume": avg_volume},
+        "result": _res("DISTRIBUTION_VOLUME")
+    })
+
+    if not passed & RULE_BITS["DISTRIBUTION_VOLUME"]:
+        return trace, ["Distribution detected (low volume)"]
+
+    trace.append({
+        "rule": "STYLE_RSI_BAND",
+        "type": "SOFT",
+        "style": style,
+        "band": band,
+        "value": rsi,
+        "result": _res("STYLE_RSI_BAND")
+    })
+
+    if passed & RULE_BITS["STYLE_RSI_BAND"]:
+        return trace, ["All engine conditions satisfied"]
+
+    return trace, ["Waiting for better RSI alignment"]
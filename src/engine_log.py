@@ -0,0 +1,130 @@
+# src/engine_log.py
+
+import os
+import sys
+import queue
+import atexit
+import logging
+import itertools
+from logging.handlers import QueueHandler, QueueListener
+
+from src.config import CONFIG
+
+# -------------------------------------------------
+# LOGGER TREE
+# -------------------------------------------------
+# smartswing.engine, smartswing.service, ... all hang below ROOT.
+# Nothing is configured on import: until configure() runs, DEBUG calls
+# stop at the isEnabledFor() check and cost ~nothing.
+ROOT = "smartswing"
+FORMAT = "%(asctime)s %(levelname)-5s %(name)s | %(message)s"
+
+
+def get_logger(name):
+    return logging.getLogger(f"{ROOT}.{name}")
+
+
+# -------------------------------------------------
+# SAMPLING
+# -------------------------------------------------
+class SampleFilter(logging.Filter):
+    """
+    Keeps 1 in every round(1 / rate) DEBUG records; INFO and above
+    always pass.
+    """
+
+    def __init__(self, rate=1.0):
+        super().__init__()
+        self.every = max(1, round(1 / rate)) if rate > 0 else 0
+        self._seen = itertools.count()
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG:
+            return True
+        if not self.every:
+            return False
+        return next(self._seen) % self.every == 0
+
+
+# -------------------------------------------------
+# ASYNC OUTPUT (QUEUE → LISTENER THREAD)
+# -------------------------------------------------
+class _LazyQueueHandler(QueueHandler):
+    """
+    Enqueues the record untouched: the %-formatting happens on the
+    listener thread, not in the scan loop (records never leave the
+    process, so nothing needs to be pre-rendered for pickling).
+    """
+
+    def prepare(self, record):
+        return record
+
+
+_listener = None
+_handler = None
+_settings = {}
+
+
+def _start(stream):
+    global _listener, _handler
+
+    output = logging.StreamHandler(stream)
+    output.setFormatter(logging.Formatter(FORMAT))
+
+    q = queue.SimpleQueue()
+    handler = _LazyQueueHandler(q)
+    handler.addFilter(SampleFilter(_settings["sample_rate"]))
+
+    root = logging.getLogger(ROOT)
+    if _handler is not None:
+        root.removeHandler(_handler)
+    root.addHandler(handler)
+
+    _handler = handler
+    _listener = QueueListener(q, output, respect_handler_level=False)
+    _listener.start()
+
+
+def _restart_in_child():
+    # a forked worker inherits the handler but not the listener thread
+    global _listener
+    if _handler is not None:
+        _listener = None
+        _start(_settings["stream"])
+
+
+def configure(debug=None, sample_rate=None, stream=None):
+    """
+    Wires the smartswing logger tree. Safe to call more than once.
+    debug:       DEBUG level on/off (default CONFIG["DEBUG_ENGINE"])
+    sample_rate: fraction of DEBUG records kept (default CONFIG["DEBUG_SAMPLE_RATE"])
+    """
+    if debug is None:
+        debug = CONFIG.get("DEBUG_ENGINE", False)
+    if sample_rate is None:
+        sample_rate = CONFIG.get("DEBUG_SAMPLE_RATE", 1.0)
+
+    shutdown()
+
+    _settings.update(sample_rate=sample_rate, stream=stream or sys.stderr)
+
+    root = logging.getLogger(ROOT)
+    root.setLevel(logging.DEBUG if debug else logging.INFO)
+    root.propagate = False
+
+    _start(_settings["stream"])
+
+
+def shutdown():
+    """
+    Drains the queue and stops the listener thread.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_in_child)
@@ -1,8 +1,12 @@
-import pandas as pd
-import yfinance as yf
+import argparse
+import asyncio
 import os
 import time
 
+import pandas as pd
+
+from src.fetchers import PROVIDERS, fetch_universe
+
 # -----------------------------
 # Path setup
 # -----------------------------
@@ -10,46 +14,79 @@ BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 STOCK_LIST_PATH = os.path.join(BASE_DIR, "stocks_list.csv")
 
-# Create data folder if it doesn't exist
-os.makedirs(DATA_DIR, exist_ok=True)
 
-# -----------------------------
-# Read stock list
-# -----------------------------
-stocks_df = pd.read_csv(STOCK_LIST_PATH)
-stocks = stocks_df["symbol"].tolist()
+def load_tickers(stock_list_path=STOCK_LIST_PATH):
+    """
+    stocks_list.csv → yfinance tickers (`RELIANCE.NS`).
+    """
+    stocks_df = pd.read_csv(stock_list_path)
+    return stocks_df["symbol"].astype(str).tolist()
 
-print(f"\n📈 Reading market data for {len(stocks)} stocks...\n")
 
-# -----------------------------
-# Fetch data for each stock
-# -----------------------------
-for stock in stocks:
-    try:
-        print(f"Fetching {stock} ...")
+def fetch_prices(tickers, provider, data_dir=DATA_DIR, concurrency=4, rate=2.0,
+                 retries=4, period="1y", incremental=True):
+    """
+    Blocking wrapper around the async fetcher (scripts / schedulers).
+    """
+    return asyncio.run(fetch_universe(
+        tickers,
+        provider,
+        data_dir=data_dir,
+        concurrency=concurrency,
+        rate=rate,
+        retries=retries,
+        fetch_kwargs={"period": period},
+        incremental=incremental,
+    ))
+
 
-        data = yf.download(
-            stock,
-            period="1y",
-            interval="1d",
-            progress=False
-        )
+def _parse_args():
+    parser = argparse.ArgumentParser(description="Download daily OHLCV for the universe")
+    parser.add_argument("--provider", default="yfinance", choices=sorted(PROVIDERS))
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="max in-flight provider requests")
+    parser.add_argument("--rate", type=float, default=2.0,
+                        help="provider requests per second")
+    parser.add_argument("--retries", type=int, default=4)
+    parser.add_argument("--period", default="1y",
+                        help="history length for symbols with no CSV yet")
+    parser.add_argument("--full", action="store_true",
+                        help="re-download full history instead of delta fetch")
+    return parser.parse_args()
 
-        if data.empty:
-            print(f"⚠️ No data found for {stock}")
-            continue
 
-        file_name = stock.replace(".", "_") + ".csv"
-        file_path = os.path.join(DATA_DIR, file_name)
+if __name__ == "__main__":
+    args = _parse_args()
 
-        data.to_csv(file_path)
+    # -----------------------------
+    # Read stock list
+    # -----------------------------
+    stocks = load_tickers()
 
-        print(f"✅ Saved data → data/{file_name}")
+    print(f"\n📈 Reading market data for {len(stocks)} stocks...\n")
 
-        # Pause to avoid API rate limits
-        time.sleep(1)
+    started = time.monotonic()
+    summary = fetch_prices(
+        stocks,
+        PROVIDERS[args.provider](),
+        concurrency=args.concurrency,
+        rate=args.rate,
+        retries=args.retries,
+        period=args.period,
+        incremental=not args.full,
+    )
 
-    except Exception as e:
-        print(f"❌ Error fetching {stock}: {e}")
+    for stock in summary["saved"]:
+        print(f"✅ Saved data → data/{stock.replace('.', '_')}.csv")
+    for stock in summary["appended"]:
+        print(f"➕ Appended new bars → data/{stock.replace('.', '_')}.csv")
+    for stock in summary["repaired"]:
+        print(f"🛠️ Repaired gaps/revisions → data/{stock.replace('.', '_')}.csv")
+    if summary["current"]:
+        print(f"⏭️  Already up to date: {len(summary['current'])}")
+    for stock in summary["empty"]:
+        print(f"⚠️ No data found for {stock}")
+    for stock, error in summary["failed"].items():
+        print(f"❌ Error fetching {stock}: {error}")
 
-print("\n✅ Market data fetching completed.\n")
+    print(f"\n✅ Market data fetching completed in {time.monotonic() - started:.1f}s.\n")
@@ -0,0 +1,15 @@
+# src/fetchers/__init__.py
+
+from src.fetchers.providers import PriceProvider, YFinanceProvider, FakeProvider
+from src.fetchers.rate_limit import TokenBucket
+from src.fetchers.runner import fetch_universe, write_price_csv
+
+PROVIDERS = {
+    "yfinance": YFinanceProvider,
+    "fake": FakeProvider,
+}
+
+__all__ = [
+    "PriceProvider", "YFinanceProvider", "FakeProvider", "PROVIDERS",
+    "TokenBucket", "fetch_universe", "write_price_csv",
+]
@@ -0,0 +1,196 @@
+# src/fetchers/delta.py
+
+import os
+import json
+
+import pandas as pd
+
+from src.data_adapter import load_price_frame
+
+OHLCV = ["Close", "High", "Low", "Open", "Volume"]
+
+# bars re-requested before the last stored date, to catch revised /
+# overlapping bars from the provider
+OVERLAP_BARS = 3
+
+# calendar days between two stored bars that count as a hole
+# (weekends + the longest NSE holiday run stay below this)
+MAX_GAP_DAYS = 7
+
+
+# -------------------------------------------------
+# KNOWN GAPS (provider has no bars for them)
+# -------------------------------------------------
+# data/.cache/gaps/<file>.json — gap start dates a fetch already covered
+# without returning bars inside them (e.g. a trading suspension). They
+# are skipped by plan_delta so the file can reach "current" again.
+def _gaps_path(file_path):
+    return os.path.join(os.path.dirname(file_path), ".cache", "gaps",
+                        os.path.basename(file_path) + ".json")
+
+
+def known_gaps(file_path):
+    try:
+        with open(_gaps_path(file_path), "r") as f:
+            return set(json.load(f))
+    except (OSError, ValueError):
+        return set()
+
+
+def record_gaps(file_path, gaps):
+    """
+    Marks gap start dates as unfillable. Failures never break a fetch.
+    """
+    if not gaps:
+        return
+    path = _gaps_path(file_path)
+    dates = known_gaps(file_path) | {pd.Timestamp(g).strftime("%Y-%m-%d") for g in gaps}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(sorted(dates), f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def unfilled_gaps(stored, fresh, gaps):
+    """
+    Gaps the fresh bars span (fresh starts on/before the gap) but add no
+    dates inside — the provider simply has nothing there.
+    """
+    if fresh is None or fresh.empty:
+        return []
+    fresh_dates = pd.to_datetime(fresh.index).normalize()
+    dates = stored.index
+    out = []
+    for gap in gaps:
+        if fresh_dates.min() > gap:
+            continue                    # not requested far enough back
+        end = dates[dates.searchsorted(gap, side="right")]
+        if not ((fresh_dates > gap) & (fresh_dates < end)).any():
+            out.append(gap)
+    return out
+
+
+# -------------------------------------------------
+# PLAN: WHAT DOES THIS FILE NEED?
+# -------------------------------------------------
+def read_stored(file_path):
+    """
+    Existing bars as a flat OHLCV frame indexed by Date (None if absent/bad).
+    """
+    if not os.path.exists(file_path):
+        return None
+    try:
+        df = load_price_frame(file_path)
+    except Exception:
+        return None
+    if df.empty:
+        return None
+    return df.set_index("Date")[OHLCV]
+
+
+def find_gaps(dates, max_gap_days=MAX_GAP_DAYS):
+    """
+    Start dates of holes inside a stored history.
+    """
+    if len(dates) < 2:
+        return []
+    steps = pd.Series(dates).diff().dt.days
+    return [dates[i - 1] for i in steps[steps > max_gap_days].index]
+
+
+def plan_delta(file_path, today=None, overlap_bars=OVERLAP_BARS,
+               max_gap_days=MAX_GAP_DAYS):
+    """
+    Returns {"mode": "full" | "delta" | "current", "start": Timestamp|None,
+             "stored": frame|None, "gaps": [...], "duplicates": int}.
+    - full:    nothing usable on disk
+    - current: last stored bar is the latest business day → no request
+    - delta:   request from `start` (overlap / earliest gap) onwards
+    """
+    stored = read_stored(file_path)
+    if stored is None:
+        return {"mode": "full", "start": None, "stored": None, "gaps": [],
+                "duplicates": 0}
+
+    # overlapping bars already on disk (same date twice) → keep the last
+    duplicates = int(stored.index.duplicated(keep="last").sum())
+    if duplicates:
+        stored = stored[~stored.index.duplicated(keep="last")]
+
+    today = pd.Timestamp(today or pd.Timestamp.today()).normalize()
+    last_bday = pd.bdate_range(end=today, periods=1)[0]
+
+    dates = stored.index
+    skip = known_gaps(file_path)
+    gaps = [g for g in find_gaps(dates, max_gap_days) if g.strftime("%Y-%m-%d") not in skip]
+
+    plan = {"mode": "delta", "start": None, "stored": stored, "gaps": gaps,
+            "duplicates": duplicates}
+
+    if not gaps and dates[-1] >= last_bday:
+        plan["mode"] = "current"
+        return plan
+
+    start = dates[max(0, len(dates) - 1 - overlap_bars)]
+    if gaps:
+        start = min(start, gaps[0])
+
+    plan["start"] = start
+    return plan
+
+
+# -------------------------------------------------
+# APPLY: MERGE + WRITE
+# -------------------------------------------------
+def merge_bars(stored, fresh):
+    """
+    Union of stored + fresh bars; fresh wins on overlapping dates.
+    Returns (merged, revised) — revised=True when an existing bar changed
+    or was inserted before the last stored date (gap repair).
+    """
+    fresh = fresh[OHLCV].copy()
+    fresh.index = pd.to_datetime(fresh.index).normalize()
+    fresh = fresh[~fresh.index.duplicated(keep="last")]
+
+    last_stored = stored.index[-1]
+    older = fresh[fresh.index <= last_stored]
+
+    revised = False
+    if not older.empty:
+        common = older.index.intersection(stored.index)
+        inserted = older.index.difference(stored.index)
+        if len(inserted):
+            revised = True
+        elif len(common):
+            a = stored.loc[common, OHLCV].astype("float64").to_numpy()
+            b = older.loc[common, OHLCV].astype("float64").to_numpy()
+            revised = not (abs(a - b) <= 1e-9 * abs(a).clip(min=1)).all()
+
+    merged = pd.concat([stored[~stored.index.isin(fresh.index)], fresh])
+    merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+    return merged, revised
+
+
+def append_rows(frame, file_path):
+    """
+    Appends bars to an existing yfinance-layout CSV atomically: existing
+    bytes + new rows go to a temp file that replaces the CSV, so a crash
+    never leaves a half-written last line behind.
+    """
+    text = frame[OHLCV].to_csv(header=False, date_format="%Y-%m-%d")
+    with open(file_path, "rb") as f:
+        existing = f.read()
+    if existing and not existing.endswith(b"\n"):
+        existing += b"\n"
+
+    tmp = f"{file_path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(existing)
+        f.write(text.encode())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, file_path)
@@ -0,0 +1,142 @@
+# src/fetchers/providers.py
+
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+OHLCV = ["Close", "High", "Low", "Open", "Volume"]
+
+
+class PriceProvider:
+    """
+    Provider contract.
+    fetch() returns {ticker: DataFrame} with a DatetimeIndex named "Date"
+    and flat OHLCV columns. Missing / empty tickers are simply absent.
+    Raise on transport errors so the runner can back off and retry.
+    """
+
+    name = "base"
+    supports_batch = False      # True → fetch() accepts many tickers per call
+    max_batch = 1
+
+    def fetch(self, tickers, start=None, end=None, period="1y"):
+        raise NotImplementedError
+
+
+# -------------------------------------------------
+# YAHOO FINANCE
+# -------------------------------------------------
+class YFinanceProvider(PriceProvider):
+    name = "yfinance"
+    supports_batch = True
+    max_batch = 50
+
+    def __init__(self):
+        import yfinance  # optional dependency, only needed for live fetches
+        self._yf = yfinance
+
+    def fetch(self, tickers, start=None, end=None, period="1y"):
+        kwargs = {"interval": "1d", "progress": False, "auto_adjust": True}
+        if start is not None:
+            kwargs["start"] = start
+            if end is not None:
+                kwargs["end"] = end
+        else:
+            kwargs["period"] = period
+
+        data = self._yf.download(
+            list(tickers), group_by="ticker", threads=False, **kwargs
+        )
+
+        out = {}
+        if data is None or data.empty:
+            return out
+
+        for ticker in tickers:
+            if isinstance(data.columns, pd.MultiIndex):
+                if ticker not in data.columns.get_level_values(0):
+                    continue
+                frame = data[ticker]
+            else:
+                frame = data
+
+            frame = frame[[c for c in OHLCV if c in frame.columns]].dropna(how="all")
+            if not frame.empty:
+                frame.index.name = "Date"
+                out[ticker] = frame
+
+        return out
+
+
+# -------------------------------------------------
+# FAKE (OFFLINE / TESTS / BENCHMARKS)
+# -------------------------------------------------
+class FakeProvider(PriceProvider):
+    """
+    Deterministic synthetic bars per ticker (seeded by the ticker name).
+    fail_first=N makes each request fail N times before succeeding,
+    latency adds a sleep per call — both exercise the runner's retry
+    and concurrency paths without a network.
+    """
+
+    name = "fake"
+    supports_batch = True
+    max_batch = 25
+
+    def __init__(self, end_date=None, bars=250, latency=0.0, fail_first=0,
+                 missing=()):
+        self.end_date = pd.Timestamp(end_date or pd.Timestamp.today().normalize())
+        self.bars = bars
+        self.latency = latency
+        self.fail_first = fail_first
+        self.missing = set(missing)
+        self.calls = 0
+        self._failures = {}
+
+    # bars are generated from a fixed anchor, so a given (ticker, date)
+    # always has the same values whatever end_date / window is asked for
+    ANCHOR = "2015-01-01"
+
+    def _history(self, ticker):
+        dates = pd.bdate_range(self.ANCHOR, self.end_date, name="Date")
+        n = len(dates)
+        seed = zlib.crc32(ticker.encode())
+        # one stream per field → a longer window never shifts earlier draws
+        rng = [np.random.default_rng([seed, k]) for k in range(4)]
+
+        close = 100 * np.exp(np.cumsum(rng[0].normal(0.0004, 0.015, n)))
+        spread = rng[1].uniform(0.002, 0.02, n)
+        frame = pd.DataFrame({
+            "Close": close,
+            "High": close * (1 + spread),
+            "Low": close * (1 - spread),
+            "Open": close * (1 + rng[2].uniform(-0.01, 0.01, n)),
+            "Volume": rng[3].integers(100_000, 5_000_000, n),
+        }, index=dates)
+        return frame.tail(self.bars)
+
+    def fetch(self, tickers, start=None, end=None, period="1y"):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        key = tuple(tickers)
+        seen = self._failures.get(key, 0)
+        if seen < self.fail_first:
+            self._failures[key] = seen + 1
+            raise ConnectionError(f"fake transient failure for {', '.join(key)}")
+
+        out = {}
+        for ticker in tickers:
+            if ticker in self.missing:
+                continue
+            frame = self._history(ticker)
+            if start is not None:
+                frame = frame[frame.index >= pd.Timestamp(start)]
+            if end is not None:
+                frame = frame[frame.index < pd.Timestamp(end)]
+            if not frame.empty:
+                out[ticker] = frame
+        return out
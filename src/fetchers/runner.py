@@ -0,0 +1,225 @@
+# src/fetchers/runner.py
+
+import asyncio
+import inspect
+import os
+import random
+
+OHLCV = ["Close", "High", "Low", "Open", "Volume"]
+
+
+# -------------------------------------------------
+# CSV WRITER (yfinance multi-header layout)
+# -------------------------------------------------
+def write_price_csv(frame, ticker, file_path):
+    """
+    Writes flat OHLCV in the same 3-line header layout yfinance produces,
+    so src.data_adapter keeps parsing it unchanged. Atomic replace.
+    """
+    tmp = f"{file_path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write("Price," + ",".join(OHLCV) + "\n")
+        f.write("Ticker," + ",".join([ticker] * len(OHLCV)) + "\n")
+        f.write("Date" + "," * len(OHLCV) + "\n")
+        frame[OHLCV].to_csv(f, header=False, date_format="%Y-%m-%d")
+    os.replace(tmp, file_path)
+
+
+def ticker_file(ticker):
+    return ticker.replace(".", "_") + ".csv"
+
+
+def ticker_path(data_dir, ticker):
+    return os.path.join(data_dir, ticker_file(ticker))
+
+
+# -------------------------------------------------
+# ASYNC RUNNER
+# -------------------------------------------------
+async def _call_with_backoff(provider, batch, limiter, retries, backoff_base, fetch_kwargs):
+    attempt = 0
+    while True:
+        await limiter.acquire()
+        try:
+            # providers are blocking (HTTP clients) → keep them off the loop
+            return await asyncio.to_thread(provider.fetch, batch, **fetch_kwargs)
+        except Exception:
+            attempt += 1
+            if attempt > retries:
+                raise
+            delay = backoff_base * (2 ** (attempt - 1))
+            await asyncio.sleep(delay + random.uniform(0, delay / 2))
+
+
+def _plan_batches(tickers, data_dir, batch_size, incremental, today):
+    """
+    Groups tickers into provider calls. Incremental mode groups by the
+    delta start date so batch providers still get one call per group.
+    Returns (batches [(tickers, kwargs)], plans {ticker: plan},
+             current [...], repaired [...]).
+    """
+    from src.fetchers.delta import plan_delta
+
+    if not incremental:
+        return [
+            (tickers[i:i + batch_size], {}) for i in range(0, len(tickers), batch_size)
+        ], {}, [], []
+
+    plans = {}
+    groups = {}
+    current = []
+    repaired = []
+
+    for t in tickers:
+        plan = plan_delta(ticker_path(data_dir, t), today=today)
+        plans[t] = plan
+        if plan["mode"] == "current":
+            if plan["duplicates"]:
+                # up to date but with overlapping bars → rewrite de-duplicated
+                write_price_csv(plan["stored"], t, ticker_path(data_dir, t))
+                repaired.append(t)
+            else:
+                current.append(t)
+            continue
+        start = None if plan["start"] is None else plan["start"].strftime("%Y-%m-%d")
+        groups.setdefault(start, []).append(t)
+
+    batches = []
+    for start, group in groups.items():
+        kwargs = {} if start is None else {"start": start}
+        for i in range(0, len(group), batch_size):
+            batches.append((group[i:i + batch_size], kwargs))
+
+    return batches, plans, current, repaired
+
+
+def _save(ticker, frame, path, plan, summary):
+    """
+    Full write, or merge + append/rewrite for a delta fetch.
+    Returns the summary bucket the ticker landed in.
+    """
+    from src.fetchers.delta import merge_bars, append_rows, unfilled_gaps, record_gaps
+
+    if plan is None or plan["stored"] is None:
+        write_price_csv(frame, ticker, path)
+        summary["saved"].append(ticker)
+        return "saved"
+
+    stored = plan["stored"]
+    merged, revised = merge_bars(stored, frame)
+
+    if plan["gaps"]:
+        # holes the provider cannot fill are remembered, not retried forever
+        record_gaps(path, unfilled_gaps(stored, frame, plan["gaps"]))
+
+    # filled holes show up as inserted bars → revised
+    if revised or plan["duplicates"]:
+        # overlapping / revised bars or filled holes → rewrite atomically
+        write_price_csv(merged, ticker, path)
+        summary["repaired"].append(ticker)
+        return "repaired"
+
+    new_rows = merged[merged.index > stored.index[-1]]
+    if new_rows.empty:
+        summary["current"].append(ticker)
+        return "current"
+
+    append_rows(new_rows, path)
+    summary["appended"].append(ticker)
+    return "appended"
+
+
+async def fetch_universe(
+    tickers,
+    provider,
+    data_dir="data",
+    concurrency=4,
+    rate=2.0,
+    retries=4,
+    backoff_base=0.5,
+    batch_size=None,
+    fetch_kwargs=None,
+    incremental=False,
+    today=None,
+    on_saved=None,
+):
+    """
+    Fetches every ticker with bounded parallelism and saves one CSV each.
+    - concurrency: max in-flight provider calls (semaphore)
+    - rate:        provider calls per second (token bucket)
+    - retries / backoff_base: exponential backoff with jitter per batch
+    - batch_size:  tickers per call (default: provider.max_batch)
+    - fetch_kwargs: passed to provider.fetch (start / end / period)
+    - incremental: only request bars after the last stored date
+      (plus a small overlap), append them, and repair gaps / revised bars
+    - on_saved:    callback(ticker, status) — sync or async — called as soon
+      as each ticker settles (status = summary bucket), so a pipeline can
+      start on a symbol without waiting for the whole universe
+    Returns {"saved", "appended", "repaired", "current", "empty": [...],
+             "failed": {ticker: error}}.
+    """
+    from src.fetchers.rate_limit import TokenBucket
+
+    os.makedirs(data_dir, exist_ok=True)
+
+    if batch_size is None:
+        batch_size = provider.max_batch if provider.supports_batch else 1
+    batch_size = max(1, batch_size)
+
+    batches, plans, current, repaired = _plan_batches(
+        list(tickers), data_dir, batch_size, incremental, today
+    )
+
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = TokenBucket(rate)
+    summary = {
+        "saved": [], "appended": [], "repaired": repaired, "current": current,
+        "empty": [], "failed": {},
+    }
+
+    async def settled(ticker, status):
+        if on_saved is None:
+            return
+        result = on_saved(ticker, status)
+        if inspect.isawaitable(result):
+            await result        # lets a bounded consumer apply backpressure
+
+    for t in repaired:
+        await settled(t, "repaired")
+    for t in current:
+        await settled(t, "current")
+
+    async def run_batch(batch, kwargs):
+        async with semaphore:
+            try:
+                frames = await _call_with_backoff(
+                    provider, batch, limiter, retries, backoff_base,
+                    {**(fetch_kwargs or {}), **kwargs},
+                )
+            except Exception as e:
+                for t in batch:
+                    summary["failed"][t] = str(e)
+                    await settled(t, "failed")
+                return
+
+        for t in batch:
+            frame = frames.get(t)
+            if frame is None or frame.empty:
+                if plans.get(t, {}).get("stored") is not None:
+                    summary["current"].append(t)    # nothing new yet
+                    await settled(t, "current")
+                else:
+                    summary["empty"].append(t)
+                    await settled(t, "empty")
+                continue
+            path = ticker_path(data_dir, t)
+            try:
+                status = _save(t, frame, path, plans.get(t), summary)
+            except Exception as e:
+                # one bad frame / disk error must not abort the universe
+                summary["failed"][t] = str(e)
+                status = "failed"
+            await settled(t, status)
+
+    await asyncio.gather(*(run_batch(b, kw) for b, kw in batches))
+    return summary
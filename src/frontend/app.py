@@ -11,26 +11,16 @@ PROJECT_ROOT = os.path.abspath(
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-# Optional debug (safe to keep for now)
-print("✅ PROJECT_ROOT:", PROJECT_ROOT)
-print("✅ sys.path (head):", sys.path[:3])
-
 # =================================================
 # STANDARD IMPORTS
 # =================================================
 import streamlit as st
-import json
 import math
-import pandas as pd
-import matplotlib.pyplot as plt
 
-from src.data_adapter import load_stock_from_csv
+from src.frontend.data import latest_scan_data, chart_data, chart_image, symbol_trace
 
-# =================================================
-# 🔎 DEBUG — ENV CHECK
-# =================================================
-st.write("📂 Streamlit CWD:", os.getcwd())
-st.write("📁 Logs folder exists:", os.path.exists("logs"))
+DECISIONS = ["TRADE", "WAIT", "NO TRADE"]
+PAGE_SIZES = [12, 24, 48]
 
 # =================================================
 # PAGE SETUP
@@ -48,45 +38,19 @@ st.markdown(
 st.divider()
 
 # =================================================
-# LOAD LATEST SCAN FILE
+# LOAD LATEST SCAN (cached on file fingerprint)
 # =================================================
-def load_latest_scan():
-    log_dir = "logs"
-    if not os.path.exists(log_dir):
-        return None, []
-
-    files = sorted(
-        [f for f in os.listdir(log_dir) if f.startswith("scan_")],
-        reverse=True
-    )
-
-    if not files:
-        return None, []
-
-    latest_file = os.path.join(log_dir, files[0])
-    st.success(f"✅ Using scan file: {latest_file}")
+scan = latest_scan_data()
 
-    meta = None
-    records = []
-
-    with open(latest_file, "r") as f:
-        for line in f:
-            obj = json.loads(line)
-            if obj.get("type") == "SCAN_META":
-                meta = obj
-            elif obj.get("type") == "DECISION":
-                records.append(obj)
-
-    st.info(f"📊 Total decisions loaded: {len(records)}")
-    return meta, records
-
-
-scan_meta, scan_results = load_latest_scan()
-
-if not scan_results:
+if not scan or not scan["records"]:
     st.warning("⚠️ No scan data found. Run `python3 -m src.smartswing` first.")
     st.stop()
 
+scan_meta = scan["meta"]
+
+st.success(f"✅ Using scan: {scan_meta.get('scan_id')}")
+st.info(f"📊 Total decisions loaded: {len(scan['records'])}")
+
 # =================================================
 # SCAN HEADER
 # =================================================
@@ -100,17 +64,50 @@ if scan_meta:
 # =================================================
 # SPLIT RESULTS
 # =================================================
-trade_results = [r for r in scan_results if r["decision"] == "TRADE"]
-wait_results = [r for r in scan_results if r["decision"] == "WAIT"]
+trade_results = scan["trade"]
+wait_results = scan["wait"]
 
 st.success(f"🟢 TRADE count: {len(trade_results)}")
 st.warning(f"🟡 WAIT count: {len(wait_results)}")
 
+# =================================================
+# 🎛️ FILTERS (SIDEBAR)
+# =================================================
+st.sidebar.header("🎛️ Filters")
+
+decisions = st.sidebar.multiselect(
+    "Decision", DECISIONS, default=["TRADE", "WAIT"]
+)
+search = st.sidebar.text_input("Symbol contains").strip().upper()
+page_size = st.sidebar.selectbox("Cards per page", PAGE_SIZES, index=0)
+
+
+def _matches(symbol):
+    return not search or search in symbol
+
+
+# =================================================
+# 📋 SUMMARY TABLE (PRIMARY VIEW)
+# =================================================
+st.subheader("📋 Scan Summary")
+
+table = scan["table"]
+table = table[table["Decision"].isin(decisions)]
+if search:
+    table = table[table["Symbol"].str.contains(search, regex=False)]
+
+st.caption(f"{len(table)} of {len(scan['table'])} symbols — click a column header to sort")
+st.dataframe(table, use_container_width=True, hide_index=True)
+
 # =================================================
 # 🔍 RULE TRACE RENDERER
 # =================================================
 def render_rule_trace(trace):
     for step in trace:
+        if not isinstance(step, dict):          # marker, e.g. BLOCKED_BY_RISK
+            st.markdown(f"⛔ **{step}**")
+            continue
+
         rule = step.get("rule")
         result = step.get("result")
         rule_type = step.get("type", "")
@@ -128,128 +125,124 @@ def render_rule_trace(trace):
             st.markdown(f"✅ **{rule}** ({rule_type}) → {badge}")
 
 # =================================================
-# 📊 CHART BUILDER (ENGINE-ALIGNED)
+# 📊 CHART (LIGHTWEIGHT, CACHED DATA)
 # =================================================
-@st.cache_data(show_spinner=False, ttl=60)
-def build_chart_dataframe(symbol):
-    path = f"data/{symbol}_NS.csv"
-    if not os.path.exists(path):
-        return None, None
-
-    # Engine adapter validation (trust gate)
-    _ = load_stock_from_csv(path)
-
-    df = pd.read_csv(path)
-
-    if "Price" in df.columns:
-        df = df[df["Price"].astype(str).str.match(r"\d{4}-\d{2}-\d{2}")]
-        df = df.rename(columns={"Price": "Date"})
-
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-    for col in ["Close", "High", "Low", "Open", "Volume"]:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    df = df.dropna().sort_values("Date")
-
-    df["DMA_20"] = df["Close"].rolling(20).mean()
-    df["DMA_50"] = df["Close"].rolling(50).mean()
-    df = df.dropna()
-
-    latest = df.iloc[-1]
-    meta = {
-        "from": df["Date"].iloc[0].date(),
-        "to": df["Date"].iloc[-1].date(),
-        "latest_close": round(float(latest["Close"]), 2),
-    }
-
-    return df, meta
-
-
 def plot_price_chart(df, meta):
     st.caption(
         f"📅 Data range: **{meta['from']} → {meta['to']}** | "
         f"🔔 Latest Close: **₹{meta['latest_close']}**"
     )
-
-    fig, ax = plt.subplots(figsize=(6.5, 3.5))
-    ax.plot(df["Date"], df["Close"], label="Close", linewidth=2)
-    ax.plot(df["Date"], df["DMA_20"], label="20 DMA")
-    ax.plot(df["Date"], df["DMA_50"], label="50 DMA")
-    ax.legend(fontsize=8)
-    ax.grid(True, alpha=0.3)
-    st.pyplot(fig)
+    st.line_chart(
+        df.set_index("Date")[["Close", "DMA_20", "DMA_50"]],
+        height=280,
+    )
 
 # =================================================
-# 📈 TRADE SECTION
+# 🔎 SYMBOL DETAIL (ON DEMAND)
 # =================================================
-st.subheader("📈 TRADE — Action Now")
+st.subheader("🔎 Symbol Detail")
 
-if not trade_results:
-    st.info("🛡️ No high-confidence trades today.")
-else:
-    rows = math.ceil(len(trade_results) / 3)
-    idx = 0
+symbols = [r["symbol"] for r in scan["records"]]
+# widget state outlives the scan it was picked from → re-validate
+if st.session_state.get("detail_symbol") not in scan["by_symbol"]:
+    st.session_state["detail_symbol"] = (trade_results or wait_results or scan["records"])[0]["symbol"]
 
-    for _ in range(rows):
-        cols = st.columns(3)
-        for col in cols:
-            if idx >= len(trade_results):
-                break
+selected = st.selectbox("Symbol", symbols, key="detail_symbol")
+record = scan["by_symbol"][selected]
 
-            trade = trade_results[idx]
-            idx += 1
+left, right = st.columns([1, 2])
 
-            with col:
-                st.success(f"📈 {trade['symbol']}")
-                st.markdown("**Decision:** TRADE")
-
-                st.markdown("**Trade Plan:**")
-                st.markdown(f"- Entry: {trade['entry']}")
-                st.markdown(f"- Stop: {trade['stop']}")
-                st.markdown(f"- Target: {trade['target']}")
-                st.markdown(f"- Qty: {trade['qty']}")
-                st.markdown(f"- Holding: {trade['holding']}")
-
-                with st.expander("🔍 Why this trade?"):
-                    for r in trade.get("reason", []):
-                        st.markdown(f"- {r}")
-                    st.markdown("**Rule Trace:**")
-                    render_rule_trace(trade.get("trace", []))
+with left:
+    st.markdown(f"**Decision:** {record['decision']}")
 
-                with st.expander("📊 Price & Trend Chart"):
-                    df, meta = build_chart_dataframe(trade["symbol"])
-                    if df is not None:
-                        plot_price_chart(df, meta)
+    if record["decision"] == "TRADE":
+        st.markdown("**Trade Plan:**")
+        st.markdown(f"- Entry: {record['entry']}")
+        st.markdown(f"- Stop: {record['stop']}")
+        st.markdown(f"- Target: {record['target']}")
+        st.markdown(f"- Qty: {record['qty']}")
+        st.markdown(f"- Holding: {record['holding']}")
 
-# =================================================
-# ⏳ WAIT SECTION
-# =================================================
-st.subheader("⏳ WAIT — Setups Forming")
+    st.markdown("**Why?**")
+    for r in record.get("reason", []):
+        st.markdown(f"- {r}")
 
-rows = math.ceil(len(wait_results) / 3)
-idx = 0
+    st.markdown("**Rule Trace:**")
+    render_rule_trace(symbol_trace(scan, selected))
 
-for _ in range(rows):
-    cols = st.columns(3)
-    for col in cols:
-        if idx >= len(wait_results):
-            break
+with right:
+    image = chart_image(selected)
+    if image is not None:
+        st.image(image, use_container_width=True)
+    else:
+        # not pre-rendered (NO TRADE / no matplotlib) → live chart
+        df, meta = chart_data(selected)
+        if df is not None:
+            plot_price_chart(df, meta)
+        else:
+            st.info("No price data for this symbol.")
+
+# =================================================
+# 🗂️ CARDS (PAGINATED)
+# =================================================
+def _show_detail(symbol):
+    st.session_state["detail_symbol"] = symbol
 
-        wait = wait_results[idx]
-        idx += 1
 
-        with col:
-            st.warning(f"⏳ {wait['symbol']}")
-            st.markdown("**Decision:** WAIT")
+def _page(items, key):
+    """
+    Slice of `items` for the current page (only these get rendered).
+    """
+    pages = max(1, math.ceil(len(items) / page_size))
+    # a bigger page size / narrower filter can shrink the page count
+    if st.session_state.get(key, 1) > pages:
+        st.session_state[key] = pages
+    page = st.number_input(
+        f"Page (of {pages})", min_value=1, max_value=pages, value=1, key=key
+    )
+    start = (page - 1) * page_size
+    return items[start:start + page_size]
 
-            st.markdown("**Why WAIT?**")
-            for r in wait.get("reason", []):
-                st.markdown(f"- {r}")
 
-            with st.expander("🔍 Rule Trace"):
-                render_rule_trace(wait.get("trace", []))
+def render_cards(items, kind):
+    for start in range(0, len(items), 3):
+        cols = st.columns(3)
+        for col, item in zip(cols, items[start:start + 3]):
+            with col:
+                if kind == "TRADE":
+                    st.success(f"📈 {item['symbol']}")
+                    st.markdown(
+                        f"Entry **{item['entry']}** · Stop **{item['stop']}** · "
+                        f"Target **{item['target']}** · Qty **{item['qty']}**"
+                    )
+                else:
+                    st.warning(f"⏳ {item['symbol']}")
+                    for r in item.get("reason", []):
+                        st.markdown(f"- {r}")
 
-            with st.expander("📊 Price & Trend Chart"):
-                df, meta = build_chart_dataframe(wait["symbol"])
-                if df is not None:
-                    plot_price_chart(df, meta)
+                st.button(
+                    "🔎 Details",
+                    key=f"detail_{kind}_{item['symbol']}",
+                    on_click=_show_detail,
+                    args=(item["symbol"],),
+                )
+
+
+trade_tab, wait_tab = st.tabs([
+    f"📈 TRADE — Action Now ({len(trade_results)})",
+    f"⏳ WAIT — Setups Forming ({len(wait_results)})",
+])
+
+with trade_tab:
+    items = [r for r in trade_results if _matches(r["symbol"])]
+    if not items:
+        st.info("🛡️ No high-confidence trades today.")
+    else:
+        render_cards(_page(items, "trade_page"), "TRADE")
+
+with wait_tab:
+    items = [r for r in wait_results if _matches(r["symbol"])]
+    if not items:
+        st.info("No setups forming.")
+    else:
+        render_cards(_page(items, "wait_page"), "WAIT")
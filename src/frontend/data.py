@@ -0,0 +1,181 @@
+# src/frontend/data.py
+
+import os
+
+import pandas as pd
+import streamlit as st
+
+from src.data_adapter import load_stock_from_csv
+from src.indicators import get_indicator_frame, symbol_path, CORE
+from src.chart_cache import chart_path
+from src.logger import load_latest_scan_file
+from src import scan_columnar
+from src.scan_store import import_scan_file, scan_by_source, scan_decisions
+
+# -------------------------------------------------
+# FINGERPRINTS (cheap stat → cache key)
+# -------------------------------------------------
+# Loaders below are cached on (path, mtime_ns, size): a rerun only pays
+# for a stat; a rewritten file gets a new key and is loaded once.
+def file_fingerprint(path):
+    try:
+        st_ = os.stat(path)
+    except OSError:
+        return None
+    return (path, st_.st_mtime_ns, st_.st_size)
+
+
+def latest_scan_fingerprint():
+    """
+    Fingerprint of the newest scan (logs/LATEST pointer → O(1)).
+    """
+    if not os.path.exists("logs"):
+        return None
+    path = load_latest_scan_file()
+    return file_fingerprint(path) if path else None
+
+
+# -------------------------------------------------
+# SCAN
+# -------------------------------------------------
+SUMMARY_COLUMNS = ["Symbol", "Decision", "Entry", "Stop", "Target", "Qty",
+                   "Holding", "Why"]
+
+
+def summary_table(records):
+    """
+    One row per decision — the dashboard's sortable primary view.
+    """
+    rows = [
+        (
+            r["symbol"], r["decision"], r.get("entry"), r.get("stop"),
+            r.get("target"), r.get("qty"), r.get("holding"),
+            (r.get("reason") or [""])[0],
+        )
+        for r in records
+    ]
+    return pd.DataFrame(rows, columns=SUMMARY_COLUMNS)
+
+
+def _scan_data(meta, records, columnar=None):
+    return {
+        "meta": meta,
+        "records": records,
+        "by_symbol": {r["symbol"]: r for r in records},
+        "row": {r["symbol"]: i for i, r in enumerate(records)},
+        "columnar": columnar,
+        "table": summary_table(records),
+        "trade": [r for r in records if r["decision"] == "TRADE"],
+        "wait": [r for r in records if r["decision"] == "WAIT"],
+    }
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def load_scan(fingerprint):
+    """
+    {"meta", "records", "by_symbol", "table", "trade", "wait", ...} for
+    one scan file version.
+    .npz  → read straight from the columns; traces stay encoded until
+            symbol_trace() asks for one (the scan already indexed itself).
+    .jsonl → (re)indexed, then read back from the SQLite index.
+    Shared across sessions — treat as read-only.
+    """
+    path = fingerprint[0]
+
+    if path.endswith(scan_columnar.EXTENSION):
+        scan = scan_columnar.read_scan(path)
+        records = [
+            scan_columnar.row_record(scan, i, trace=False)
+            for i in range(len(scan["table"]))
+        ]
+        return _scan_data(scan["meta"], records, columnar=scan)
+
+    # (re)index this exact file version, then read it from the index
+    import_scan_file(path)
+    meta = scan_by_source(path)
+    records = scan_decisions(meta["scan_id"]) if meta else []
+    return _scan_data(meta, records)
+
+
+def symbol_trace(scan, symbol):
+    """
+    Rule trace for ONE symbol (decoded on demand for columnar scans).
+    """
+    if scan["columnar"] is not None:
+        return scan_columnar.row_trace(scan["columnar"], scan["row"][symbol])
+    return scan["by_symbol"][symbol].get("trace", [])
+
+
+def latest_scan_data():
+    fingerprint = latest_scan_fingerprint()
+    if fingerprint is None:
+        return None
+    return load_scan(fingerprint)
+
+
+# -------------------------------------------------
+# CHART DATA (ENGINE-ALIGNED)
+# -------------------------------------------------
+@st.cache_data(max_entries=256, show_spinner=False)
+def load_chart_frame(fingerprint):
+    """
+    Close / DMA_20 / DMA_50 for one CSV version + range metadata.
+    The adapter's trust gate and the chart share ONE cached CORE frame
+    (src.indicators) → the CSV is parsed once, not twice.
+    """
+    path = fingerprint[0]
+
+    # Engine adapter validation (trust gate)
+    load_stock_from_csv(path)
+
+    df = get_indicator_frame(path, CORE)[["Date", "Close", "DMA_20", "DMA_50"]].dropna()
+
+    meta = {
+        "from": df["Date"].iloc[0].date(),
+        "to": df["Date"].iloc[-1].date(),
+        "latest_close": round(float(df["Close"].iloc[-1]), 2),
+    }
+    return df.reset_index(drop=True), meta
+
+
+def chart_data(symbol, data_dir="data"):
+    """
+    (frame, meta) for a symbol, or (None, None) when its CSV is missing.
+    """
+    fingerprint = file_fingerprint(symbol_path(symbol, data_dir))
+    if fingerprint is None:
+        return None, None
+    return load_chart_frame(fingerprint)
+
+
+# -------------------------------------------------
+# CHART IMAGES (pre-rendered at scan time)
+# -------------------------------------------------
+@st.cache_data(max_entries=256, show_spinner=False)
+def chart_image_path(fingerprint, symbol):
+    """
+    reports/charts path for this CSV version (hashing the CSV once per version).
+    """
+    return chart_path(symbol, os.path.dirname(fingerprint[0]))
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def load_chart_image(png_fingerprint):
+    with open(png_fingerprint[0], "rb") as f:
+        return f.read()
+
+
+def chart_image(symbol, data_dir="data"):
+    """
+    Pre-rendered PNG bytes, or None. Misses are never cached: keyed on
+    the PNG's own fingerprint, a chart rendered after the page opened
+    shows up on the next rerun.
+    """
+    fingerprint = file_fingerprint(symbol_path(symbol, data_dir))
+    if fingerprint is None:
+        return None
+    path = chart_image_path(fingerprint, symbol)
+    png_fingerprint = file_fingerprint(path) if path else None
+    if png_fingerprint is None:
+        return None
+    return load_chart_image(png_fingerprint)
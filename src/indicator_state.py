@@ -0,0 +1,243 @@
+# src/indicator_state.py
+
+import os
+import json
+from collections import deque
+
+from src.data_adapter import MIN_ROWS_REQUIRED
+
+# -------------------------------------------------
+# WINDOWS (must match src.data_adapter)
+# -------------------------------------------------
+DMA_FAST = 20
+DMA_SLOW = 50
+RSI_PERIOD = 14
+AVG_VOL_PERIOD = 20
+
+# re-sum the windows every N updates so float drift never accumulates
+RESYNC_EVERY = 250
+
+STATE_FILE = "state.json"
+
+
+class IndicatorState:
+    """
+    Rolling DMA_20 / DMA_50 / RSI(14) / AVG_VOL_20 for ONE symbol.
+    update() is O(1) per bar; snapshot() equals load_stock_from_csv().
+    """
+
+    def __init__(self, symbol):
+        self.symbol = symbol
+        self.bars = 0
+        self.last_date = None
+        self.last_close = None
+
+        self.closes = deque(maxlen=DMA_SLOW)
+        self.volumes = deque(maxlen=AVG_VOL_PERIOD)
+        self.gains = deque(maxlen=RSI_PERIOD)
+        self.losses = deque(maxlen=RSI_PERIOD)
+
+        self.sum_fast = 0.0
+        self.sum_slow = 0.0
+        self.sum_vol = 0.0
+        self.sum_gain = 0.0
+        self.sum_loss = 0.0
+        self.loss_bars = 0          # non-zero losses in window → exact zero test
+
+        self.last_valid = None      # latest snapshot with a defined RSI
+        self._since_resync = 0
+
+    # -------------------------------------------------
+    # O(1) UPDATE
+    # -------------------------------------------------
+    def update(self, date, close, volume):
+        close = float(close)
+        volume = float(volume)
+
+        # ---- closes (DMA_50 window holds DMA_20 window) ----
+        if len(self.closes) == DMA_SLOW:
+            self.sum_slow -= self.closes[0]
+        if len(self.closes) >= DMA_FAST:
+            self.sum_fast -= self.closes[-DMA_FAST]
+        self.closes.append(close)
+        self.sum_slow += close
+        self.sum_fast += close
+
+        # ---- volume ----
+        if len(self.volumes) == AVG_VOL_PERIOD:
+            self.sum_vol -= self.volumes[0]
+        self.volumes.append(volume)
+        self.sum_vol += volume
+
+        # ---- gains / losses ----
+        if self.last_close is not None:
+            delta = close - self.last_close
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+
+            if len(self.gains) == RSI_PERIOD:
+                self.sum_gain -= self.gains[0]
+                self.sum_loss -= self.losses[0]
+                if self.losses[0] > 0:
+                    self.loss_bars -= 1
+
+            self.gains.append(gain)
+            self.losses.append(loss)
+            self.sum_gain += gain
+            self.sum_loss += loss
+            if loss > 0:
+                self.loss_bars += 1
+
+        self.last_close = close
+        self.last_date = str(date)[:10]
+        self.bars += 1
+
+        self._since_resync += 1
+        if self._since_resync >= RESYNC_EVERY:
+            self._resync()
+
+        if self._ready() and self.loss_bars > 0:
+            self.last_valid = self._compute()
+
+    def _resync(self):
+        closes = list(self.closes)
+        self.sum_slow = sum(closes)
+        self.sum_fast = sum(closes[-DMA_FAST:])
+        self.sum_vol = sum(self.volumes)
+        self.sum_gain = sum(self.gains)
+        self.sum_loss = sum(self.losses)
+        self._since_resync = 0
+
+    def _ready(self):
+        return (
+            len(self.closes) == DMA_SLOW
+            and len(self.gains) == RSI_PERIOD
+        )
+
+    def _compute(self):
+        avg_gain = self.sum_gain / RSI_PERIOD
+        avg_loss = self.sum_loss / RSI_PERIOD
+
+        return {
+            "symbol": self.symbol,
+            "close": self.last_close,
+            "dma_20": self.sum_fast / DMA_FAST,
+            "dma_50": self.sum_slow / DMA_SLOW,
+            "rsi": 100 - (100 / (1 + avg_gain / avg_loss)),
+            "volume": int(self.volumes[-1]),
+            "avg_volume": int(self.sum_vol / AVG_VOL_PERIOD),
+            "latest_date": self.last_date,
+        }
+
+    # -------------------------------------------------
+    # READ
+    # -------------------------------------------------
+    def snapshot(self):
+        if self.bars < MIN_ROWS_REQUIRED:
+            raise ValueError(
+                f"Not enough data rows ({self.bars}). "
+                f"Minimum required: {MIN_ROWS_REQUIRED}"
+            )
+        if self.last_valid is None:
+            raise ValueError("Indicators could not be computed")
+        return dict(self.last_valid)
+
+    # -------------------------------------------------
+    # (DE)SERIALIZATION
+    # -------------------------------------------------
+    def to_dict(self):
+        return {
+            "symbol": self.symbol,
+            "bars": self.bars,
+            "last_date": self.last_date,
+            "last_close": self.last_close,
+            "closes": list(self.closes),
+            "volumes": list(self.volumes),
+            "gains": list(self.gains),
+            "losses": list(self.losses),
+            "last_valid": self.last_valid,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        state = cls(data["symbol"])
+        state.bars = data["bars"]
+        state.last_date = data["last_date"]
+        state.last_close = data["last_close"]
+        state.closes.extend(data["closes"])
+        state.volumes.extend(data["volumes"])
+        state.gains.extend(data["gains"])
+        state.losses.extend(data["losses"])
+        state.loss_bars = sum(1 for x in state.losses if x > 0)
+        state.last_valid = data["last_valid"]
+        state._resync()
+        return state
+
+    @classmethod
+    def from_arrays(cls, symbol, dates, close, volume):
+        """
+        Replays a full history once. After this, only update() is needed.
+        """
+        state = cls(symbol)
+        for d, c, v in zip(dates, close, volume):
+            state.update(d, c, v)
+        return state
+
+
+# -------------------------------------------------
+# PERSISTENCE (next to the price store)
+# -------------------------------------------------
+def _state_path(symbol, store_dir):
+    return os.path.join(store_dir, symbol, STATE_FILE)
+
+
+def load_state(symbol, store_dir):
+    path = _state_path(symbol, store_dir)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        return IndicatorState.from_dict(json.load(f))
+
+
+def save_state(state, store_dir):
+    path = _state_path(state.symbol, store_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(state.to_dict(), f)
+    os.replace(tmp, path)
+
+
+def sync_state(symbol, cols, store_dir):
+    """
+    Brings the persisted state up to date with the price-store columns.
+    Only bars newer than the saved state are replayed; a rewritten
+    history (dates no longer line up, or the last saved bar was revised
+    in place) triggers a full rebuild.
+    """
+    dates = cols["date"]
+    n = len(dates)
+
+    state = load_state(symbol, store_dir)
+
+    if (
+        state is None
+        or state.bars > n
+        or str(dates[state.bars - 1]) != state.last_date
+        or float(cols["close"][state.bars - 1]) != state.last_close
+        or float(cols["volume"][state.bars - 1]) != state.volumes[-1]
+    ):
+        state = IndicatorState.from_arrays(
+            symbol, dates, cols["close"], cols["volume"]
+        )
+        save_state(state, store_dir)
+        return state
+
+    if state.bars == n:
+        return state
+
+    for i in range(state.bars, n):
+        state.update(dates[i], cols["close"][i], cols["volume"][i])
+
+    save_state(state, store_dir)
+    return state
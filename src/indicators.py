@@ -0,0 +1,270 @@
+# src/indicators.py
+
+import os
+import re
+import glob
+import hashlib
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from src.config import CONFIG
+from src.data_adapter import load_price_frame
+
+# -------------------------------------------------
+# INDICATOR SETS
+# -------------------------------------------------
+# Supported names:
+#   DMA_<n>      rolling mean of Close
+#   AVG_VOL_<n>  rolling mean of Volume
+#   RSI / RSI_<n>  simple-average RSI (default 14)
+#   RangePct     (High - Low) / Close * 100
+CORE = ("DMA_20", "DMA_50", "RSI", "AVG_VOL_20")
+CHART = ("DMA_20", "DMA_50")
+
+_DMA = re.compile(r"^DMA_(\d+)$")
+_AVG_VOL = re.compile(r"^AVG_VOL_(\d+)$")
+_RSI = re.compile(r"^RSI(?:_(\d+))?$")
+
+
+def symbol_path(symbol, data_dir="data"):
+    return os.path.join(data_dir, f"{symbol}_NS.csv")
+
+
+def compute_indicators(df, indicators=CORE):
+    """
+    Adds indicator columns to a clean price frame (returns a new frame).
+    RSI: zero average loss gives 100 (or NaN when gain is also zero),
+    the convention every legacy script used.
+    """
+    df = df.copy()
+
+    for name in indicators:
+        if name in df.columns:
+            continue
+
+        m = _DMA.match(name)
+        if m:
+            df[name] = df["Close"].rolling(int(m.group(1))).mean()
+            continue
+
+        m = _AVG_VOL.match(name)
+        if m:
+            df[name] = df["Volume"].rolling(int(m.group(1))).mean()
+            continue
+
+        m = _RSI.match(name)
+        if m:
+            window = int(m.group(1) or 14)
+            delta = df["Close"].diff()
+            gain = delta.where(delta > 0, 0.0)
+            loss = -delta.where(delta < 0, 0.0)
+            avg_gain = gain.rolling(window).mean()
+            avg_loss = loss.rolling(window).mean()
+            rs = avg_gain / avg_loss
+            df[name] = 100 - (100 / (1 + rs))
+            continue
+
+        if name == "RangePct":
+            df[name] = (df["High"] - df["Low"]) / df["Close"] * 100
+            continue
+
+        raise ValueError(f"Unknown indicator: {name}")
+
+    return df
+
+
+# -------------------------------------------------
+# IN-PROCESS LRU CACHE (BOUNDED BY MEMORY)
+# -------------------------------------------------
+_cache = OrderedDict()          # key → (frame, nbytes)
+_cache_bytes = 0
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "evictions": 0,
+          "disk_hits": 0, "disk_misses": 0}
+
+
+def _limit_bytes():
+    return int(CONFIG.get("INDICATOR_CACHE_MB", 256) * 1024 * 1024)
+
+
+def _key(file_path, indicators):
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"CSV not found: {file_path}")
+    st = os.stat(file_path)
+    return (
+        os.path.abspath(file_path),
+        st.st_mtime_ns,
+        st.st_size,
+        tuple(sorted(indicators)),
+    )
+
+
+def _get(key):
+    with _lock:
+        entry = _cache.get(key)
+        if entry is None:
+            _stats["misses"] += 1
+            return None
+        _cache.move_to_end(key)
+        _stats["hits"] += 1
+        return entry[0]
+
+
+def _put(key, frame):
+    global _cache_bytes
+
+    nbytes = int(frame.memory_usage(deep=True).sum())
+    limit = _limit_bytes()
+
+    with _lock:
+        if key in _cache:
+            return
+        if nbytes > limit:
+            return              # never cache something bigger than the cap
+
+        # drop stale versions of the same file (older mtime/size)
+        for old in [k for k in _cache if k[0] == key[0] and k[1:3] != key[1:3]]:
+            _cache_bytes -= _cache.pop(old)[1]
+
+        _cache[key] = (frame, nbytes)
+        _cache_bytes += nbytes
+
+        while _cache_bytes > limit and _cache:
+            _, (_, freed) = _cache.popitem(last=False)
+            _cache_bytes -= freed
+            _stats["evictions"] += 1
+
+
+def cache_info():
+    with _lock:
+        return {**_stats, "entries": len(_cache), "bytes": _cache_bytes,
+                "limit_bytes": _limit_bytes()}
+
+
+def clear_cache():
+    global _cache_bytes
+    with _lock:
+        _cache.clear()
+        _cache_bytes = 0
+
+
+# -------------------------------------------------
+# ON-DISK CACHE (CONTENT-ADDRESSED, SURVIVES RESTARTS)
+# -------------------------------------------------
+# data/.cache/indicators/<SYMBOL>.<INDICATORS>.<sha1>.pkl
+# sha1 covers the CSV bytes + indicator set + CACHE_VERSION, so only
+# files whose content actually changed are recomputed.
+CACHE_VERSION = 1
+
+
+def _disk_dir(file_path):
+    return os.path.join(os.path.dirname(file_path), ".cache", "indicators")
+
+
+def _disk_stem(file_path, indicators):
+    symbol = os.path.basename(file_path).replace("_NS.csv", "").replace(".csv", "")
+    signature = "-".join(sorted(indicators)) or "PRICES"
+    return f"{symbol}.{signature}"
+
+
+def _content_hash(file_path, indicators):
+    h = hashlib.sha1()
+    h.update(f"v{CACHE_VERSION}|{','.join(sorted(indicators))}|".encode())
+    with open(file_path, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+
+def _disk_load(file_path, indicators):
+    """
+    Returns (frame or None, path the frame lives / should live at).
+    """
+    cache_dir = _disk_dir(file_path)
+    digest = _content_hash(file_path, indicators)
+    path = os.path.join(cache_dir, f"{_disk_stem(file_path, indicators)}.{digest}.pkl")
+
+    if os.path.exists(path):
+        try:
+            frame = pd.read_pickle(path)
+            with _lock:
+                _stats["disk_hits"] += 1
+            return frame, path
+        except Exception:
+            pass                # corrupt / partial entry → recompute
+
+    with _lock:
+        _stats["disk_misses"] += 1
+    return None, path
+
+
+def _disk_store(path, file_path, indicators, frame):
+    """
+    Atomic write; older entries for the same symbol + indicator set go.
+    Cache failures never break a load.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        frame.to_pickle(tmp)
+        os.replace(tmp, path)
+    except OSError:
+        return
+
+    # prune after the write: another process may be pruning the same files
+    stem = _disk_stem(file_path, indicators)
+    for old in glob.glob(os.path.join(glob.escape(os.path.dirname(path)), f"{glob.escape(stem)}.*.pkl")):
+        if old != path:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+
+
+def _load_or_compute(file_path, indicators, compute):
+    if not CONFIG.get("INDICATOR_DISK_CACHE", True):
+        return compute()
+
+    frame, path = _disk_load(file_path, indicators)
+    if frame is None:
+        frame = compute()
+        _disk_store(path, file_path, indicators, frame)
+    return frame
+
+
+# -------------------------------------------------
+# PUBLIC PROVIDER
+# -------------------------------------------------
+def get_price_frame(file_path):
+    """
+    Clean Date/OHLCV frame for a CSV, parsed at most once per file version.
+    Shared object — treat as read-only.
+    """
+    key = _key(file_path, ())
+    frame = _get(key)
+    if frame is None:
+        frame = _load_or_compute(
+            file_path, (), lambda: load_price_frame(file_path)
+        )
+        _put(key, frame)
+    return frame
+
+
+def get_indicator_frame(file_path, indicators=CORE):
+    """
+    Clean price frame + requested indicator columns (NaN warm-up rows kept).
+    Memory: cached on (path, mtime, size, indicator set).
+    Disk:   cached on (CSV content hash, indicator set).
+    Shared — treat as read-only.
+    """
+    key = _key(file_path, indicators)
+    frame = _get(key)
+    if frame is None:
+        frame = _load_or_compute(
+            file_path, indicators,
+            lambda: compute_indicators(get_price_frame(file_path), indicators),
+        )
+        _put(key, frame)
+    return frame
+
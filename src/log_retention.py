@@ -0,0 +1,260 @@
+# src/log_retention.py
+
+import os
+import json
+import gzip
+import glob
+from datetime import datetime, timedelta
+
+from src.config import CONFIG
+from src.logger import LOG_DIR, read_latest_pointer
+from src.scan_store import DB_PATH, read_scan_file, connect, import_scan_file
+
+SCAN_ID_FORMAT = "%Y-%m-%d_%H-%M-%S"
+
+
+# -------------------------------------------------
+# NAMING
+# -------------------------------------------------
+def scan_time(path):
+    """
+    datetime encoded in scan_<id>.<ext> (None for foreign files).
+    """
+    name = os.path.basename(path)
+    try:
+        return datetime.strptime(name[len("scan_"):].split(".")[0], SCAN_ID_FORMAT)
+    except ValueError:
+        return None
+
+
+def archive_name(when, period="daily"):
+    """
+    daily  → scans_2026-02-06.jsonl.gz
+    weekly → scans_2026-W06.jsonl.gz (ISO week)
+    """
+    if period == "weekly":
+        year, week, _ = when.isocalendar()
+        return f"scans_{year}-W{week:02d}.jsonl.gz"
+    if period == "daily":
+        return f"scans_{when:%Y-%m-%d}.jsonl.gz"
+    raise ValueError(f"Unknown archive period: {period}")
+
+
+# -------------------------------------------------
+# ARCHIVE READ
+# -------------------------------------------------
+def read_archive(path):
+    """
+    Yields (meta, records) for every scan in an archive.
+    Each scan starts at its SCAN_META line; a later SCAN_META with the
+    same scan_id (final metrics record) updates the meta.
+    """
+    meta, records = None, []
+
+    with gzip.open(path, "rt") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            obj = json.loads(line)
+            if obj.get("type") == "SCAN_META":
+                if meta is not None and obj.get("scan_id") == meta.get("scan_id"):
+                    meta = obj
+                    continue
+                if meta is not None:
+                    yield meta, records
+                meta, records = obj, []
+            elif obj.get("type") == "DECISION":
+                records.append(obj)
+
+    if meta is not None:
+        yield meta, records
+
+
+# -------------------------------------------------
+# COMPACTION
+# -------------------------------------------------
+def _scan_lines(path):
+    meta, records = read_scan_file(path)
+    if meta is None:
+        meta = {"type": "SCAN_META", "scan_id": os.path.basename(path)[len("scan_"):].split(".")[0]}
+    return [json.dumps(meta, default=str)] + [json.dumps(r, default=str) for r in records]
+
+
+def compact_logs(log_dir=LOG_DIR, keep_days=7, period="daily", now=None,
+                 db_path=DB_PATH):
+    """
+    Moves scans older than `keep_days` into gzip archives (one per day or
+    ISO week). The scan behind logs/LATEST is never touched.
+    Returns {archive_path: [compacted scan files]}.
+    """
+    now = now or datetime.now()
+    cutoff = now - timedelta(days=keep_days)
+    archive_dir = os.path.join(log_dir, "archive")
+    latest = read_latest_pointer(log_dir)
+
+    groups = {}
+    for path in glob.glob(os.path.join(log_dir, "scan_*")):
+        if not path.endswith((".jsonl", ".npz")):
+            continue
+        when = scan_time(path)
+        if when is None or when >= cutoff:
+            continue
+        if latest and os.path.abspath(path) == os.path.abspath(latest):
+            continue
+        archive = os.path.join(archive_dir, archive_name(when, period))
+        groups.setdefault(archive, []).append(path)
+
+    if not groups:
+        return {}
+
+    # history must survive compaction → index anything not indexed yet
+    _index_missing([p for paths in groups.values() for p in paths], db_path)
+
+    os.makedirs(archive_dir, exist_ok=True)
+
+    for archive, paths in groups.items():
+        paths.sort(key=scan_time)
+        # gzip members concatenate → appending keeps earlier scans intact
+        with gzip.open(archive, "at") as out:
+            for path in paths:
+                out.write("\n".join(_scan_lines(path)) + "\n")
+        for path in paths:
+            os.remove(path)
+
+    _relocate_in_index(groups, db_path)
+    return groups
+
+
+def _index_missing(paths, db_path):
+    conn = connect(db_path)
+    try:
+        known = {row[0] for row in conn.execute("SELECT source FROM scans")}
+        for path in paths:
+            if path not in known:
+                import_scan_file(path, conn=conn)
+    finally:
+        conn.close()
+
+
+def _relocate_in_index(groups, db_path):
+    if not os.path.exists(db_path):
+        return
+    conn = connect(db_path)
+    try:
+        with conn:
+            for archive, paths in groups.items():
+                conn.executemany(
+                    "UPDATE scans SET source = ? WHERE source = ?",
+                    [(archive, p) for p in paths],
+                )
+    finally:
+        conn.close()
+
+
+# -------------------------------------------------
+# RETENTION
+# -------------------------------------------------
+def _archive_time(path):
+    stem = os.path.basename(path)[len("scans_"):].split(".")[0]
+    if "-W" in stem:
+        year, week = stem.split("-W")
+        return datetime.fromisocalendar(int(year), int(week), 7)
+    return datetime.strptime(stem, "%Y-%m-%d")
+
+
+def enforce_retention(log_dir=LOG_DIR, retain_days=365, max_mb=None, now=None,
+                      db_path=DB_PATH):
+    """
+    Deletes archives older than `retain_days`, then the oldest archives
+    until logs/ fits in `max_mb`. Raw scans and the index are never
+    size-evicted. Removed scans are dropped from the index as well.
+    Returns the list of deleted archives.
+    """
+    now = now or datetime.now()
+    archives = sorted(
+        glob.glob(os.path.join(log_dir, "archive", "scans_*.jsonl.gz")),
+        key=_archive_time,
+    )
+
+    doomed = [a for a in archives if _archive_time(a) < now - timedelta(days=retain_days)]
+
+    if max_mb is not None:
+        total = sum(
+            os.path.getsize(p)
+            for p in glob.glob(os.path.join(log_dir, "**", "*"), recursive=True)
+            if os.path.isfile(p)
+        )
+        total -= sum(os.path.getsize(a) for a in doomed)
+        for archive in archives:
+            if total <= max_mb * 1024 * 1024:
+                break
+            if archive not in doomed:
+                doomed.append(archive)
+                total -= os.path.getsize(archive)
+
+    for archive in doomed:
+        os.remove(archive)
+
+    if doomed and os.path.exists(db_path):
+        conn = connect(db_path)
+        try:
+            with conn:
+                for archive in doomed:
+                    conn.execute(
+                        "DELETE FROM decisions WHERE scan_id IN "
+                        "(SELECT scan_id FROM scans WHERE source = ?)",
+                        (archive,),
+                    )
+                    conn.execute("DELETE FROM scans WHERE source = ?", (archive,))
+        finally:
+            conn.close()
+
+    return doomed
+
+
+def apply_retention(log_dir=LOG_DIR, db_path=DB_PATH):
+    """
+    Compaction + retention with the CONFIG["LOG_RETENTION"] policy.
+    """
+    policy = CONFIG.get("LOG_RETENTION", {})
+    compacted = compact_logs(
+        log_dir,
+        keep_days=policy.get("KEEP_DAYS", 7),
+        period=policy.get("ARCHIVE_PERIOD", "daily"),
+        db_path=db_path,
+    )
+    deleted = enforce_retention(
+        log_dir,
+        retain_days=policy.get("RETAIN_DAYS", 365),
+        max_mb=policy.get("MAX_MB"),
+        db_path=db_path,
+    )
+    return compacted, deleted
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+if __name__ == "__main__":
+    import argparse
+
+    policy = CONFIG.get("LOG_RETENTION", {})
+
+    parser = argparse.ArgumentParser(description="Compact + prune scan logs")
+    parser.add_argument("--log-dir", default=LOG_DIR)
+    parser.add_argument("--keep-days", type=int, default=policy.get("KEEP_DAYS", 7),
+                        help="raw scans newer than this stay uncompressed")
+    parser.add_argument("--period", choices=["daily", "weekly"],
+                        default=policy.get("ARCHIVE_PERIOD", "daily"))
+    parser.add_argument("--retain-days", type=int, default=policy.get("RETAIN_DAYS", 365))
+    parser.add_argument("--max-mb", type=float, default=policy.get("MAX_MB"))
+    args = parser.parse_args()
+
+    compacted = compact_logs(args.log_dir, args.keep_days, args.period)
+    deleted = enforce_retention(args.log_dir, args.retain_days, args.max_mb)
+
+    for archive, paths in compacted.items():
+        print(f"🗜️  {archive} ← {len(paths)} scan(s)")
+    for archive in deleted:
+        print(f"🗑️  Removed {archive}")
+    print(f"✅ Compacted: {sum(len(p) for p in compacted.values())} | Removed archives: {len(deleted)}")
@@ -1,99 +1,277 @@
 import os
 import json
+import time
+import atexit
+import threading
 from datetime import datetime
 
-print("LOGGER CWD:", os.getcwd())
+from src.config import CONFIG
 
+try:
+    import fcntl                # POSIX only → cross-process flush lock
+except ImportError:
+    fcntl = None
 
 # -------------------------------------------------
-# LOG DIRECTORY
+# LOG DIRECTORY (created on first write, not on import)
 # -------------------------------------------------
 LOG_DIR = "logs"
-os.makedirs(LOG_DIR, exist_ok=True)
+
+# logs/LATEST holds the file name of the newest finished scan
+LATEST_POINTER = os.path.join(LOG_DIR, "LATEST")
+
+# "jsonl" (one JSON line per record) or "columnar" (.npz, src.scan_columnar)
+SCAN_FORMATS = ("jsonl", "columnar")
 
 # -------------------------------------------------
-# CREATE UNIQUE LOG FILE PER SCAN
+# UNIQUE LOG FILE PER SCAN
 # -------------------------------------------------
-SCAN_TIMESTAMP = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-SCAN_LOG_FILE = os.path.join(LOG_DIR, f"scan_{SCAN_TIMESTAMP}.jsonl")
+def new_scan_id():
+    return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+
+def scan_log_path(scan_id, fmt="jsonl"):
+    ext = ".npz" if fmt == "columnar" else ".jsonl"
+    return os.path.join(LOG_DIR, f"scan_{scan_id}{ext}")
 
 # -------------------------------------------------
-# INTERNAL: JSON SAFETY
+# BUFFERED SCAN WRITER
 # -------------------------------------------------
-def _json_safe(value):
+class ScanWriter:
+    """
+    Keeps ONE file handle open and writes records in batches.
+    - each record is serialized exactly once (default=str → logger
+      never crashes on non-JSON values)
+    - flushes every `batch_size` records or `flush_interval` seconds
+    - thread-safe (lock); process-safe for appends: every flush is a
+      single O_APPEND write, serialized with flock where available
+    """
+
+    def __init__(self, path, mode="a", batch_size=64, flush_interval=1.0):
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+        if mode == "w":
+            flags |= os.O_TRUNC
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._fd = os.open(path, flags, 0o644)
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._closed = False
+
+        self._stop = threading.Event()
+        self._timer = None
+        if flush_interval:
+            self._timer = threading.Thread(target=self._flush_loop, daemon=True)
+            self._timer.start()
+
+    # ---------- public ----------
+    def write(self, record):
+        line = _encoder.encode(record) + "\n"
+        with self._lock:
+            if self._closed:
+                raise ValueError("ScanWriter is closed")
+            self._buffer.append(line)
+            if len(self._buffer) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._closed = True
+            os.close(self._fd)
+        self._stop.set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- internal ----------
+    def _flush_locked(self):
+        if not self._buffer or self._closed:
+            return
+        data = "".join(self._buffer).encode("utf-8")
+        self._buffer.clear()
+
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(self._fd, view)
+                view = view[written:]
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+        self._last_flush = time.monotonic()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            with self._lock:
+                if time.monotonic() - self._last_flush >= self.flush_interval:
+                    self._flush_locked()
+
+
+_encoder = json.JSONEncoder(default=str)
+_writer = None
+_scan_id = None                 # assigned when a scan starts, not at import
+_scan_meta = None
+_scan_file = None
+
+
+def current_scan_id():
+    return _scan_id
+
+
+def current_scan_file():
     """
-    Ensures any value is JSON serializable.
-    Converts unsupported objects to string.
-    Logger must NEVER crash.
+    Path the current scan is written to (.jsonl or .npz).
+    """
+    return _scan_file
+
+
+def _start_scan(fmt="jsonl"):
+    global _scan_id, _scan_file
+    _scan_id = new_scan_id()
+    _scan_file = scan_log_path(_scan_id, fmt)
+    return _scan_id
+
+
+def _scan_writer():
+    global _writer
+    if _writer is None:
+        if _scan_file is None:
+            _start_scan()       # decisions logged without metadata
+        _writer = ScanWriter(_scan_file)
+    return _writer
+
+
+def close_scan_log(complete=False):
+    """
+    Flushes + closes the current scan log.
+    complete=True (scan ran to the end) also points logs/LATEST at it;
+    the atexit call after a crash leaves LATEST on the last full scan.
+    """
+    global _writer
+    if _writer is not None:
+        _writer.close()
+        _writer = None
+        if complete:
+            write_latest_pointer(_scan_file)
+
+
+def write_latest_pointer(path):
+    """
+    Atomically points logs/LATEST at a scan file (O(1) latest lookup).
+    """
+    os.makedirs(LOG_DIR, exist_ok=True)
+    tmp = f"{LATEST_POINTER}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(os.path.basename(path) + "\n")
+    os.replace(tmp, LATEST_POINTER)
+
+
+def read_latest_pointer(log_dir=LOG_DIR):
+    """
+    Path from <log_dir>/LATEST, or None if missing / pointing at nothing.
     """
     try:
-        json.dumps(value)
-        return value
-    except TypeError:
-        return str(value)
+        with open(os.path.join(log_dir, "LATEST"), "r") as f:
+            name = f.read().strip()
+    except OSError:
+        return None
+    path = os.path.join(log_dir, name)
+    return path if name and os.path.exists(path) else None
+
+
+atexit.register(close_scan_log)
 
 # -------------------------------------------------
 # SCAN METADATA (MUST BE FIRST LINE)
 # -------------------------------------------------
-def log_scan_metadata(style, total_symbols):
+def log_scan_metadata(style, total_symbols, fmt=None):
     """
     Writes scan-level metadata.
     MUST be called ONCE before logging any decisions.
+    fmt: "jsonl" | "columnar" (default: CONFIG["SCAN_LOG_FORMAT"])
     """
+    global _writer, _scan_meta
+
+    fmt = fmt or CONFIG.get("SCAN_LOG_FORMAT", "jsonl")
+    if fmt not in SCAN_FORMATS:
+        raise ValueError(f"Unknown scan log format: {fmt}")
+
+    # Overwrite file to guarantee clean scan
+    close_scan_log()
+    scan_id = _start_scan(fmt)
+
     meta = {
         "type": "SCAN_META",
         "scan_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "style": _json_safe(style),
+        "style": style,
         "total_symbols": int(total_symbols),
-        "scan_id": SCAN_TIMESTAMP
+        "scan_id": scan_id
     }
+    _scan_meta = meta
 
-    # Overwrite file to guarantee clean scan
-    with open(SCAN_LOG_FILE, "w") as f:
-        f.write(json.dumps(meta) + "\n")
+    if fmt == "columnar":
+        from src.scan_columnar import ColumnarScanWriter
+
+        _writer = ColumnarScanWriter(_scan_file)
+    else:
+        _writer = ScanWriter(_scan_file, mode="w")
+    _writer.write(meta)
+
+def log_scan_summary(metrics):
+    """
+    Appends a final SCAN_META (same fields + "metrics") once the scan is
+    done. Readers keep the LAST SCAN_META of a scan.
+    """
+    if _scan_meta is None:
+        return
+    _scan_writer().write({**_scan_meta, "metrics": metrics})
 
 # -------------------------------------------------
 # LOG PER-STOCK DECISION
 # -------------------------------------------------
 def log_decision(symbol, result):
     """
-    Appends ONE stock decision as ONE JSON line.
+    Buffers ONE stock decision as ONE JSON line.
     Hardened against non-JSON objects.
     """
     if not result or not isinstance(result, dict):
         return  # safety guard
 
-    # -----------------------------
-    # TRACE SANITIZATION (CRITICAL)
-    # -----------------------------
-    raw_trace = result.get("trace", [])
-    safe_trace = []
-
-    for step in raw_trace:
-        if isinstance(step, dict):
-            safe_trace.append(
-                {k: _json_safe(v) for k, v in step.items()}
-            )
-        else:
-            safe_trace.append(_json_safe(step))
-
     record = {
         "type": "DECISION",
         "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "symbol": _json_safe(symbol),
-        "decision": _json_safe(result.get("decision")),
-        "reason": [_json_safe(r) for r in result.get("reason", [])],
-        "trace": safe_trace,
-        "entry": _json_safe(result.get("entry")),
-        "stop": _json_safe(result.get("stop")),
-        "target": _json_safe(result.get("target")),
-        "qty": _json_safe(result.get("qty")),
-        "holding": _json_safe(result.get("holding")),
-        "style": _json_safe(result.get("style")),
+        "symbol": symbol,
+        "decision": result.get("decision"),
+        "reason": list(result.get("reason", [])),
+        "trace": result.get("trace", []),
+        "entry": result.get("entry"),
+        "stop": result.get("stop"),
+        "target": result.get("target"),
+        "qty": result.get("qty"),
+        "holding": result.get("holding"),
+        "style": result.get("style"),
     }
 
-    with open(SCAN_LOG_FILE, "a") as f:
-        f.write(json.dumps(record) + "\n")
+    _scan_writer().write(record)
 
 # -------------------------------------------------
 # OPTIONAL: LOAD LATEST SCAN FILE
@@ -101,7 +279,22 @@ def log_decision(symbol, result):
 def load_latest_scan_file():
     """
     Returns path to latest scan log file.
+    Reads the logs/LATEST pointer; falls back to the scan index, then to
+    listing LOG_DIR (first run / pointer lost).
     """
+    path = read_latest_pointer()
+    if path:
+        return path
+
+    from src.scan_store import latest_scan
+
+    meta = latest_scan()
+    if meta and meta.get("source") and os.path.exists(meta["source"]):
+        return meta["source"]
+
+    if not os.path.isdir(LOG_DIR):
+        return None
+
     files = sorted(
         [f for f in os.listdir(LOG_DIR) if f.startswith("scan_")],
         reverse=True
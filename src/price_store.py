@@ -0,0 +1,175 @@
+# src/price_store.py
+
+import os
+import json
+import numpy as np
+
+from src.data_adapter import load_price_frame
+
+# -------------------------------------------------
+# STORE LAYOUT
+# -------------------------------------------------
+# data/.store/<SYMBOL>/date.npy     datetime64[D]
+# data/.store/<SYMBOL>/open.npy     float64
+# data/.store/<SYMBOL>/high.npy     float64
+# data/.store/<SYMBOL>/low.npy      float64
+# data/.store/<SYMBOL>/close.npy    float64
+# data/.store/<SYMBOL>/volume.npy   int64
+# data/.store/manifest.json         source mtime/size per symbol
+DATA_DIR = "data"
+STORE_DIR = os.path.join(DATA_DIR, ".store")
+MANIFEST_FILE = "manifest.json"
+
+COLUMNS = {
+    "date": "datetime64[D]",
+    "open": "float64",
+    "high": "float64",
+    "low": "float64",
+    "close": "float64",
+    "volume": "int64",
+}
+
+
+# -------------------------------------------------
+# INTERNAL: MANIFEST
+# -------------------------------------------------
+def _manifest_path(store_dir):
+    return os.path.join(store_dir, MANIFEST_FILE)
+
+
+def _read_manifest(store_dir):
+    path = _manifest_path(store_dir)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _write_manifest(store_dir, manifest):
+    path = _manifest_path(store_dir)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def _source_signature(csv_path):
+    st = os.stat(csv_path)
+    return {"mtime": st.st_mtime, "size": st.st_size}
+
+
+# -------------------------------------------------
+# INGESTION (CSV → COLUMNAR, ONCE)
+# -------------------------------------------------
+def ingest_csv(csv_path, store_dir=STORE_DIR):
+    """
+    Converts ONE yfinance CSV into columnar .npy arrays.
+    All regex / date parsing / numeric coercion happens here, never on read.
+    Returns the symbol written.
+    """
+    symbol = os.path.basename(csv_path).replace("_NS.csv", "")
+    df = load_price_frame(csv_path)
+
+    sym_dir = os.path.join(store_dir, symbol)
+    os.makedirs(sym_dir, exist_ok=True)
+
+    arrays = {
+        "date": df["Date"].to_numpy(dtype="datetime64[D]"),
+        "open": df["Open"].to_numpy(dtype="float64"),
+        "high": df["High"].to_numpy(dtype="float64"),
+        "low": df["Low"].to_numpy(dtype="float64"),
+        "close": df["Close"].to_numpy(dtype="float64"),
+        "volume": df["Volume"].to_numpy(dtype="int64"),
+    }
+
+    # write to tmp files, then swap in → readers never see half a symbol
+    for name, arr in arrays.items():
+        final = os.path.join(sym_dir, f"{name}.npy")
+        tmp = os.path.join(sym_dir, f"{name}.tmp.npy")
+        np.save(tmp, np.ascontiguousarray(arr, dtype=COLUMNS[name]))
+        os.replace(tmp, final)
+
+    return symbol
+
+
+def build_price_store(data_dir=DATA_DIR, store_dir=STORE_DIR, force=False):
+    """
+    Ingests every `<SYM>_NS.csv` in data_dir.
+    Unchanged files (same mtime + size) are skipped unless force=True.
+    Returns {"ingested": [...], "skipped": [...], "failed": {sym: error}}.
+    """
+    os.makedirs(store_dir, exist_ok=True)
+    manifest = _read_manifest(store_dir)
+
+    summary = {"ingested": [], "skipped": [], "failed": {}}
+
+    for file in sorted(os.listdir(data_dir)):
+        if not file.endswith("_NS.csv"):
+            continue
+
+        csv_path = os.path.join(data_dir, file)
+        symbol = file.replace("_NS.csv", "")
+        signature = _source_signature(csv_path)
+
+        if not force and manifest.get(symbol) == signature:
+            summary["skipped"].append(symbol)
+            continue
+
+        try:
+            ingest_csv(csv_path, store_dir)
+        except Exception as e:
+            summary["failed"][symbol] = str(e)
+            manifest.pop(symbol, None)
+            continue
+
+        manifest[symbol] = signature
+        summary["ingested"].append(symbol)
+
+    _write_manifest(store_dir, manifest)
+    return summary
+
+
+# -------------------------------------------------
+# READ PATH (ZERO-COPY)
+# -------------------------------------------------
+def is_fresh(symbol, data_dir=DATA_DIR, store_dir=STORE_DIR, manifest=None):
+    """
+    True when the store holds `symbol` and its source CSV has not changed.
+    """
+    if manifest is None:
+        manifest = _read_manifest(store_dir)
+
+    entry = manifest.get(symbol)
+    if entry is None:
+        return False
+
+    csv_path = os.path.join(data_dir, f"{symbol}_NS.csv")
+    if not os.path.exists(csv_path):
+        # store-only universe (CSV archived) → trust the store
+        return True
+
+    return entry == _source_signature(csv_path)
+
+
+def load_prices(symbol, store_dir=STORE_DIR):
+    """
+    Returns {column: np.ndarray} memory-mapped read-only.
+    Slicing these arrays never copies.
+    """
+    sym_dir = os.path.join(store_dir, symbol)
+    if not os.path.isdir(sym_dir):
+        raise FileNotFoundError(f"Symbol not in price store: {symbol}")
+
+    return {
+        name: np.load(os.path.join(sym_dir, f"{name}.npy"), mmap_mode="r")
+        for name in COLUMNS
+    }
+
+
+# ---------------- ENTRY POINT ----------------
+if __name__ == "__main__":
+    result = build_price_store()
+    print(f"✅ Ingested : {len(result['ingested'])}")
+    print(f"⏭️  Skipped  : {len(result['skipped'])}")
+    for sym, err in result["failed"].items():
+        print(f"❌ {sym}: {err}")
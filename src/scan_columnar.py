@@ -0,0 +1,283 @@
+# src/scan_columnar.py
+
+import os
+import json
+
+import numpy as np
+
+from src.decision_engine import DECISION_LABELS, RULE_BITS
+
+# -------------------------------------------------
+# LAYOUT (one .npz per scan)
+# -------------------------------------------------
+# table          structured array, one row per DECISION (typed columns)
+# trace_ids      int32, all trace steps back to back (row → trace_start/len)
+# trace_vocab    unique trace steps as JSON (dictionary encoding)
+# reason_ids     int32, same scheme for reasons
+# reason_vocab   unique reason strings
+# holding_vocab / style_vocab   small string dictionaries
+# meta           SCAN_META as JSON
+EXTENSION = ".npz"
+
+TABLE_DTYPE = np.dtype([
+    ("symbol", "U32"),
+    ("decision", "i1"),         # index into DECISION_LABELS, -1 = unknown
+    ("timestamp", "M8[s]"),
+    ("entry", "f8"),            # NaN when no trade plan
+    ("stop", "f8"),
+    ("target", "f8"),
+    ("qty", "i4"),              # -1 when no trade plan
+    ("holding", "i2"),          # index into holding_vocab, -1 = None
+    ("style", "i2"),            # index into style_vocab, -1 = None
+    ("evaluated", "u1"),        # RULE_BITS of rules present in the trace
+    ("passed", "u1"),           # RULE_BITS of rules that passed
+    ("trace_start", "i4"),
+    ("trace_len", "i2"),
+    ("reason_start", "i4"),
+    ("reason_len", "i2"),
+])
+
+_DECISION_CODES = {label: code for code, label in enumerate(DECISION_LABELS)}
+
+
+# -------------------------------------------------
+# INTERNAL: DICTIONARY ENCODING
+# -------------------------------------------------
+class _Vocab:
+    def __init__(self):
+        self.index = {}
+
+    def code(self, value):
+        if value is None:
+            return -1
+        return self.index.setdefault(value, len(self.index))
+
+    def array(self):
+        return np.array(list(self.index), dtype=str)
+
+
+def _num(value, missing):
+    return missing if value is None else value
+
+
+def encode_scan(meta, records):
+    """
+    (meta, DECISION records) → dict of NumPy arrays (see LAYOUT).
+    """
+    table = np.zeros(len(records), dtype=TABLE_DTYPE)
+
+    traces, reasons = _Vocab(), _Vocab()
+    holdings, styles = _Vocab(), _Vocab()
+    trace_ids, reason_ids = [], []
+
+    for i, r in enumerate(records):
+        row = table[i]
+        row["symbol"] = r.get("symbol") or ""
+        row["decision"] = _DECISION_CODES.get(r.get("decision"), -1)
+        row["timestamp"] = np.datetime64(r["timestamp"]) if r.get("timestamp") else np.datetime64("NaT")
+        row["entry"] = _num(r.get("entry"), np.nan)
+        row["stop"] = _num(r.get("stop"), np.nan)
+        row["target"] = _num(r.get("target"), np.nan)
+        row["qty"] = _num(r.get("qty"), -1)
+        row["holding"] = holdings.code(r.get("holding"))
+        row["style"] = styles.code(r.get("style"))
+
+        evaluated = passed = 0
+        row["trace_start"] = len(trace_ids)
+        for step in r.get("trace", []):
+            if isinstance(step, dict):      # plain markers, e.g. "BLOCKED_BY_RISK"
+                bit = RULE_BITS.get(step.get("rule"), 0)
+                evaluated |= bit
+                if step.get("result") == "PASS":
+                    passed |= bit
+            trace_ids.append(traces.code(json.dumps(step, default=str)))
+        row["trace_len"] = len(trace_ids) - row["trace_start"]
+        row["evaluated"] = evaluated
+        row["passed"] = passed
+
+        row["reason_start"] = len(reason_ids)
+        for reason in r.get("reason", []):
+            reason_ids.append(reasons.code(str(reason)))
+        row["reason_len"] = len(reason_ids) - row["reason_start"]
+
+    return {
+        "table": table,
+        "trace_ids": np.array(trace_ids, dtype="int32"),
+        "trace_vocab": traces.array(),
+        "reason_ids": np.array(reason_ids, dtype="int32"),
+        "reason_vocab": reasons.array(),
+        "holding_vocab": holdings.array(),
+        "style_vocab": styles.array(),
+        "meta": np.array(json.dumps(meta or {}, default=str)),
+    }
+
+
+# -------------------------------------------------
+# WRITE / READ
+# -------------------------------------------------
+def write_scan(path, meta, records):
+    """
+    Atomic write of one scan as a compressed .npz.
+    """
+    arrays = encode_scan(meta, records)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        np.savez_compressed(f, **arrays)
+    os.replace(tmp, path)
+    return path
+
+
+def read_scan(path):
+    """
+    Loads the arrays back. Nothing is parsed per record:
+    table columns are ready to filter / sort; trace/reason stay encoded.
+    """
+    with np.load(path, allow_pickle=False) as data:
+        scan = {k: data[k] for k in data.files}
+    scan["meta"] = json.loads(str(scan["meta"]))
+    return scan
+
+
+def decision_labels(scan):
+    """
+    Decision column as strings (vectorized lookup).
+    """
+    labels = np.array(DECISION_LABELS + ("",), dtype=str)
+    return labels[scan["table"]["decision"]]
+
+
+def _lookup(vocab, code):
+    return None if code < 0 else str(vocab[code])
+
+
+def row_trace(scan, i):
+    """
+    Decodes ONE row's trace (the only per-record JSON in the file).
+    """
+    row = scan["table"][i]
+    t0, tn = int(row["trace_start"]), int(row["trace_len"])
+    return [json.loads(scan["trace_vocab"][k]) for k in scan["trace_ids"][t0:t0 + tn]]
+
+
+def row_record(scan, i, trace=True):
+    """
+    Decodes ONE row back into the JSONL DECISION record shape.
+    trace=False skips the JSON trace decode (see row_trace).
+    """
+    row = scan["table"][i]
+
+    r0, rn = int(row["reason_start"]), int(row["reason_len"])
+
+    ts = row["timestamp"]
+    record = {
+        "type": "DECISION",
+        "timestamp": None if np.isnat(ts) else str(ts).replace("T", " "),
+        "symbol": str(row["symbol"]),
+        "decision": _lookup(np.array(DECISION_LABELS), int(row["decision"])),
+        "reason": [str(scan["reason_vocab"][k]) for k in scan["reason_ids"][r0:r0 + rn]],
+        "trace": row_trace(scan, i) if trace else None,
+        "entry": None if np.isnan(row["entry"]) else float(row["entry"]),
+        "stop": None if np.isnan(row["stop"]) else float(row["stop"]),
+        "target": None if np.isnan(row["target"]) else float(row["target"]),
+        "qty": None if row["qty"] < 0 else int(row["qty"]),
+        "holding": _lookup(scan["holding_vocab"], int(row["holding"])),
+        "style": _lookup(scan["style_vocab"], int(row["style"])),
+    }
+    if not trace:
+        del record["trace"]
+    return record
+
+
+def to_records(scan):
+    """
+    Full decode → (meta, records), same as reading the JSONL.
+    """
+    return scan["meta"], [row_record(scan, i) for i in range(len(scan["table"]))]
+
+
+# -------------------------------------------------
+# JSONL COMPATIBILITY
+# -------------------------------------------------
+def export_jsonl(npz_path, jsonl_path=None):
+    """
+    Writes the classic scan_*.jsonl next to (or instead of) the .npz.
+    """
+    jsonl_path = jsonl_path or npz_path[: -len(EXTENSION)] + ".jsonl"
+    meta, records = to_records(read_scan(npz_path))
+
+    lines = [json.dumps(meta, default=str)] + [json.dumps(r, default=str) for r in records]
+    with open(jsonl_path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    return jsonl_path
+
+
+def convert_jsonl(jsonl_path, npz_path=None):
+    """
+    scan_*.jsonl → scan_*.npz.
+    """
+    from src.scan_store import read_scan_file
+
+    npz_path = npz_path or os.path.splitext(jsonl_path)[0] + EXTENSION
+    meta, records = read_scan_file(jsonl_path)
+    return write_scan(npz_path, meta, records)
+
+
+# -------------------------------------------------
+# LOGGER BACKEND
+# -------------------------------------------------
+class ColumnarScanWriter:
+    """
+    Same write()/flush()/close() surface as logger.ScanWriter.
+    Records are kept in memory and written as ONE .npz on close().
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.meta = None
+        self.records = []
+        self._closed = False
+
+    def write(self, record):
+        if self._closed:
+            raise ValueError("ColumnarScanWriter is closed")
+        if record.get("type") == "SCAN_META":
+            self.meta = record
+        else:
+            self.records.append(record)
+
+    def flush(self):
+        pass                    # single write happens on close()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        write_scan(self.path, self.meta, self.records)
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Columnar scan files")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_export = sub.add_parser("export", help=".npz → .jsonl")
+    p_export.add_argument("path")
+    p_export.add_argument("--out")
+
+    p_convert = sub.add_parser("convert", help=".jsonl → .npz")
+    p_convert.add_argument("path")
+    p_convert.add_argument("--out")
+
+    args = parser.parse_args()
+
+    if args.command == "export":
+        out = export_jsonl(args.path, args.out)
+    else:
+        out = convert_jsonl(args.path, args.out)
+
+    print(f"✅ Written: {out} ({os.path.getsize(out):,} bytes)")
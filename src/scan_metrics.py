@@ -0,0 +1,280 @@
+# src/scan_metrics.py
+
+import os
+import sys
+import math
+import time
+from contextlib import contextmanager
+
+# -------------------------------------------------
+# STAGES
+# -------------------------------------------------
+# load       price store / CSV → snapshot (includes indicators)
+# indicators indicator frame / incremental state, inside load
+# engine     make_decision
+# risk       calculate_trade
+# log        log_decision (parent process)
+# universe   vectorized indicator pass (--vectorized only)
+STAGES = ("load", "indicators", "engine", "risk", "log", "universe")
+
+# per-symbol latency histogram upper bounds (seconds)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0)
+
+CACHE_COUNTERS = ("hits", "misses", "evictions", "disk_hits", "disk_misses")
+
+
+def _percentile(sorted_values, q):
+    """
+    Nearest-rank percentile of an already sorted list.
+
+    >>> _percentile(list(range(1, 11)), 50)
+    5
+    >>> _percentile(list(range(1, 21)), 95)
+    19
+    >>> _percentile(list(range(1, 11)), 0), _percentile(list(range(1, 11)), 100)
+    (1, 10)
+    """
+    if not sorted_values:
+        return None
+    k = max(0, min(len(sorted_values) - 1, math.ceil(q * len(sorted_values) / 100) - 1))
+    return sorted_values[k]
+
+
+def cache_counters():
+    """
+    src.indicators cache counters for this process (zeros if unused).
+    """
+    indicators = sys.modules.get("src.indicators")
+    if indicators is None:
+        return dict.fromkeys(CACHE_COUNTERS, 0)
+    info = indicators.cache_info()
+    return {k: info[k] for k in CACHE_COUNTERS}
+
+
+# -------------------------------------------------
+# RECORDER
+# -------------------------------------------------
+class ScanMetrics:
+    """
+    Per-stage wall / CPU totals, per-symbol latency and cache counters
+    for ONE scan. Worker processes keep their own and ship deltas back.
+    """
+
+    def __init__(self):
+        self.wall = dict.fromkeys(STAGES, 0.0)
+        self.cpu = dict.fromkeys(STAGES, 0.0)
+        self.calls = dict.fromkeys(STAGES, 0)
+        self.latencies = []
+        self.cache = dict.fromkeys(CACHE_COUNTERS, 0)
+        self._cache_start = cache_counters()
+        self._cache_merged = dict.fromkeys(CACHE_COUNTERS, 0)    # same-process parts
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self.total_wall = None
+        self.total_cpu = None
+
+    # ---------- recording ----------
+    def add_stage(self, name, wall, cpu, calls=1):
+        self.wall[name] = self.wall.get(name, 0.0) + wall
+        self.cpu[name] = self.cpu.get(name, 0.0) + cpu
+        self.calls[name] = self.calls.get(name, 0) + calls
+
+    def observe_symbol(self, seconds):
+        self.latencies.append(seconds)
+
+    def merge(self, part):
+        """
+        Adds a worker's per-symbol measurement (see measure_symbol).
+        """
+        for name, (wall, cpu, calls) in part["stages"].items():
+            self.add_stage(name, wall, cpu, calls)
+        self.observe_symbol(part["latency"])
+        for k, v in part["cache"].items():
+            self.cache[k] += v
+            if part["pid"] == os.getpid():
+                self._cache_merged[k] += v
+
+    def finish(self):
+        """
+        Stops the clocks and adds this process's own cache events
+        (those not already merged from same-process parts).
+        """
+        self.total_wall = time.perf_counter() - self._wall_start
+        self.total_cpu = time.process_time() - self._cpu_start
+        now = cache_counters()
+        for k in CACHE_COUNTERS:
+            self.cache[k] += now[k] - self._cache_start[k] - self._cache_merged[k]
+        return self
+
+    # ---------- reporting ----------
+    def latency_summary(self):
+        values = sorted(self.latencies)
+        if not values:
+            return {"count": 0}
+        return {
+            "count": len(values),
+            "mean": sum(values) / len(values),
+            "p50": _percentile(values, 50),
+            "p95": _percentile(values, 95),
+            "p99": _percentile(values, 99),
+            "max": values[-1],
+        }
+
+    def histogram(self):
+        """
+        Cumulative counts per LATENCY_BUCKETS bound (+Inf last).
+        """
+        counts = []
+        values = sorted(self.latencies)
+        i = 0
+        for bound in LATENCY_BUCKETS:
+            while i < len(values) and values[i] <= bound:
+                i += 1
+            counts.append(i)
+        counts.append(len(values))
+        return counts
+
+    def to_dict(self):
+        stages = {
+            name: {
+                "wall_s": round(self.wall[name], 6),
+                "cpu_s": round(self.cpu[name], 6),
+                "calls": self.calls[name],
+            }
+            for name in self.wall if self.calls[name]
+        }
+        latency = {
+            k: (round(v, 6) if isinstance(v, float) else v)
+            for k, v in self.latency_summary().items()
+        }
+        return {
+            "total_wall_s": None if self.total_wall is None else round(self.total_wall, 6),
+            "total_cpu_s": None if self.total_cpu is None else round(self.total_cpu, 6),
+            "stages": stages,
+            "symbol_latency": latency,
+            "latency_buckets": list(LATENCY_BUCKETS),
+            "latency_histogram": self.histogram(),
+            "indicator_cache": dict(self.cache),
+        }
+
+
+# -------------------------------------------------
+# STAGE TIMER (no-op unless a recorder is active)
+# -------------------------------------------------
+_active = None
+
+
+def activate(metrics):
+    global _active
+    _active = metrics
+
+
+def deactivate():
+    global _active
+    _active = None
+
+
+@contextmanager
+def stage(name):
+    metrics = _active
+    if metrics is None:
+        yield
+        return
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        metrics.add_stage(
+            name, time.perf_counter() - wall0, time.process_time() - cpu0
+        )
+
+
+def measure_symbol(fn, *args):
+    """
+    Runs fn(*args) with a private recorder.
+    Returns (result, part) — part is picklable and goes to ScanMetrics.merge.
+    """
+    global _active
+    previous = _active
+    local = ScanMetrics()
+    _active = local
+    t0 = time.perf_counter()
+    try:
+        result = fn(*args)
+    finally:
+        latency = time.perf_counter() - t0
+        _active = previous
+
+    now = cache_counters()
+    part = {
+        "stages": {
+            name: (local.wall[name], local.cpu[name], local.calls[name])
+            for name in local.wall if local.calls[name]
+        },
+        "latency": latency,
+        "pid": os.getpid(),
+        "cache": {k: now[k] - local._cache_start[k] for k in CACHE_COUNTERS},
+    }
+    return result, part
+
+
+# -------------------------------------------------
+# PROMETHEUS TEXT EXPORT
+# -------------------------------------------------
+def to_prometheus(metrics, prefix="smartswing_scan", labels=None):
+    """
+    Prometheus text exposition format for one scan's metrics dict.
+    """
+    base = dict(labels or {})
+
+    def _labels(**extra):
+        items = sorted(base.items()) + list(extra.items())
+        if not items:
+            return ""
+        return "{" + ",".join(f'{k}="{v}"' for k, v in items) + "}"
+
+    lines = [
+        f"# HELP {prefix}_duration_seconds Wall time of the whole scan.",
+        f"# TYPE {prefix}_duration_seconds gauge",
+        f"{prefix}_duration_seconds{_labels()} {metrics['total_wall_s'] or 0}",
+        f"# HELP {prefix}_stage_seconds Wall / CPU time per pipeline stage.",
+        f"# TYPE {prefix}_stage_seconds gauge",
+    ]
+    for name, s in metrics["stages"].items():
+        lines.append(f"{prefix}_stage_seconds{_labels(stage=name, clock='wall')} {s['wall_s']}")
+        lines.append(f"{prefix}_stage_seconds{_labels(stage=name, clock='cpu')} {s['cpu_s']}")
+
+    latency = metrics["symbol_latency"]
+    total = latency["mean"] * latency["count"] if latency.get("count") else 0.0
+
+    lines += [
+        f"# HELP {prefix}_symbol_latency_seconds Per-symbol scan latency.",
+        f"# TYPE {prefix}_symbol_latency_seconds histogram",
+    ]
+    bounds = [str(b) for b in metrics["latency_buckets"]] + ["+Inf"]
+    for bound, count in zip(bounds, metrics["latency_histogram"]):
+        lines.append(f"{prefix}_symbol_latency_seconds_bucket{_labels(le=bound)} {count}")
+    lines.append(f"{prefix}_symbol_latency_seconds_sum{_labels()} {round(total, 6)}")
+    lines.append(f"{prefix}_symbol_latency_seconds_count{_labels()} {latency.get('count', 0)}")
+
+    lines += [
+        f"# HELP {prefix}_indicator_cache_total Indicator cache events.",
+        f"# TYPE {prefix}_indicator_cache_total counter",
+    ]
+    for event, value in metrics["indicator_cache"].items():
+        lines.append(f"{prefix}_indicator_cache_total{_labels(event=event)} {value}")
+
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path, metrics, labels=None):
+    """
+    Atomic write (node_exporter textfile collector friendly).
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(to_prometheus(metrics, labels=labels))
+    os.replace(tmp, path)
+    return path
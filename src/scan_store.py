@@ -0,0 +1,350 @@
+# src/scan_store.py
+
+import os
+import json
+import glob
+import sqlite3
+
+# -------------------------------------------------
+# LOCATION
+# -------------------------------------------------
+LOG_DIR = "logs"
+DB_PATH = os.path.join(LOG_DIR, "scans.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scans (
+    scan_id        TEXT PRIMARY KEY,
+    scan_time      TEXT,
+    style          TEXT,
+    total_symbols  INTEGER,
+    source         TEXT,
+    metrics        TEXT
+);
+
+CREATE TABLE IF NOT EXISTS decisions (
+    scan_id    TEXT NOT NULL,
+    symbol     TEXT NOT NULL,
+    decision   TEXT,
+    timestamp  TEXT,
+    entry      REAL,
+    stop       REAL,
+    target     REAL,
+    qty        INTEGER,
+    holding    TEXT,
+    style      TEXT,
+    reason     TEXT,
+    trace      TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_decisions_scan     ON decisions (scan_id);
+CREATE INDEX IF NOT EXISTS idx_decisions_symbol   ON decisions (symbol, scan_id);
+CREATE INDEX IF NOT EXISTS idx_decisions_decision ON decisions (decision, scan_id);
+"""
+
+DECISION_COLUMNS = [
+    "scan_id", "symbol", "decision", "timestamp", "entry", "stop",
+    "target", "qty", "holding", "style", "reason", "trace",
+]
+
+
+# -------------------------------------------------
+# CONNECTION
+# -------------------------------------------------
+def connect(db_path=DB_PATH):
+    """
+    Opens (and if needed creates) the scan index.
+    """
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    _migrate(conn)
+    return conn
+
+
+def _migrate(conn):
+    # indexes created before scan metrics existed
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(scans)")}
+    if "metrics" not in columns:
+        conn.execute("ALTER TABLE scans ADD COLUMN metrics TEXT")
+
+
+# -------------------------------------------------
+# WRITE
+# -------------------------------------------------
+def _decision_row(scan_id, record):
+    return (
+        scan_id,
+        record.get("symbol"),
+        record.get("decision"),
+        record.get("timestamp"),
+        record.get("entry"),
+        record.get("stop"),
+        record.get("target"),
+        record.get("qty"),
+        None if record.get("holding") is None else str(record.get("holding")),
+        record.get("style"),
+        json.dumps(record.get("reason", []), default=str),
+        json.dumps(record.get("trace", []), default=str),
+    )
+
+
+def index_scan(conn, meta, records, source=None):
+    """
+    Stores ONE scan (meta + decision records). Re-indexing the same
+    scan_id replaces it.
+    """
+    scan_id = meta["scan_id"]
+
+    with conn:
+        conn.execute("DELETE FROM decisions WHERE scan_id = ?", (scan_id,))
+        metrics = meta.get("metrics")
+        conn.execute(
+            "INSERT OR REPLACE INTO scans "
+            "(scan_id, scan_time, style, total_symbols, source, metrics) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (scan_id, meta.get("scan_time"), meta.get("style"),
+             meta.get("total_symbols"), source,
+             None if metrics is None else json.dumps(metrics, default=str)),
+        )
+        conn.executemany(
+            f"INSERT INTO decisions ({', '.join(DECISION_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(DECISION_COLUMNS))})",
+            (_decision_row(scan_id, r) for r in records),
+        )
+
+
+def read_scan_file(path):
+    """
+    Parses one scan log → (meta, records). The last SCAN_META wins.
+    .npz scans (src.scan_columnar) are decoded from their columns.
+    """
+    if path.endswith(".npz"):
+        from src.scan_columnar import read_scan, to_records
+        return to_records(read_scan(path))
+
+    meta = None
+    records = []
+
+    with open(path, "r") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            obj = json.loads(line)
+            if obj.get("type") == "SCAN_META":
+                meta = obj
+            elif obj.get("type") == "DECISION":
+                records.append(obj)
+
+    return meta, records
+
+
+def _scan_id_from_path(path):
+    name = os.path.basename(path)
+    return name[len("scan_"):].split(".")[0]
+
+
+def import_scan_file(path, db_path=DB_PATH, conn=None):
+    """
+    Indexes one scan log. Returns the number of decisions stored.
+    """
+    meta, records = read_scan_file(path)
+    if meta is None:
+        meta = {"scan_id": _scan_id_from_path(path)}
+    meta.setdefault("scan_id", _scan_id_from_path(path))
+
+    own = conn is None
+    conn = conn or connect(db_path)
+    try:
+        index_scan(conn, meta, records, source=path)
+    finally:
+        if own:
+            conn.close()
+    return len(records)
+
+
+def import_logs(log_dir=LOG_DIR, db_path=DB_PATH, force=False):
+    """
+    One-time / catch-up importer for logs/scan_*.jsonl (and .npz) and
+    the compacted logs/archive/scans_*.jsonl.gz.
+    Already-indexed scans are skipped unless force=True.
+    Returns {"imported": n, "skipped": n, "failed": {file: error}}.
+    """
+    from src.log_retention import read_archive
+
+    conn = connect(db_path)
+    summary = {"imported": 0, "skipped": 0, "failed": {}}
+
+    try:
+        known = {row[0] for row in conn.execute("SELECT source FROM scans")}
+        known_ids = {row[0] for row in conn.execute("SELECT scan_id FROM scans")}
+
+        for archive in sorted(glob.glob(os.path.join(log_dir, "archive", "scans_*.jsonl.gz"))):
+            try:
+                for meta, records in read_archive(archive):
+                    if not force and meta.get("scan_id") in known_ids:
+                        summary["skipped"] += 1
+                        continue
+                    index_scan(conn, meta, records, source=archive)
+                    summary["imported"] += 1
+            except Exception as e:
+                summary["failed"][archive] = str(e)
+
+        paths = sorted(
+            glob.glob(os.path.join(log_dir, "scan_*.jsonl"))
+            + glob.glob(os.path.join(log_dir, "scan_*.npz"))
+        )
+        for path in paths:
+            if not force and path in known:
+                summary["skipped"] += 1
+                continue
+            try:
+                import_scan_file(path, conn=conn)
+                summary["imported"] += 1
+            except Exception as e:
+                summary["failed"][path] = str(e)
+    finally:
+        conn.close()
+
+    return summary
+
+
+# -------------------------------------------------
+# QUERY
+# -------------------------------------------------
+def _record(row):
+    record = dict(row)
+    record["type"] = "DECISION"
+    record["reason"] = json.loads(record["reason"] or "[]")
+    record["trace"] = json.loads(record["trace"] or "[]")
+    return record
+
+
+def _meta(row):
+    meta = dict(row)
+    meta["type"] = "SCAN_META"
+    if meta.get("metrics"):
+        meta["metrics"] = json.loads(meta["metrics"])
+    else:
+        meta.pop("metrics", None)
+    return meta
+
+
+def latest_scan(db_path=DB_PATH):
+    """
+    Newest scan's metadata (scan_ids sort chronologically) or None.
+    """
+    if not os.path.exists(db_path):
+        return None
+    conn = connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT * FROM scans ORDER BY scan_id DESC LIMIT 1"
+        ).fetchone()
+        return _meta(row) if row else None
+    finally:
+        conn.close()
+
+
+def scan_by_source(path, db_path=DB_PATH):
+    """
+    Metadata of the scan indexed from `path` (None if not indexed).
+    """
+    if not os.path.exists(db_path):
+        return None
+    conn = connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT * FROM scans WHERE source = ? ORDER BY scan_id DESC LIMIT 1",
+            (path,),
+        ).fetchone()
+        return _meta(row) if row else None
+    finally:
+        conn.close()
+
+
+def scan_decisions(scan_id, decision=None, db_path=DB_PATH):
+    """
+    Decision records of one scan, in the order they were logged.
+    """
+    conn = connect(db_path)
+    try:
+        sql = "SELECT * FROM decisions WHERE scan_id = ?"
+        args = [scan_id]
+        if decision:
+            sql += " AND decision = ?"
+            args.append(decision)
+        rows = conn.execute(sql + " ORDER BY rowid", args).fetchall()
+        return [_record(r) for r in rows]
+    finally:
+        conn.close()
+
+
+def load_latest_scan(db_path=DB_PATH):
+    """
+    Same return shape as reading the newest JSONL: (meta, records).
+    """
+    meta = latest_scan(db_path)
+    if meta is None:
+        return None, []
+    return meta, scan_decisions(meta["scan_id"], db_path=db_path)
+
+
+def symbol_history(symbol, decision=None, last_scans=30, db_path=DB_PATH):
+    """
+    Decisions for ONE symbol over the last N scans, newest first.
+    e.g. symbol_history("INFY", decision="TRADE", last_scans=30)
+    """
+    conn = connect(db_path)
+    try:
+        sql = (
+            "SELECT d.* FROM decisions d "
+            "JOIN (SELECT scan_id FROM scans ORDER BY scan_id DESC LIMIT ?) s "
+            "ON d.scan_id = s.scan_id "
+            "WHERE d.symbol = ?"
+        )
+        args = [last_scans, symbol]
+        if decision:
+            sql += " AND d.decision = ?"
+            args.append(decision)
+        rows = conn.execute(sql + " ORDER BY d.scan_id DESC", args).fetchall()
+        return [_record(r) for r in rows]
+    finally:
+        conn.close()
+
+
+def decision_counts(scan_id, db_path=DB_PATH):
+    """
+    {"TRADE": n, "WAIT": n, "NO TRADE": n} for one scan.
+    """
+    conn = connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT decision, COUNT(*) FROM decisions "
+            "WHERE scan_id = ? GROUP BY decision",
+            (scan_id,),
+        ).fetchall()
+        return {r[0]: r[1] for r in rows}
+    finally:
+        conn.close()
+
+
+# -------------------------------------------------
+# CLI: one-time import of existing logs
+# -------------------------------------------------
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Index scan logs into SQLite")
+    parser.add_argument("--log-dir", default=LOG_DIR)
+    parser.add_argument("--db", default=DB_PATH)
+    parser.add_argument("--force", action="store_true",
+                        help="re-import scans that are already indexed")
+    args = parser.parse_args()
+
+    summary = import_logs(args.log_dir, args.db, force=args.force)
+
+    print(f"✅ Imported: {summary['imported']} | Skipped: {summary['skipped']}")
+    for path, err in summary["failed"].items():
+        print(f"❌ {path}: {err}")
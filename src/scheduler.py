@@ -0,0 +1,373 @@
+# src/scheduler.py
+#
+# fetch → scan → report as ONE streaming pipeline:
+#
+#   fetch_universe ──(bounded queue)──▶ scan workers ──(bounded queue)──▶ report
+#
+# A symbol is scanned as soon as its CSV lands and reported as soon as
+# its decision is made, so the run finishes one slow symbol after the
+# last fetch instead of after fetch + scan + report back to back.
+#
+#   python -m src.scheduler                    # run once now (resumes today's run)
+#   python -m src.scheduler --daemon           # every day at SCHEDULER["RUN_AT"]
+#   python -m src.scheduler --provider fake --force
+
+import os
+import json
+import time
+import asyncio
+from datetime import datetime, timedelta
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+from src.config import CONFIG
+from src.engine_log import get_logger
+
+_log = get_logger("scheduler")
+
+CHECKPOINT_DIR = os.path.join("logs", "scheduler")
+REPORT_DIR = "reports"
+
+_DONE = object()        # end-of-stream marker between stages
+
+
+# -------------------------------------------------
+# CHECKPOINT (resumable runs)
+# -------------------------------------------------
+class Checkpoint:
+    """
+    logs/scheduler/run_<run_id>.json
+        fetched:  {ticker: fetch status}     → not fetched again
+        results:  {symbol: decision result}  → not scanned / reported again
+    Written atomically every `every` reported symbols and at the end.
+    """
+
+    def __init__(self, run_id, every=25, checkpoint_dir=CHECKPOINT_DIR):
+        self.path = os.path.join(checkpoint_dir, f"run_{run_id}.json")
+        self.every = max(1, every)
+        self._dirty = 0
+
+        if os.path.exists(self.path):
+            with open(self.path, "r") as f:
+                self.state = json.load(f)
+        else:
+            self.state = {"run_id": run_id, "started": datetime.now().isoformat(timespec="seconds"),
+                          "complete": False, "fetched": {}, "results": {}}
+
+    @property
+    def complete(self):
+        return self.state["complete"]
+
+    def fetched(self, ticker, status):
+        self.state["fetched"][ticker] = status
+
+    def reported(self, symbol, result):
+        self.state["results"][symbol] = result
+        self._dirty += 1
+        if self._dirty >= self.every:
+            self.save()
+
+    def finish(self, summary):
+        self.state.update(complete=True, summary=summary,
+                          finished=datetime.now().isoformat(timespec="seconds"))
+        self.save()
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.state, f, default=str)
+        os.replace(tmp, self.path)
+        self._dirty = 0
+
+
+# -------------------------------------------------
+# REPORT (reports/smartswing_<date>.txt layout)
+# -------------------------------------------------
+_ICONS = {"TRADE": "✅", "WAIT": "⚠️", "NO TRADE": "❌"}
+_ACTIONS = {
+    "TRADE": "Execute the trade plan.",
+    "WAIT": "Wait for better timing.",
+    "NO TRADE": "Capital protection — no action taken.",
+}
+
+
+def report_header(total_symbols):
+    return (
+        "🚀 SMARTSWING — DAILY MARKET SCAN\n"
+        + "=" * 55 + "\n"
+        + f"🔍 Scanning {total_symbols} stocks\n\n"
+    )
+
+
+def format_report_entry(symbol, result):
+    decision = result["decision"]
+    lines = [
+        f"\n📌 STOCK: {symbol}",
+        "-" * 40,
+        f"{_ICONS.get(decision, '•')} DECISION: {decision}",
+    ]
+    lines += [f"- {r}" for r in result.get("reason", [])]
+    if decision == "TRADE":
+        lines += [
+            f"Entry: ₹{result['entry']} | Stop: ₹{result['stop']} | Target: ₹{result['target']}",
+            f"Qty: {result['qty']} | Holding: {result['holding']}",
+        ]
+    lines += [f"Action: {_ACTIONS.get(decision, '')}", "-" * 55]
+    return "\n".join(lines) + "\n"
+
+
+# -------------------------------------------------
+# PIPELINE
+# -------------------------------------------------
+def _symbol(ticker):
+    return ticker.replace(".NS", "")
+
+
+async def run_pipeline(tickers, provider, run_id=None, settings=None,
+                       data_dir="data", fetch_kwargs=None, force=False):
+    """
+    One resumable fetch → scan → report run over `tickers` (RELIANCE.NS …).
+    settings override CONFIG["SCHEDULER"] keys.
+    Returns a summary dict (also stored in the checkpoint).
+    """
+    from src.fetchers import fetch_universe
+    from src.smartswing import scan_symbol
+    from src.logger import log_scan_metadata, log_decision, close_scan_log, current_scan_file
+    from src.scan_store import import_scan_file
+
+    cfg = {**CONFIG.get("SCHEDULER", {}), **(settings or {})}
+    run_id = run_id or datetime.now().strftime("%Y-%m-%d")
+    started = time.perf_counter()
+
+    checkpoint = Checkpoint(run_id, every=cfg.get("CHECKPOINT_EVERY", 25))
+    if force or checkpoint.complete:
+        if os.path.exists(checkpoint.path):
+            os.remove(checkpoint.path)
+        checkpoint = Checkpoint(run_id, every=cfg.get("CHECKPOINT_EVERY", 25))
+
+    done = dict(checkpoint.state["results"])
+    todo = [t for t in tickers if _symbol(t) not in done]
+    refetch = [t for t in todo if t not in checkpoint.state["fetched"]]
+    fetched_before = [t for t in todo if t in checkpoint.state["fetched"]]
+
+    print(f"\n⏰ SMARTSWING PIPELINE — run {run_id}")
+    print(f"🔍 {len(tickers)} symbols | already reported: {len(done)} | "
+          f"fetch: {len(refetch)} | scan only: {len(fetched_before)}")
+
+    # ---------------- SCAN LOG (previously reported symbols first) ----------------
+    log_scan_metadata(style=CONFIG["STYLE"], total_symbols=len(tickers))
+    for symbol, result in done.items():
+        log_decision(symbol=symbol, result=result)
+
+    os.makedirs(REPORT_DIR, exist_ok=True)
+    report_path = os.path.join(REPORT_DIR, f"smartswing_{run_id}.txt")
+    # rebuilt from the checkpoint → no duplicates for symbols reported
+    # after the last checkpoint write of an interrupted run
+    with open(report_path, "w") as f:
+        f.write(report_header(len(tickers)))
+        for symbol, result in done.items():
+            f.write(format_report_entry(symbol, result))
+
+    queue_size = cfg.get("QUEUE_SIZE", 64)
+    scan_q = asyncio.Queue(maxsize=queue_size)
+    report_q = asyncio.Queue(maxsize=queue_size)
+    scan_workers = max(1, cfg.get("SCAN_WORKERS", 2))
+    timings = {"first_report_s": None, "fetch_s": None}
+
+    # ---------------- STAGE 1: FETCH ----------------
+    async def on_saved(ticker, status):
+        checkpoint.fetched(ticker, status)
+        await scan_q.put(ticker)        # blocks when scanning falls behind
+
+    async def fetch_stage():
+        try:
+            for ticker in fetched_before:
+                await scan_q.put(ticker)
+            if refetch:
+                fetched = await fetch_universe(
+                    refetch,
+                    provider,
+                    data_dir=data_dir,
+                    concurrency=cfg.get("FETCH_CONCURRENCY", 4),
+                    rate=cfg.get("FETCH_RATE", 2.0),
+                    fetch_kwargs=fetch_kwargs or {"period": "1y"},
+                    incremental=True,
+                    on_saved=on_saved,
+                )
+                for ticker, error in fetched["failed"].items():
+                    # stale CSV (if any) is still scanned
+                    _log.warning("fetch failed for %s: %s", ticker, error)
+            timings["fetch_s"] = round(time.perf_counter() - started, 3)
+        finally:
+            for _ in range(scan_workers):
+                await scan_q.put(_DONE)
+
+    # ---------------- STAGE 2: SCAN ----------------
+    loop = asyncio.get_running_loop()
+    pool = ProcessPoolExecutor(max_workers=scan_workers)
+    scan = partial(scan_symbol, data_dir=data_dir)     # scan what was fetched
+
+    async def scan_stage():
+        while True:
+            ticker = await scan_q.get()
+            if ticker is _DONE:
+                break
+            symbol = _symbol(ticker)
+            result = await loop.run_in_executor(pool, scan, symbol)
+            await report_q.put((symbol, result))
+
+    # ---------------- STAGE 3: REPORT (single writer) ----------------
+    counts = {"TRADE": 0, "WAIT": 0, "NO TRADE": 0}
+    for result in done.values():
+        counts[result["decision"]] = counts.get(result["decision"], 0) + 1
+
+    async def report_stage():
+        with open(report_path, "a") as report:
+            while True:
+                item = await report_q.get()
+                if item is _DONE:
+                    break
+                symbol, result = item
+
+                log_decision(symbol=symbol, result=result)
+                report.write(format_report_entry(symbol, result))
+                report.flush()
+                checkpoint.reported(symbol, result)
+                counts[result["decision"]] = counts.get(result["decision"], 0) + 1
+
+                if timings["first_report_s"] is None:
+                    timings["first_report_s"] = round(time.perf_counter() - started, 3)
+                print(f"📌 {symbol:12} → {result['decision']}")
+
+    async def scanners():
+        try:
+            await asyncio.gather(*(scan_stage() for _ in range(scan_workers)))
+        finally:
+            await report_q.put(_DONE)
+
+    complete = False
+    try:
+        await asyncio.gather(fetch_stage(), scanners(), report_stage())
+        complete = True
+    finally:
+        # waiting for worker exit must not block the event loop
+        await loop.run_in_executor(None, partial(pool.shutdown, cancel_futures=True))
+        checkpoint.save()
+        close_scan_log(complete=complete)
+
+    # ---------------- INDEX (history queries / dashboard) ----------------
+    try:
+        import_scan_file(current_scan_file())
+    except Exception as e:
+        print(f"⚠️ Scan index not updated: {e}")
+
+    summary = {
+        "run_id": run_id,
+        "symbols": len(tickers),
+        "resumed": len(done) > 0,
+        "decisions": counts,
+        "report": report_path,
+        "scan_file": current_scan_file(),
+        "elapsed_s": round(time.perf_counter() - started, 3),
+        **timings,
+    }
+    checkpoint.finish(summary)
+
+    print(f"\n✅ Pipeline completed in {summary['elapsed_s']}s "
+          f"(fetch done at {summary['fetch_s']}s, first report at {summary['first_report_s']}s)")
+    print(f"📊 TRADE {counts['TRADE']} | WAIT {counts['WAIT']} | NO TRADE {counts['NO TRADE']}")
+    print(f"📝 Report → {report_path}")
+    return summary
+
+
+# -------------------------------------------------
+# DAEMON
+# -------------------------------------------------
+def next_run_time(now, at="16:00", weekdays_only=True):
+    hour, minute = (int(x) for x in at.split(":"))
+    when = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if when <= now:
+        when += timedelta(days=1)
+    while weekdays_only and when.weekday() >= 5:
+        when += timedelta(days=1)
+    return when
+
+
+def _unfinished_today(now):
+    checkpoint = Checkpoint(now.strftime("%Y-%m-%d"))
+    return os.path.exists(checkpoint.path) and not checkpoint.complete
+
+
+async def run_daemon(load_tickers, make_provider, settings=None):
+    """
+    Runs the pipeline every day at RUN_AT. An interrupted run for today
+    (checkpoint present, not complete) is resumed immediately on start.
+    """
+    cfg = {**CONFIG.get("SCHEDULER", {}), **(settings or {})}
+
+    while True:
+        now = datetime.now()
+        if not _unfinished_today(now):
+            when = next_run_time(now, cfg.get("RUN_AT", "16:00"), cfg.get("WEEKDAYS_ONLY", True))
+            print(f"😴 Next run at {when:%Y-%m-%d %H:%M}")
+            await asyncio.sleep((when - now).total_seconds())
+
+        try:
+            await run_pipeline(load_tickers(), make_provider(), settings=cfg)
+        except Exception as e:
+            # one bad day must not kill the daemon; the checkpoint keeps progress
+            print(f"❌ Pipeline failed: {e}")
+            _log.exception("pipeline failed")
+            await asyncio.sleep(60)
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+if __name__ == "__main__":
+    import argparse
+    from src import engine_log
+    from src.validator import validate_config
+
+    parser = argparse.ArgumentParser(description="SmartSwing fetch → scan → report pipeline")
+    parser.add_argument("--daemon", action="store_true",
+                        help="stay up and run every day at --at")
+    parser.add_argument("--at", default=None, help="daily run time HH:MM (daemon)")
+    parser.add_argument("--provider", default="yfinance")
+    parser.add_argument("--fetch-concurrency", type=int, default=None)
+    parser.add_argument("--scan-workers", type=int, default=None)
+    parser.add_argument("--queue-size", type=int, default=None)
+    parser.add_argument("--force", action="store_true",
+                        help="ignore today's checkpoint and start over")
+    args = parser.parse_args()
+
+    errors = validate_config()
+    if errors:
+        print("❌ CONFIGURATION ERROR")
+        for e in errors:
+            print("-", e)
+        exit(1)
+
+    engine_log.configure(debug=False)
+
+    from src.fetchers import PROVIDERS
+    from src.fetch_prices import load_tickers
+
+    if args.provider not in PROVIDERS:
+        parser.error(f"unknown provider: {args.provider} (choose from {', '.join(sorted(PROVIDERS))})")
+
+    overrides = {
+        key: value for key, value in {
+            "RUN_AT": args.at,
+            "FETCH_CONCURRENCY": args.fetch_concurrency,
+            "SCAN_WORKERS": args.scan_workers,
+            "QUEUE_SIZE": args.queue_size,
+        }.items() if value is not None
+    }
+
+    if args.daemon:
+        asyncio.run(run_daemon(load_tickers, PROVIDERS[args.provider], overrides))
+    else:
+        asyncio.run(run_pipeline(load_tickers(), PROVIDERS[args.provider](),
+                                 settings=overrides, force=args.force))
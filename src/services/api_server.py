@@ -0,0 +1,342 @@
+# src/services/api_server.py
+#
+# Local decision API (plain ASGI — any ASGI server can host `app`).
+#
+#   python -m src.services.api_server --port 8765 --warm
+#
+#   GET  /health                         cache + request counters
+#   GET  /decision/<SYMBOL>              one decision
+#   POST /decisions  {"symbols": [...]}  batch (loaded concurrently)
+#   POST /warm       {"symbols": [...]}  preload snapshots (default: all of data/)
+#   POST /scan       {"workers": 4, "vectorized": false}  start a full scan
+#   GET  /scan                           status of the last triggered scan
+
+import os
+import sys
+import json
+import asyncio
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from src.config import CONFIG
+from src.data_adapter import load_stock
+from src.services.decision_service import get_trade_decision
+from src.engine_log import get_logger
+
+_log = get_logger("api")
+
+MAX_BATCH = 1000
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# -------------------------------------------------
+# WARM SNAPSHOT CACHE + REQUEST COALESCING
+# -------------------------------------------------
+class DecisionCache:
+    """
+    Keeps the latest snapshot per symbol, keyed on the CSV version
+    (mtime_ns, size): a rewritten CSV is reloaded on the next request.
+    Concurrent requests for the same symbol version share ONE load.
+    Loads run on a thread pool; the indicator frames they build stay
+    warm in the src.indicators LRU for the life of the process.
+    """
+
+    def __init__(self, data_dir="data", workers=4):
+        self.data_dir = data_dir
+        self.workers = workers
+        self._executor = None
+        self._snapshots = {}        # symbol → (version, snapshot)
+        self._inflight = {}         # (symbol, version) → Future
+        self.stats = {"requests": 0, "hits": 0, "loads": 0, "coalesced": 0,
+                      "errors": 0}
+
+    def _version(self, symbol):
+        try:
+            st = os.stat(os.path.join(self.data_dir, f"{symbol}_NS.csv"))
+        except OSError:
+            raise HTTPError(404, f"No price data for {symbol}")
+        return st.st_mtime_ns, st.st_size
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="decision-load"
+            )
+        return self._executor
+
+    async def snapshot(self, symbol):
+        self.stats["requests"] += 1
+        version = self._version(symbol)
+
+        cached = self._snapshots.get(symbol)
+        if cached is not None and cached[0] == version:
+            self.stats["hits"] += 1
+            return cached[1]
+
+        key = (symbol, version)
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats["coalesced"] += 1
+        else:
+            self.stats["loads"] += 1
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._pool(), load_stock, symbol, self.data_dir)
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        try:
+            # shield: one cancelled client must not cancel the shared load
+            snap = await asyncio.shield(future)
+        except Exception as e:
+            self.stats["errors"] += 1
+            raise HTTPError(422, f"{symbol}: data load failed: {e}")
+
+        self._snapshots[symbol] = (version, snap)
+        return snap
+
+    async def decision(self, symbol):
+        snap = await self.snapshot(symbol)
+        result = get_trade_decision(snap)
+        return {**result, "symbol": symbol, "latest_date": snap.get("latest_date")}
+
+    def symbols(self):
+        if not os.path.isdir(self.data_dir):
+            return []
+        return sorted(
+            f[:-len("_NS.csv")] for f in os.listdir(self.data_dir) if f.endswith("_NS.csv")
+        )
+
+    def info(self):
+        return {**self.stats, "snapshots": len(self._snapshots),
+                "inflight": len(self._inflight)}
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# -------------------------------------------------
+# SCAN TRIGGER (one at a time, separate process)
+# -------------------------------------------------
+class ScanRunner:
+    """
+    Runs `python -m src.smartswing` as a child process: scans keep their
+    own process pools / scan log state and never block the event loop.
+    """
+
+    def __init__(self):
+        self.proc = None
+        self.status = {"state": "idle"}
+
+    def running(self):
+        return self.proc is not None and self.proc.returncode is None
+
+    async def start(self, workers=1, vectorized=False):
+        if self.running():
+            raise HTTPError(409, "A scan is already running")
+
+        cmd = [sys.executable, "-m", "src.smartswing", "--workers", str(workers)]
+        if vectorized:
+            cmd.append("--vectorized")
+
+        self.proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+        )
+        self.status = {"state": "running", "pid": self.proc.pid,
+                       "started": datetime.now().isoformat(timespec="seconds")}
+        asyncio.get_running_loop().create_task(self._wait(self.proc))
+        return self.status
+
+    async def _wait(self, proc):
+        _, stderr = await proc.communicate()
+        self.status.update(
+            state="done" if proc.returncode == 0 else "failed",
+            returncode=proc.returncode,
+            finished=datetime.now().isoformat(timespec="seconds"),
+        )
+        if proc.returncode != 0:
+            self.status["error"] = stderr.decode(errors="replace")[-2000:]
+
+        from src.logger import read_latest_pointer
+        self.status["scan_file"] = read_latest_pointer()
+
+
+# -------------------------------------------------
+# ASGI PLUMBING
+# -------------------------------------------------
+async def _read_json(receive):
+    body = b""
+    while True:
+        message = await receive()
+        body += message.get("body", b"")
+        if not message.get("more_body"):
+            break
+    if not body.strip():
+        return {}
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise HTTPError(400, "Body is not valid JSON")
+    if not isinstance(payload, dict):
+        raise HTTPError(400, "Body must be a JSON object")
+    return payload
+
+
+async def _send_json(send, status, payload):
+    body = json.dumps(payload, default=str).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+def _symbols_from(payload, required=True):
+    symbols = payload.get("symbols")
+    if symbols is None and not required:
+        return None
+    if not isinstance(symbols, list) or not all(isinstance(s, str) for s in symbols):
+        raise HTTPError(400, "'symbols' must be a list of strings")
+    if len(symbols) > MAX_BATCH:
+        raise HTTPError(400, f"At most {MAX_BATCH} symbols per request")
+    # INFY / infy / INFY.NS all mean the same file
+    return list(dict.fromkeys(s.strip().upper().replace(".NS", "") for s in symbols))
+
+
+async def _batch(cache, symbols):
+    """
+    {symbol: decision or {"error"}} — loads overlap on the thread pool.
+    """
+    async def one(symbol):
+        try:
+            return symbol, await cache.decision(symbol)
+        except HTTPError as e:
+            return symbol, {"error": e.message, "status": e.status}
+
+    return dict(await asyncio.gather(*(one(s) for s in symbols)))
+
+
+def create_app(data_dir="data", workers=4, warm=False):
+    """
+    ASGI callable serving decisions from a warm DecisionCache.
+    warm=True preloads every symbol in data_dir at startup.
+    """
+    cache = DecisionCache(data_dir, workers)
+    scans = ScanRunner()
+
+    async def route(method, path, receive):
+        parts = [p for p in path.split("/") if p]
+
+        if parts == ["health"] and method == "GET":
+            from src.indicators import cache_info
+            return 200, {"status": "ok", "style": CONFIG["STYLE"],
+                         "service": cache.info(), "indicator_cache": cache_info()}
+
+        if len(parts) == 2 and parts[0] == "decision" and method == "GET":
+            symbol = parts[1].upper().replace(".NS", "")
+            return 200, await cache.decision(symbol)
+
+        if parts == ["decisions"] and method == "POST":
+            symbols = _symbols_from(await _read_json(receive))
+            return 200, {"style": CONFIG["STYLE"], "results": await _batch(cache, symbols)}
+
+        if parts == ["warm"] and method == "POST":
+            symbols = _symbols_from(await _read_json(receive), required=False)
+            results = await _batch(cache, symbols if symbols is not None else cache.symbols())
+            failed = {s: r["error"] for s, r in results.items() if "error" in r}
+            return 200, {"warmed": len(results) - len(failed), "failed": failed}
+
+        if parts == ["scan"] and method == "POST":
+            payload = await _read_json(receive)
+            workers = payload.get("workers", 1)
+            if type(workers) is not int or workers < 1:
+                raise HTTPError(400, "'workers' must be a positive integer")
+            return 202, await scans.start(
+                workers=workers,
+                vectorized=bool(payload.get("vectorized", False)),
+            )
+
+        if parts == ["scan"] and method == "GET":
+            return 200, scans.status
+
+        if parts and parts[0] in ("health", "decision", "decisions", "warm", "scan"):
+            raise HTTPError(405, f"{method} not allowed on {path}")
+        raise HTTPError(404, f"Not found: {path}")
+
+    async def lifespan(receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                if warm:
+                    results = await _batch(cache, cache.symbols())
+                    _log.info("warmed %d symbols", len(results))
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                cache.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def app(scope, receive, send):
+        if scope["type"] == "lifespan":
+            return await lifespan(receive, send)
+        if scope["type"] != "http":
+            return
+
+        try:
+            status, payload = await route(scope["method"], scope["path"], receive)
+        except HTTPError as e:
+            status, payload = e.status, {"error": e.message}
+        except Exception as e:
+            _log.exception("request failed: %s %s", scope["method"], scope["path"])
+            status, payload = 500, {"error": str(e)}
+
+        await _send_json(send, status, payload)
+
+    app.cache = cache
+    app.scans = scans
+    return app
+
+
+# -------------------------------------------------
+# SERVER (uvicorn is optional)
+# -------------------------------------------------
+def serve(host="127.0.0.1", port=8765, data_dir="data", workers=4, warm=False):
+    try:
+        import uvicorn
+    except ImportError:
+        print("❌ uvicorn is not installed (pip install uvicorn) — "
+              "or host create_app() with any ASGI server")
+        raise SystemExit(1)
+
+    print(f"🛰️  SmartSwing decision API → http://{host}:{port}")
+    uvicorn.run(create_app(data_dir, workers, warm), host=host, port=port,
+                log_level="warning")
+
+
+if __name__ == "__main__":
+    import argparse
+    from src import engine_log
+
+    parser = argparse.ArgumentParser(description="SmartSwing decision API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="threads loading price data")
+    parser.add_argument("--warm", action="store_true",
+                        help="preload every symbol at startup")
+    parser.add_argument("--debug", action="store_true",
+                        help="engine DEBUG logging")
+    args = parser.parse_args()
+
+    engine_log.configure(debug=args.debug)
+    serve(args.host, args.port, args.data_dir, args.workers, args.warm)
@@ -3,8 +3,16 @@
 from src.config import CONFIG
 from src.decision_engine import make_decision
 from src.risk_management import calculate_trade
-from src.data_adapter import load_stock_from_csv
-import pandas as pd
+from src.data_adapter import load_stock
+from src.engine_log import get_logger
+from src.scan_metrics import stage
+
+_log = get_logger("service")
+
+
+def _is_missing(value):
+    # None or NaN (NaN != NaN) — same as pd.isna for scalars, without pandas
+    return value is None or value != value
 
 
 def get_trade_decision(stock_data=None, symbol=None):
@@ -27,7 +35,8 @@ def get_trade_decision(stock_data=None, symbol=None):
             }
 
         try:
-            stock_data = load_stock_from_csv(f"data/{symbol}_NS.csv")
+            with stage("load"):
+                stock_data = load_stock(symbol)
         except Exception as e:
             return {
                 "stock": symbol,
@@ -43,7 +52,7 @@ def get_trade_decision(stock_data=None, symbol=None):
     # -------------------------------------------------
     required = ["close", "dma_20", "dma_50", "rsi", "volume", "avg_volume"]
     for k in required:
-        if k not in stock_data or pd.isna(stock_data[k]):
+        if k not in stock_data or _is_missing(stock_data[k]):
             return {
                 "stock": symbol,
                 "decision": "NO TRADE",
@@ -71,13 +80,13 @@ def get_trade_decision(stock_data=None, symbol=None):
         "style": CONFIG["STYLE"]
     }
 
-    engine_result = make_decision(engine_input)
+    with stage("engine"):
+        engine_result = make_decision(engine_input)
 
-    print(
-        f"[ENGINE RESULT] {symbol} → "
-        f"{engine_result['decision']} | "
-        f"reasons={engine_result.get('reasons')} | "
-        f"style={CONFIG['STYLE']}"
+    _log.debug(
+        "%s → %s | reasons=%s | style=%s",
+        symbol, engine_result["decision"],
+        engine_result.get("reasons"), CONFIG["STYLE"]
     )
 
     decision = engine_result["decision"]
@@ -100,7 +109,8 @@ def get_trade_decision(stock_data=None, symbol=None):
     # 4️⃣ RISK MANAGEMENT (SINGLE SOURCE OF TRUTH)
     # -------------------------------------------------
     try:
-        trade = calculate_trade(entry=stock_data["close"])
+        with stage("risk"):
+            trade = calculate_trade(entry=stock_data["close"])
     except Exception as e:
         return {
             "stock": symbol,
@@ -1,21 +1,18 @@
 from src.config import CONFIG
 from src.validator import validate_config
-from src.logger import log_decision, log_scan_metadata
+from src.logger import log_decision, log_scan_metadata, log_scan_summary, close_scan_log, current_scan_file
+from src.scan_store import import_scan_file
+from src.log_retention import apply_retention
 from src.services.decision_service import get_trade_decision
-from src.data_adapter import load_stock_from_csv
+from src.data_adapter import load_stock
+from src import engine_log
+from src.scan_metrics import ScanMetrics, stage, measure_symbol, activate, deactivate, write_prometheus
 
-import pandas as pd
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+import argparse
 import os
 
-# ---------------- VALIDATION ----------------
-errors = validate_config()
-if errors:
-    print("❌ CONFIGURATION ERROR")
-    for e in errors:
-        print("-", e)
-    exit(1)
-
 # ---------------- CONFIG ----------------
 STYLE = CONFIG["STYLE"]
 TOP_N = CONFIG["TOP_N"]
@@ -26,6 +23,8 @@ def load_stock_universe():
     if not os.path.exists(STOCK_LIST_PATH):
         raise FileNotFoundError("stocks_list.csv not found")
 
+    import pandas as pd
+
     df = pd.read_csv(STOCK_LIST_PATH)
     symbols = (
         df["symbol"]
@@ -36,8 +35,133 @@ def load_stock_universe():
     return symbols
 
 
+# ---------------- SINGLE SYMBOL ----------------
+def _failed_result(error):
+    # HARD FAIL → LOG AS NO TRADE
+    return {
+        "decision": "NO TRADE",
+        "reason": [f"Data load failed: {error}"],
+        "trace": [],
+        "entry": None,
+        "stop": None,
+        "target": None,
+        "qty": None,
+        "holding": None,
+        "style": STYLE
+    }
+
+
+def scan_symbol(symbol, data_dir="data"):
+    """
+    Load → engine for ONE symbol (price data from `data_dir`).
+    Returns a plain result dict (picklable, safe to ship from a worker).
+    """
+    try:
+        # ---------------- LOAD DATA ----------------
+        with stage("load"):
+            stock_data = load_stock(symbol, data_dir=data_dir)
+
+        # ---------------- ENGINE DECISION ----------------
+        return get_trade_decision(stock_data)
+
+    except Exception as e:
+        return _failed_result(e)
+
+
+def _scan_one(symbol):
+    # (result, timing part) — runs in the worker, timings ship back
+    return measure_symbol(scan_symbol, symbol)
+
+
+def _decide(snapshot):
+    try:
+        return get_trade_decision(snapshot)
+    except Exception as e:
+        return _failed_result(e)
+
+
+def _scan_results(symbols, workers):
+    """
+    Yields (symbol, result, timing part) in universe order.
+    workers > 1 → symbols are spread across a process pool.
+    """
+    if workers <= 1:
+        for symbol in symbols:
+            yield (symbol, *_scan_one(symbol))
+        return
+
+    chunksize = max(1, len(symbols) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map() preserves input order → deterministic logs
+        for symbol, (result, part) in zip(
+            symbols,
+            pool.map(_scan_one, symbols, chunksize=chunksize)
+        ):
+            yield symbol, result, part
+
+
+def _scan_results_vectorized(symbols):
+    """
+    Indicators for the whole universe in one NumPy pass,
+    then the engine per snapshot.
+    """
+    from src.universe_engine import load_universe_snapshots
+
+    with stage("universe"):
+        snapshots, errors = load_universe_snapshots(symbols)
+
+    for symbol in symbols:
+        if symbol not in snapshots:
+            yield symbol, _failed_result(errors.get(symbol, "No data")), None
+            continue
+
+        yield (symbol, *measure_symbol(_decide, snapshots[symbol]))
+
+
+# ---------------- CHART THUMBNAILS ----------------
+def _start_charts():
+    """
+    Background chart renderer, or None (disabled / no matplotlib).
+    """
+    if not CONFIG.get("CHART_DECISIONS"):
+        return None
+
+    from src import chart_cache
+
+    if not chart_cache.available():
+        print("⚠️ matplotlib not installed → chart thumbnails skipped")
+        return None
+    return chart_cache.ChartRenderer(workers=CONFIG.get("CHART_WORKERS", 2))
+
+
 # ---------------- MAIN PIPELINE ----------------
-def run_smartswing():
+def _print_metrics(metrics):
+    print("\n⏱️  STAGE TIMINGS (wall / cpu)")
+    for name, s in metrics["stages"].items():
+        print(f"   {name:10} {s['wall_s']:8.3f}s / {s['cpu_s']:8.3f}s  ({s['calls']} calls)")
+    lat = metrics["symbol_latency"]
+    if lat.get("count"):
+        print(
+            f"   per-symbol p50 {lat['p50'] * 1000:.2f} ms | "
+            f"p95 {lat['p95'] * 1000:.2f} ms | p99 {lat['p99'] * 1000:.2f} ms"
+        )
+    cache = metrics["indicator_cache"]
+    print(
+        f"   indicator cache: {cache['hits']} hits / {cache['misses']} misses "
+        f"(disk {cache['disk_hits']} / {cache['disk_misses']})"
+    )
+
+
+def run_smartswing(workers=1, vectorized=False, log_format=None, metrics_file=None):
+    """
+    Runs one scan. Returns {"scan_file", "scanned", "metrics"}.
+    metrics_file: optional Prometheus text file for the scan metrics.
+    """
+    errors = validate_config()
+    if errors:
+        raise ValueError("Invalid configuration: " + "; ".join(errors))
+
     print("\n🚀 SMARTSWING — DAILY MARKET SCAN")
     print("=" * 55)
 
@@ -47,56 +171,158 @@ def run_smartswing():
     total_symbols = len(stock_list)
 
     print(f"🔍 Scanning {total_symbols} stocks")
-    print(f"🎯 ACTIVE STYLE: {STYLE}\n")
+    print(f"🎯 ACTIVE STYLE: {STYLE}")
+    print(f"⚙️  MODE: {'VECTORIZED' if vectorized else f'{workers} worker(s)'}\n")
 
     # 🔒 ALWAYS WRITE METADATA FIRST
     log_scan_metadata(
         style=STYLE,
-        total_symbols=total_symbols
+        total_symbols=total_symbols,
+        fmt=log_format
     )
 
     scanned = 0
 
-    for symbol in stock_list[:TOP_N]:
-        scanned += 1
+    symbols = stock_list[:TOP_N]
 
-        try:
-            # ---------------- LOAD DATA ----------------
-            stock_data = load_stock_from_csv(
-                file_path=f"data/{symbol}_NS.csv"
-            )
+    metrics = ScanMetrics()
+    activate(metrics)
+
+    charts = _start_charts()
+    chart_decisions = CONFIG.get("CHART_DECISIONS", ())
 
-            # ---------------- ENGINE DECISION ----------------
-            result = get_trade_decision(stock_data)
-
-        except Exception as e:
-            # HARD FAIL → LOG AS NO TRADE
-            result = {
-                "decision": "NO TRADE",
-                "reason": [f"Data load failed: {e}"],
-                "trace": [],
-                "entry": None,
-                "stop": None,
-                "target": None,
-                "qty": None,
-                "holding": None,
-                "style": STYLE
-            }
+    if vectorized:
+        results = _scan_results_vectorized(symbols)
+    else:
+        results = _scan_results(symbols, workers)
+
+    for symbol, result, part in results:
+        scanned += 1
+        if part is not None:
+            metrics.merge(part)
 
         # ---------------- LOG (SINGLE SOURCE OF TRUTH) ----------------
-        log_decision(
-            symbol=symbol,
-            result=result
-        )
+        # only the parent process writes → one writer, stable order
+        with stage("log"):
+            log_decision(
+                symbol=symbol,
+                result=result
+            )
+
+        # ---------------- CHART (rendered off the scan path) ----------------
+        if charts is not None and result["decision"] in chart_decisions:
+            charts.submit(symbol)
 
         # ---------------- CONSOLE FEEDBACK ----------------
         print(f"📌 {symbol:12} → {result['decision']}")
 
+    deactivate()
+    summary = metrics.finish().to_dict()
+
+    # final SCAN_META carries the metrics (readers keep the last one)
+    log_scan_summary(summary)
+    close_scan_log(complete=True)
+
+    if metrics_file:
+        write_prometheus(metrics_file, summary, labels={"style": STYLE})
+
+    # ---------------- INDEX (history queries / dashboard) ----------------
+    try:
+        import_scan_file(current_scan_file())
+    except Exception as e:
+        print(f"⚠️ Scan index not updated: {e}")
+
+    # ---------------- RETENTION (compact old scans) ----------------
+    try:
+        compacted, _ = apply_retention()
+        if compacted:
+            print(f"🗜️  Archived {sum(len(p) for p in compacted.values())} old scan(s)")
+    except Exception as e:
+        print(f"⚠️ Log retention skipped: {e}")
+
+    if charts is not None:
+        done = charts.close()
+        print(f"🖼️  Charts: {len(done['rendered'])} rendered, {done['cached']} cached")
+        for symbol, error in done["failed"].items():
+            print(f"⚠️ Chart {symbol}: {error}")
+
+    _print_metrics(summary)
+
     print("\n✅ Scan completed")
     print(f"📊 Symbols scanned: {scanned}")
     print("=" * 55)
 
+    return {"scan_file": current_scan_file(), "scanned": scanned, "metrics": summary}
+
 
 # ---------------- ENTRY POINT ----------------
+def _parse_args():
+    parser = argparse.ArgumentParser(description="SmartSwing daily market scan")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="process-pool size (1 = sequential scan)"
+    )
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="compute indicators for the whole universe in one NumPy pass"
+    )
+    parser.add_argument(
+        "--log-format",
+        choices=["jsonl", "columnar"],
+        default=None,
+        help="scan log format (default: CONFIG['SCAN_LOG_FORMAT'])"
+    )
+    parser.add_argument(
+        "--metrics-file",
+        default=None,
+        help="write scan metrics in Prometheus text format to this file"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="capture a cProfile report of the scan (reports/profile_<scan>.prof)"
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    run_smartswing()
+    args = _parse_args()
+
+    # ---------------- VALIDATION ----------------
+    errors = validate_config()
+    if errors:
+        print("❌ CONFIGURATION ERROR")
+        for e in errors:
+            print("-", e)
+        exit(1)
+
+    engine_log.configure()
+
+    scan_kwargs = dict(
+        workers=args.workers,
+        vectorized=args.vectorized,
+        log_format=args.log_format,
+        metrics_file=args.metrics_file
+    )
+
+    if not args.profile:
+        run_smartswing(**scan_kwargs)
+    else:
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        outcome = run_smartswing(**scan_kwargs)
+        profiler.disable()
+
+        os.makedirs("reports", exist_ok=True)
+        scan_name = os.path.splitext(os.path.basename(outcome["scan_file"]))[0]
+        profile_path = os.path.join("reports", f"profile_{scan_name}.prof")
+        profiler.dump_stats(profile_path)
+
+        print(f"\n🔬 PROFILE (top 20 by cumulative time) → {profile_path}")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
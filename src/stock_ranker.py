@@ -1,72 +1,62 @@
 import pandas as pd
+import numpy as np
 import os
 
+from src.universe_engine import build_panel, compute_indicators
+
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 
-results = []
-
-for file in os.listdir(DATA_DIR):
-    if not file.endswith(".csv"):
-        continue
-
-    file_path = os.path.join(DATA_DIR, file)
-    df = pd.read_csv(file_path)
-
-    # ---------------- CLEAN DATA ----------------
-    df = df[df["Price"].str.contains(r"\d{4}-\d{2}-\d{2}", na=False)]
-    df = df.rename(columns={"Price": "Date"})
-
-    for col in ["Open", "High", "Low", "Close", "Volume"]:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    df["Date"] = pd.to_datetime(df["Date"])
-    df = df.sort_values("Date").dropna()
 
-    if len(df) < 60:
-        continue
+def rank_stocks(data_dir=DATA_DIR):
+    """
+    Scores every `<SYM>_NS.csv` in data_dir.
+    Returns a DataFrame sorted by Score (best first).
+    """
+    symbols = [
+        file.replace("_NS.csv", "")
+        for file in sorted(os.listdir(data_dir))
+        if file.endswith("_NS.csv")
+    ]
 
-    # ---------------- INDICATORS ----------------
-    df["DMA_20"] = df["Close"].rolling(20).mean()
-    df["DMA_50"] = df["Close"].rolling(50).mean()
+    # ---------------- LOAD + INDICATORS (WHOLE UNIVERSE) ----------------
+    panel = build_panel(symbols, data_dir=data_dir)
+    ind = compute_indicators(panel)
 
-    delta = df["Close"].diff()
-    gain = delta.where(delta > 0, 0.0)
-    loss = -delta.where(delta < 0, 0.0)
-    avg_gain = gain.rolling(14).mean()
-    avg_loss = loss.rolling(14).mean()
-    rs = avg_gain / avg_loss
-    df["RSI"] = 100 - (100 / (1 + rs))
+    bars = len(panel["dates"]) - ind["first"]
 
-    df["AVG_VOL_20"] = df["Volume"].rolling(20).mean()
-
-    latest = df.iloc[-1]
-
-    score = 0
+    # latest bar of every symbol = last row of the bottom-aligned matrices
+    close = ind["close"][-1]
+    dma_20 = ind["dma_20"][-1]
+    dma_50 = ind["dma_50"][-1]
+    rsi = ind["rsi"][-1]
+    volume = ind["volume"][-1]
+    avg_vol = ind["avg_volume"][-1]
 
     # ---------------- SCORING ----------------
-    if latest["Close"] > latest["DMA_20"] > latest["DMA_50"]:
-        score += 40
-
-    if 35 <= latest["RSI"] <= 60:
-        score += 25
-
-    if abs(latest["Close"] - latest["DMA_20"]) / latest["Close"] < 0.02:
-        score += 20
+    score = (
+        40 * ((close > dma_20) & (dma_20 > dma_50))
+        + 25 * ((rsi >= 35) & (rsi <= 60))
+        + 20 * (np.abs(close - dma_20) / close < 0.02)
+        + 15 * (volume < avg_vol)
+    )
+
+    keep = bars >= 60
+
+    results = pd.DataFrame({
+        "Stock": np.array(panel["symbols"], dtype=object)[keep],
+        "Score": score[keep],
+        "Close": np.round(close[keep], 2),
+        "RSI": np.round(rsi[keep], 2),
+    })
 
-    if latest["Volume"] < latest["AVG_VOL_20"]:
-        score += 15
+    return results.sort_values("Score", ascending=False)
 
-    results.append({
-        "Stock": file.replace("_NS.csv", ""),
-        "Score": score,
-        "Close": round(latest["Close"], 2),
-        "RSI": round(latest["RSI"], 2)
-    })
 
 # ---------------- RESULTS ----------------
-ranked = pd.DataFrame(results).sort_values("Score", ascending=False)
+if __name__ == "__main__":
+    ranked = rank_stocks()
 
-print("\n🏆 SMARTSWING STOCK RANKINGS")
-print("-----------------------------")
-print(ranked.head(5))
+    print("\n🏆 SMARTSWING STOCK RANKINGS")
+    print("-----------------------------")
+    print(ranked.head(5))
@@ -0,0 +1,216 @@
+# src/universe_engine.py
+
+import os
+import numpy as np
+
+from src.data_adapter import MIN_ROWS_REQUIRED
+from src.indicators import get_price_frame
+from src import price_store
+
+# -------------------------------------------------
+# WINDOWS (must match src.data_adapter)
+# -------------------------------------------------
+DMA_FAST = 20
+DMA_SLOW = 50
+RSI_PERIOD = 14
+AVG_VOL_PERIOD = 20
+
+PRICE_FIELDS = ["close", "high", "low", "volume"]
+
+
+# -------------------------------------------------
+# LOAD: SYMBOLS → (DATES × SYMBOLS) MATRICES
+# -------------------------------------------------
+def _load_columns(symbol, data_dir, store_dir, manifest):
+    if price_store.is_fresh(symbol, data_dir, store_dir, manifest=manifest):
+        return price_store.load_prices(symbol, store_dir=store_dir)
+
+    df = get_price_frame(os.path.join(data_dir, f"{symbol}_NS.csv"))
+    return {
+        "date": df["Date"].to_numpy(dtype="datetime64[D]"),
+        "close": df["Close"].to_numpy(dtype="float64"),
+        "high": df["High"].to_numpy(dtype="float64"),
+        "low": df["Low"].to_numpy(dtype="float64"),
+        "volume": df["Volume"].to_numpy(dtype="float64"),
+    }
+
+
+def build_panel(symbols, data_dir="data"):
+    """
+    Aligns every symbol on the union of trading dates.
+    Returns {"dates", "symbols", "close", "high", "low", "volume", "errors"}.
+    Matrices are float64 (dates × symbols); missing bars are NaN.
+    """
+    store_dir = os.path.join(data_dir, ".store")
+    manifest = price_store._read_manifest(store_dir)
+
+    loaded = {}
+    errors = {}
+
+    for symbol in symbols:
+        try:
+            loaded[symbol] = _load_columns(symbol, data_dir, store_dir, manifest)
+        except Exception as e:
+            errors[symbol] = str(e)
+
+    names = list(loaded)
+
+    if names:
+        dates = np.unique(np.concatenate([loaded[s]["date"] for s in names]))
+    else:
+        dates = np.array([], dtype="datetime64[D]")
+
+    panel = {"dates": dates, "symbols": names, "errors": errors}
+
+    for field in PRICE_FIELDS:
+        panel[field] = np.full((len(dates), len(names)), np.nan)
+
+    for j, symbol in enumerate(names):
+        cols = loaded[symbol]
+        rows = np.searchsorted(dates, cols["date"])
+        for field in PRICE_FIELDS:
+            panel[field][rows, j] = cols[field]
+
+    return panel
+
+
+# -------------------------------------------------
+# INTERNAL: RAGGED → BOTTOM-ALIGNED
+# -------------------------------------------------
+def _compact_order(valid):
+    """
+    Per column, row order that moves missing bars to the top and keeps
+    real bars in date order at the bottom. Every symbol's latest bar ends
+    up on the last row, and windows span real bars only.
+    """
+    return np.argsort(valid, axis=0, kind="stable")
+
+
+def _rolling_mean(values, window, first):
+    """
+    Trailing mean over bottom-aligned columns.
+    Each window is summed on its own (strided view, no copy): unlike
+    differenced cumulative sums there is no cancellation error, so RSI
+    matches the pandas path bit for bit and DMA / AVG_VOL stay within
+    ~1 ulp of it.
+    `first` = row index of each column's first real value.
+    """
+    filled = np.where(np.isnan(values), 0.0, values)
+
+    out = np.full(filled.shape, np.nan)
+    if filled.shape[0] >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(filled, window, axis=0)
+        out[window - 1:] = windows.sum(axis=-1) / window
+
+    rows = np.arange(values.shape[0])[:, None]
+    out[rows < first + window - 1] = np.nan
+    return out
+
+
+# -------------------------------------------------
+# VECTORIZED INDICATORS
+# -------------------------------------------------
+def compute_indicators(panel):
+    """
+    DMA_20 / DMA_50 / RSI(14) / AVG_VOL_20 for the whole universe at once.
+    Returns bottom-aligned matrices (row -1 = each symbol's latest bar),
+    plus "order" to map them back onto panel["dates"].
+    """
+    close = panel["close"]
+    volume = panel["volume"]
+
+    valid = ~np.isnan(close)
+    order = _compact_order(valid)
+
+    c = np.take_along_axis(close, order, axis=0)
+    v = np.take_along_axis(volume, order, axis=0)
+
+    n_rows = close.shape[0]
+    first = n_rows - valid.sum(axis=0)      # first real row per column
+    rows = np.arange(n_rows)[:, None]
+
+    delta = np.full_like(c, np.nan)
+    delta[1:] = c[1:] - c[:-1]
+    delta[rows <= first] = np.nan           # no prior bar
+
+    gain = np.clip(delta, 0, None)
+    loss = np.clip(-delta, 0, None)
+
+    avg_gain = _rolling_mean(gain, RSI_PERIOD, first + 1)
+    avg_loss = _rolling_mean(loss, RSI_PERIOD, first + 1)
+
+    # loss window of exact zeros → RSI undefined (data_adapter drops it)
+    loss_bars = _rolling_mean((loss > 0).astype("float64"), RSI_PERIOD, first + 1)
+    avg_loss[loss_bars == 0] = np.nan
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+
+    return {
+        "order": order,
+        "first": first,
+        "close": c,
+        "volume": v,
+        "dma_20": _rolling_mean(c, DMA_FAST, first),
+        "dma_50": _rolling_mean(c, DMA_SLOW, first),
+        "rsi": rsi,
+        "avg_volume": _rolling_mean(v, AVG_VOL_PERIOD, first),
+    }
+
+
+def latest_snapshots(panel, indicators=None):
+    """
+    Per-symbol snapshot dicts, identical in shape to load_stock().
+    Returns (snapshots: {symbol: dict}, errors: {symbol: str}).
+    """
+    if indicators is None:
+        indicators = compute_indicators(panel)
+
+    errors = dict(panel["errors"])
+    snapshots = {}
+
+    n_rows = len(panel["dates"])
+    bars = n_rows - indicators["first"]
+
+    ok = ~np.isnan(indicators["dma_50"]) & ~np.isnan(indicators["rsi"])
+    rows = np.arange(n_rows)[:, None]
+    last_ok = np.where(ok, rows, -1).max(axis=0)
+
+    date_idx = np.take_along_axis(
+        np.broadcast_to(rows, indicators["order"].shape),
+        indicators["order"],
+        axis=0,
+    )
+
+    for j, symbol in enumerate(panel["symbols"]):
+        if bars[j] < MIN_ROWS_REQUIRED:
+            errors[symbol] = (
+                f"Not enough data rows ({bars[j]}). "
+                f"Minimum required: {MIN_ROWS_REQUIRED}"
+            )
+            continue
+
+        i = last_ok[j]
+        if i < 0:
+            errors[symbol] = "Indicators could not be computed"
+            continue
+
+        snapshots[symbol] = {
+            "symbol": symbol,
+            "close": float(indicators["close"][i, j]),
+            "dma_20": float(indicators["dma_20"][i, j]),
+            "dma_50": float(indicators["dma_50"][i, j]),
+            "rsi": float(indicators["rsi"][i, j]),
+            "volume": int(indicators["volume"][i, j]),
+            "avg_volume": int(indicators["avg_volume"][i, j]),
+            "latest_date": str(panel["dates"][date_idx[i, j]]),
+        }
+
+    return snapshots, errors
+
+
+def load_universe_snapshots(symbols, data_dir="data"):
+    """
+    One-call helper: build panel → indicators → snapshots.
+    """
+    return latest_snapshots(build_panel(symbols, data_dir=data_dir))